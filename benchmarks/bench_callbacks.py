@@ -0,0 +1,66 @@
+"""Compare Qt signal dispatch with direct python callbacks.
+
+For each installed binding (PyQt5, PyQt6, PySide2, PySide6), time delivering
+a value to one python listener on a QDoubleSlider (float) and a
+QDoubleRangeSlider (tuple), either through `valueChanged` or through a
+callback added with `addValueCallback`.
+
+    python benchmarks/bench_callbacks.py           # all installed bindings
+    QT_API=pyside2 python benchmarks/bench_callbacks.py --single
+"""
+import os
+import subprocess
+import sys
+import timeit
+from importlib.util import find_spec
+
+N = 100000
+REPEAT = 5
+APIS = {"pyqt5": "PyQt5", "pyqt6": "PyQt6", "pyside2": "PySide2", "pyside6": "PySide6"}
+
+
+def _per_call(func, values):
+    def _loop():
+        for v in values:
+            func(v)
+
+    return min(timeit.repeat(_loop, number=1, repeat=REPEAT)) / len(values) * 1e6
+
+
+def _run_single():
+    from qtrangeslider import QDoubleRangeSlider, QDoubleSlider
+    from qtrangeslider.qtcompat import API_NAME
+    from qtrangeslider.qtcompat.QtWidgets import QApplication
+
+    app = QApplication([])  # noqa
+
+    def listener(value):
+        pass
+
+    print(f"{API_NAME}: µs per dispatch to one listener (best of {REPEAT})")
+    for cls, values in (
+        (QDoubleSlider, [i * 0.5 for i in range(N)]),
+        (QDoubleRangeSlider, [(i, i + 50) for i in range(N)]),
+    ):
+        sld = cls()
+        sld.valueChanged.connect(listener)
+        sld.addValueCallback(listener)
+        signal = _per_call(sld.valueChanged.emit, values)
+        callback = _per_call(sld._value_callbacks, values)
+        print(
+            f"  {cls.__name__:20} signal: {signal:5.2f}  callback: {callback:5.2f}"
+            f"  ({signal / callback:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    if "--single" in sys.argv:
+        _run_single()
+        sys.exit()
+
+    for api, module in APIS.items():
+        if find_spec(module) is None:
+            print(f"{module} not installed, skipping")
+            continue
+        env = dict(os.environ, QT_API=api, FORCE_QT_API="1")
+        subprocess.run([sys.executable, __file__, "--single"], env=env, check=False)
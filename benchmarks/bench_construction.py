@@ -0,0 +1,60 @@
+"""Time construction of many sliders, as when building a large settings form.
+
+Labels, layouts and stylesheet parsing are deferred until a slider is first
+shown (or asked for its size), so construction should stay cheap.
+
+    python benchmarks/bench_construction.py [N]
+"""
+import sys
+import timeit
+
+from qtrangeslider import (
+    QDoubleRangeSlider,
+    QLabeledDoubleRangeSlider,
+    QLabeledDoubleSlider,
+    QLabeledRangeSlider,
+    QLabeledSlider,
+    QRangeSlider,
+)
+from qtrangeslider.qtcompat import API_NAME
+from qtrangeslider.qtcompat.QtCore import Qt
+from qtrangeslider.qtcompat.QtWidgets import QApplication, QSlider, QVBoxLayout, QWidget
+
+N = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+REPEAT = 5
+
+app = QApplication([])
+
+CLASSES = [
+    QSlider,
+    QRangeSlider,
+    QDoubleRangeSlider,
+    QLabeledSlider,
+    QLabeledDoubleSlider,
+    QLabeledRangeSlider,
+    QLabeledDoubleRangeSlider,
+]
+
+
+def build_form(cls):
+    form = QWidget()
+    layout = QVBoxLayout(form)
+    for _ in range(N):
+        layout.addWidget(cls(Qt.Horizontal))
+    return form
+
+
+def show_form(cls):
+    form = build_form(cls)
+    form.show()
+    app.processEvents()
+    form.close()
+    form.deleteLater()
+
+
+print(f"{API_NAME}: best of {REPEAT}, {N} sliders per form")
+print(f"{'':28}{'construct':>12}{'construct+show':>16}")
+for cls in CLASSES:
+    build = min(timeit.repeat(lambda: build_form(cls), number=1, repeat=REPEAT))
+    show = min(timeit.repeat(lambda: show_form(cls), number=1, repeat=REPEAT))
+    print(f"{cls.__name__:28}{build * 1000:10.1f}ms{show * 1000:14.1f}ms")
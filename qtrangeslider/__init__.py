@@ -3,20 +3,62 @@ try:
 except ImportError:
     __version__ = "unknown"
 
+from ._categorical_slider import (
+    QCategoricalRangeSlider,
+    QLabeledCategoricalRangeSlider,
+)
+from ._constraints import HandleConstraints
+from ._datetime_slider import QDatetimeRangeSlider
+from ._interval_slider import QIntervalSlider
+from ._intervals import IntervalSet
 from ._labeled import (
     QLabeledDoubleRangeSlider,
     QLabeledDoubleSlider,
     QLabeledRangeSlider,
     QLabeledSlider,
 )
-from ._sliders import QDoubleRangeSlider, QDoubleSlider, QRangeSlider
+from ._scales import (
+    FunctionScale,
+    LinearScale,
+    LogScale,
+    PiecewiseLinearScale,
+    PowerScale,
+    QuantileScale,
+    Scale,
+    SymLogScale,
+)
+from ._sketch import KLLSketch
+from ._sliders import (
+    QDoubleRangeSlider,
+    QDoubleSlider,
+    QInt64RangeSlider,
+    QInt64Slider,
+    QRangeSlider,
+)
 
 __all__ = [
+    "FunctionScale",
+    "HandleConstraints",
+    "IntervalSet",
+    "KLLSketch",
+    "LinearScale",
+    "LogScale",
+    "PiecewiseLinearScale",
+    "PowerScale",
+    "QCategoricalRangeSlider",
+    "QDatetimeRangeSlider",
     "QDoubleRangeSlider",
     "QDoubleSlider",
+    "QInt64RangeSlider",
+    "QInt64Slider",
+    "QIntervalSlider",
+    "QLabeledCategoricalRangeSlider",
     "QLabeledDoubleRangeSlider",
     "QLabeledDoubleSlider",
     "QLabeledRangeSlider",
     "QLabeledSlider",
     "QRangeSlider",
+    "QuantileScale",
+    "Scale",
+    "SymLogScale",
 ]
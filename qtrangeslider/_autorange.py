@@ -0,0 +1,75 @@
+"""Estimating the range (and handle values) of large arrays, off the GUI thread."""
+import math
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from ._histogram import _flat_chunks, _strided
+
+# elements reduced between checks for cancellation, when refining
+_CHUNK = 1 << 22
+
+
+def estimate_range(
+    data,
+    percentiles: Sequence[float] = (),
+    max_samples: Optional[int] = 1_000_000,
+    refine: bool = False,
+    check: Callable[[], None] = lambda: None,
+) -> Optional[Tuple[float, float, List[float]]]:
+    """(min, max, percentiles) of the finite values in `data`, or None.
+
+    Only `max_samples` evenly strided elements are read, so memory-mapped
+    arrays are mostly left on disk.  With `refine`, the min and max are then
+    made exact by reducing the full array in chunks (the percentiles are
+    still those of the sample).  `check()` is called between chunks, and
+    may raise to abandon the computation.
+    """
+    if hasattr(data, "dtype") and hasattr(data, "shape"):
+        return _estimate_numpy(data, percentiles, max_samples, refine, check)
+
+    step = max(1, math.ceil(len(data) / max_samples)) if max_samples else 1
+    sample = sorted(v for v in data[::step] if v == v and abs(v) != math.inf)
+    check()
+    if not sample:
+        return None
+    return sample[0], sample[-1], [_percentile(sample, p) for p in percentiles]
+
+
+def _estimate_numpy(data, percentiles, max_samples, refine, check):
+    import numpy as np
+
+    arr = np.asarray(data)
+    step = max(1, math.ceil(arr.size / max_samples)) if max_samples else 1
+    check()
+    # only the (small) sample is copied, even if `arr` isn't contiguous
+    sample = _finite(_strided(arr, step)[0].reshape(-1))
+    check()
+    if not sample.size:
+        return None
+    lo, hi = sample.min(), sample.max()
+    values = np.percentile(sample, list(percentiles)).tolist() if percentiles else []
+    if refine and step > 1:
+        for chunk in _flat_chunks(arr, _CHUNK):
+            check()
+            chunk = _finite(chunk)
+            if chunk.size:
+                lo, hi = min(lo, chunk.min()), max(hi, chunk.max())
+    return lo.item(), hi.item(), values
+
+
+def _finite(arr):
+    import numpy as np
+
+    kind = arr.dtype.kind
+    if kind == "f":
+        return arr[np.isfinite(arr)]
+    if kind in "Mm":  # as integer nanoseconds, like QDatetimeRangeSlider
+        return arr[~np.isnat(arr)].astype(f"{kind}8[ns]").view("int64")
+    return arr
+
+
+def _percentile(sorted_values: List[float], p: float) -> float:
+    # linear interpolation between closest ranks, as numpy.percentile
+    pos = (len(sorted_values) - 1) * p / 100
+    i = int(pos)
+    j = min(i + 1, len(sorted_values) - 1)
+    return sorted_values[i] + (sorted_values[j] - sorted_values[i]) * (pos - i)
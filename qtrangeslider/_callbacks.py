@@ -0,0 +1,83 @@
+"""Plain python callbacks, called directly instead of through Qt signals.
+
+Emitting a Qt signal from python converts the arguments to and from C++
+(e.g. boxing a tuple into a `PyQt_PyObject`), which is measurable in tight
+loops.  `CallbackList` calls python listeners directly.
+"""
+import weakref
+from inspect import ismethod
+from typing import Any, Callable, List
+
+_UNSET = object()
+
+
+class _Listener:
+    __slots__ = ("ref", "weak", "dedupe", "last")
+
+    def __init__(self, callback: Callable, weak: bool, dedupe: bool) -> None:
+        if not weak:
+            self.ref = callback
+        elif ismethod(callback):
+            self.ref = weakref.WeakMethod(callback)
+        else:
+            self.ref = weakref.ref(callback)
+        self.weak = weak
+        self.dedupe = dedupe
+        self.last: Any = _UNSET
+
+    def callback(self):
+        return self.ref() if self.weak else self.ref
+
+
+class CallbackList:
+    """Ordered list of callbacks, each called with a single value."""
+
+    __slots__ = ("_listeners",)
+
+    def __init__(self) -> None:
+        self._listeners: List[_Listener] = []
+
+    def __bool__(self) -> bool:
+        return bool(self._listeners)
+
+    def __len__(self) -> int:
+        return len(self._listeners)
+
+    def add(self, callback: Callable, weak: bool = False, dedupe: bool = False):
+        """Add `callback`.
+
+        If `weak` is True, only a weak reference to the callback is kept (and
+        to the instance, for bound methods), and it is removed once garbage
+        collected.  If `dedupe` is True, the callback is only called when the
+        value differs from the last value it was called with.
+        """
+        if not callable(callback):
+            raise TypeError(f"callback must be callable, not {type(callback)}")
+        self._listeners.append(_Listener(callback, weak, dedupe))
+
+    def remove(self, callback: Callable) -> None:
+        """Remove `callback`.  Raises ValueError if it was never added."""
+        for i, listener in enumerate(self._listeners):
+            if listener.callback() == callback:
+                del self._listeners[i]
+                return
+        raise ValueError(f"callback {callback!r} is not connected")
+
+    def clear(self) -> None:
+        self._listeners.clear()
+
+    def __call__(self, value) -> None:
+        dead = False
+        # iterate over a copy: callbacks may add or remove callbacks
+        for listener in tuple(self._listeners):
+            cb = listener.ref() if listener.weak else listener.ref
+            if cb is None:
+                dead = True
+                continue
+            if listener.dedupe:
+                if listener.last == value:
+                    continue
+                listener.last = value
+            cb(value)
+        if dead:
+            self._listeners = [x for x in self._listeners if x.callback() is not None]
@@ -0,0 +1,275 @@
+"""Range slider over an ordered list of categories (e.g. gene names, dates)."""
+import math
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from ._generic_slider import CC_SLIDER, SC_HANDLE
+from ._labeled import QLabeledRangeSlider, SliderLabel, _text_width
+from ._sliders import QRangeSlider
+from ._ticks import nice
+from .qtcompat.QtCore import QRectF, QSize, Qt
+from .qtcompat.QtGui import QFontMetrics, QPainter, QPalette, QValidator
+
+# labels measured to estimate the width of all labels
+_SAMPLE = 32
+# minimum gap between tick labels, in pixels
+_SPACING = 8
+
+
+def decimate(
+    first: int,
+    last: int,
+    length: float,
+    extent: Callable[[int], float],
+    spacing: float = _SPACING,
+) -> List[int]:
+    """Indices from `first` to `last` whose labels fit along `length` pixels.
+
+    Labels are taken at a regular "nice" stride (1, 2, 5, 10...), aligned on
+    its multiples so they don't jump around when zooming or panning.
+    `extent(i)` is the size of label `i` along the slider: it is only called
+    for a sample of labels and for the labels returned (plus a few), never
+    for all of them.
+    """
+    n = last - first + 1
+    if n <= 0 or length <= 0:
+        return []
+    pitch = length / max(n - 1, 1)  # pixels between neighboring categories
+    step = max(1, n // _SAMPLE)
+    widest = max(extent(i) for i in range(first, last + 1, step)) + spacing
+    stride = nice(max(1, math.ceil(widest / pitch)))
+    while True:
+        start = -(-first // stride) * stride
+        picked = list(range(start, last + 1, stride))
+        gap = stride * pitch
+        ext = [extent(i) for i in picked]
+        if all((a + b) / 2 + spacing <= gap for a, b in zip(ext, ext[1:])):
+            return picked
+        stride = nice(stride + 1)
+
+
+class QCategoricalRangeSlider(QRangeSlider):
+    """Range slider whose integer positions index an ordered list of categories.
+
+    Category names are shown along the groove, decimated to fit: only a
+    sample of names (and those actually drawn) are converted to text and
+    measured, with widths cached, so tens of thousands of categories are
+    fine.  `categoryValue()` gives the categories at the handles.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._categories: Sequence = ()
+        # category -> index, and text -> index: built on first lookup
+        self._category_index: Optional[dict] = None
+        self._text_index: Optional[dict] = None
+        self._show_labels = True
+        # positions and texts of the tick labels, for the geometry they're for
+        self._tick_label_cache: Optional[Tuple[tuple, list]] = None
+
+    # ###############  New Public API  #######################
+
+    def categories(self) -> Sequence:
+        """The categories, in slider order."""
+        return self._categories
+
+    def setCategories(self, categories: Sequence) -> None:
+        """Set the categories, and select all of them.
+
+        The range becomes 0 to `len(categories) - 1`.
+        """
+        self._categories = categories
+        self._category_index = self._text_index = None
+        self._tick_label_cache = None
+        last = max(len(categories) - 1, 0)
+        self.setRange(0, last)
+        self.setValue((0, last))
+        self.updateGeometry()
+        self.update()
+
+    def categoryText(self, index: int) -> str:
+        """Text shown for the category at `index`."""
+        if 0 <= index < len(self._categories):
+            return str(self._categories[index])
+        return ""
+
+    def indexOf(self, category) -> int:
+        """Position of `category` (or of its text) on the slider, or -1."""
+        if self._category_index is None:
+            index = {}
+            for i, c in enumerate(self._categories):
+                index.setdefault(c, i)
+            self._category_index = index
+        i = self._category_index.get(category)
+        if i is None and isinstance(category, str):
+            if self._text_index is None:
+                index = {}
+                for i, c in enumerate(self._categories):
+                    index.setdefault(str(c), i)
+                self._text_index = index
+            i = self._text_index.get(category)
+        return -1 if i is None else i
+
+    def categoryValue(self) -> tuple:
+        """The categories at the handles (empty without categories)."""
+        if not len(self._categories):
+            return ()
+        return tuple(self._categories[int(v)] for v in self._value)
+
+    def setCategoryValue(self, categories: Sequence) -> None:
+        """Move the handles to the given categories."""
+        indices = [self.indexOf(c) for c in categories]
+        if -1 in indices:
+            missing = categories[indices.index(-1)]
+            raise ValueError(f"{missing!r} is not one of the categories")
+        self.setValue(indices)
+
+    def categoryLabelsVisible(self) -> bool:
+        """Whether category names are shown along the groove."""
+        return self._show_labels
+
+    def setCategoryLabelsVisible(self, val: bool = True) -> None:
+        """Whether to show category names along the groove."""
+        self._show_labels = bool(val)
+        self.updateGeometry()
+        self.update()
+
+    # ###############  QtOverrides  #######################
+
+    def sizeHint(self) -> QSize:
+        return self._withLabelSpace(super().sizeHint())
+
+    def minimumSizeHint(self) -> QSize:
+        return self._withLabelSpace(super().minimumSizeHint())
+
+    def paintEvent(self, ev) -> None:
+        super().paintEvent(ev)
+        if self._show_labels and len(self._categories):
+            self._drawTickLabels()
+
+    # ###############  Implementation Details  #######################
+
+    def _sampleIndices(self) -> range:
+        """A sample of categories, to estimate the width of their names."""
+        n = len(self._categories)
+        return range(0, n, max(1, n // _SAMPLE))
+
+    def _textWidth(self, index: int) -> int:
+        font = self.font()
+        return _text_width(QFontMetrics(font), font, self.categoryText(index))
+
+    def _withLabelSpace(self, size: QSize) -> QSize:
+        if not (self._show_labels and len(self._categories)):
+            return size
+        fm = QFontMetrics(self.font())
+        if self.orientation() == Qt.Horizontal:
+            # labels go below the handles, which are centered
+            return QSize(size.width(), size.height() + 2 * (fm.height() + 2))
+        widest = max(self._textWidth(i) for i in self._sampleIndices())
+        return QSize(size.width() + 2 * (widest + 4), size.height())
+
+    def _tickLabels(self, opt) -> list:
+        """(rect, text) of the labels to draw (cached per geometry)."""
+        rect = self._travelRect(opt)
+        lo, hi = self._viewRange()
+        key = (
+            rect,
+            opt.orientation,
+            opt.upsideDown,
+            lo,
+            hi,
+            self.font().key(),
+            len(self._categories),
+        )
+        if self._tick_label_cache is not None and self._tick_label_cache[0] == key:
+            return self._tick_label_cache[1]
+
+        fm = QFontMetrics(self.font())
+        sr = self.style().subControlRect(CC_SLIDER, opt, SC_HANDLE, self)
+        horizontal = opt.orientation == Qt.Horizontal
+        if horizontal:
+            start, length = rect.x(), rect.width()
+            extent: Callable[[int], float] = self._textWidth
+        else:
+            start, length = rect.y(), rect.height()
+            height = fm.height()
+            extent = lambda i: height  # noqa: E731
+
+        first = max(int(math.ceil(lo)), 0)
+        last = min(int(math.floor(hi)), len(self._categories) - 1)
+        labels = []
+        for i in decimate(first, last, length, extent):
+            frac = self._valueToFraction(i)
+            p = start + (1 - frac if opt.upsideDown else frac) * length
+            text = self.categoryText(i)
+            if horizontal:
+                w = self._textWidth(i)
+                x = min(max(p - w / 2, 0), self.width() - w)
+                r = QRectF(x, sr.bottom() + 2, w, fm.height())
+            else:
+                y = min(max(p - height / 2, 0), self.height() - height)
+                r = QRectF(sr.right() + 4, y, self.width() - sr.right() - 4, height)
+            labels.append((r, text))
+        self._tick_label_cache = (key, labels)
+        return labels
+
+    def _drawTickLabels(self) -> None:
+        opt = self._styleOption
+        painter = QPainter(self)
+        painter.setPen(self.palette().color(QPalette.WindowText))
+        align = Qt.AlignLeft | Qt.AlignVCenter
+        for rect, text in self._tickLabels(opt):
+            painter.drawText(rect, align, text)
+        painter.end()
+
+
+class _CategoryLabel(SliderLabel):
+    """Spin box label showing (and accepting) category names."""
+
+    def textFromValue(self, value: float) -> str:
+        return self._slider.categoryText(int(round(value)))
+
+    def valueFromText(self, text: str) -> float:
+        index = self._slider.indexOf(text.strip())
+        return float(index) if index >= 0 else self.value()
+
+    def validate(self, input: str, pos: int):
+        if self._slider.indexOf(input.strip()) >= 0:
+            return QValidator.Acceptable, input, pos
+        return QValidator.Intermediate, input, pos
+
+    def _extremeTexts(self) -> tuple:
+        # names vary in length: the first and last aren't enough
+        slider = self._slider
+        last = len(slider.categories()) - 1
+        indices = {*slider._sampleIndices(), last} if last >= 0 else ()
+        return tuple(slider.categoryText(i) for i in sorted(indices))
+
+    def _sizeKey(self) -> tuple:
+        return super()._sizeKey() + self._extremeTexts()
+
+
+class QLabeledCategoricalRangeSlider(QLabeledRangeSlider):
+    """Labeled range slider whose edge and handle labels show category names."""
+
+    _slider_class = QCategoricalRangeSlider
+    _slider: QCategoricalRangeSlider
+
+    def categories(self) -> Sequence:
+        return self._slider.categories()
+
+    def setCategories(self, categories: Sequence) -> None:
+        self._slider.setCategories(categories)
+        # the range may not have changed, but the names have
+        labels = [self._min_label, self._max_label, *self._handle_labels]
+        for label in filter(None, labels):
+            label._update_size()
+            label.lineEdit().setText(label.textFromValue(label.value()))
+
+    def categoryValue(self) -> tuple:
+        return self._slider.categoryValue()
+
+    def setCategoryValue(self, categories: Sequence) -> None:
+        self._slider.setCategoryValue(categories)
+
+    def _makeLabel(self, *args, **kwargs) -> SliderLabel:
+        return _CategoryLabel(self._slider, *args, **kwargs)
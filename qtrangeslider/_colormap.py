@@ -0,0 +1,82 @@
+"""Colormap lookup tables, as images that QPainter stretches over the bar."""
+from typing import List, Optional, Tuple
+
+from .qtcompat.QtGui import QColor, QImage
+
+
+def lut_bytes(lut) -> Tuple[bytes, int]:
+    """RGBA8888 bytes for a lookup table, and its number of entries.
+
+    `lut` may be an (N, 3) or (N, 4) numpy array, of floats in [0, 1] or of
+    integers in [0, 255], or a sequence of anything `QColor` accepts (or of
+    (r, g, b[, a]) tuples of integers in [0, 255]).
+    """
+    if hasattr(lut, "dtype") and hasattr(lut, "shape"):
+        import numpy as np
+
+        arr = np.asarray(lut)
+        if arr.ndim != 2 or arr.shape[1] not in (3, 4) or not len(arr):
+            raise ValueError(f"LUT must have shape (N, 3) or (N, 4), not {arr.shape}")
+        if arr.dtype.kind == "f":
+            arr = np.rint(np.clip(arr, 0, 1) * 255)
+        rgba = np.full((len(arr), 4), 255, dtype=np.uint8)
+        rgba[:, : arr.shape[1]] = np.clip(arr, 0, 255)
+        return rgba.tobytes(), len(rgba)
+
+    out = bytearray()
+    for entry in lut:
+        color = lut_color(entry)
+        out += bytes((color.red(), color.green(), color.blue(), color.alpha()))
+    if not out:
+        raise ValueError("LUT must not be empty")
+    return bytes(out), len(out) // 4
+
+
+def colors(entries) -> List[Optional[QColor]]:
+    """A list of colors (or None) from a LUT array, or a sequence of colors.
+
+    Arrays are read as by `lut_bytes`; sequences may contain None.
+    """
+    if hasattr(entries, "dtype") and hasattr(entries, "shape"):
+        data, n = lut_bytes(entries)
+        return [QColor(*data[4 * i : 4 * i + 4]) for i in range(n)]
+    return [None if e is None else lut_color(e) for e in entries]
+
+
+def lut_color(entry) -> QColor:
+    """A color from anything `QColor` accepts, or an (r, g, b[, a]) tuple."""
+    color = QColor(*entry) if isinstance(entry, (tuple, list)) else QColor(entry)
+    if not color.isValid():
+        raise ValueError(f"invalid LUT color: {entry!r}")
+    return color
+
+
+class Colormap:
+    """A lookup table, with its image for each orientation/direction.
+
+    Each image has one pixel per LUT entry (along the slider's axis): it is
+    built once, and stretched between the handles by the painter, so moving
+    the handles doesn't rebuild it.
+    """
+
+    def __init__(self, lut) -> None:
+        # the images share these bytes
+        self._data, self.size = lut_bytes(lut)
+        self._image: Optional[Tuple[tuple, QImage]] = None
+
+    def first(self) -> QColor:
+        return QColor(*self._data[:4])
+
+    def last(self) -> QColor:
+        return QColor(*self._data[-4:])
+
+    def image(self, vertical: bool, reverse: bool) -> QImage:
+        """The LUT as a 1-pixel thick image along the given direction."""
+        key = (vertical, reverse)
+        if self._image is None or self._image[0] != key:
+            n = self.size
+            w, h, stride = (1, n, 4) if vertical else (n, 1, 4 * n)
+            image = QImage(self._data, w, h, stride, QImage.Format_RGBA8888)
+            image = image.mirrored(not vertical and reverse, vertical and reverse)
+            self._image = (key, image)
+        return self._image[1]
@@ -0,0 +1,231 @@
+"""Constraints on handle positions for multi-handle sliders.
+
+All solvers below are linear in the number of handles: the feasible range of
+every handle is found with one forward and one backward sweep ("envelopes"),
+and a dragged handle only sweeps outward for as long as it keeps pushing (or
+pulling) its neighbors.
+"""
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple, Union
+
+_INF = float("inf")
+
+Gap = Union[float, Sequence[Optional[float]], None]
+
+
+@dataclass
+class HandleConstraints:
+    """Constraints applied to the handles of a `QRangeSlider`.
+
+    Parameters
+    ----------
+    min_gap : float or sequence of float, optional
+        Minimum distance between neighboring handles, either for all pairs or
+        one per pair (length ``n_handles - 1``). By default, `singleStep()`.
+    max_gap : float or sequence of float, optional
+        Maximum distance between neighboring handles. By default, unlimited.
+    bounds : sequence of (low, high), optional
+        Per-handle range, further restricting the slider range. Either bound may
+        be None.
+    groups : sequence of (first, last)
+        Inclusive ranges of handle indices that move together, keeping their
+        spacing, when any of them is dragged or pushed, or set (a group then
+        follows the member set furthest from its current position).
+    push : bool
+        Whether dragging a handle pushes (and, with `max_gap`, pulls) its
+        neighbors along rather than stopping at them. Default is False.
+    """
+
+    min_gap: Gap = None
+    max_gap: Gap = None
+    bounds: Optional[Sequence[Tuple[Optional[float], Optional[float]]]] = None
+    groups: Sequence[Tuple[int, int]] = ()
+    push: bool = False
+
+    def __post_init__(self):
+        n = max(_length(self.min_gap), _length(self.max_gap))
+        pairs = zip(_expand(self.min_gap, n, 0), _expand(self.max_gap, n, _INF))
+        for i, (gmin, gmax) in enumerate(pairs):
+            if gmin > gmax:
+                raise ValueError(f"min_gap {gmin} exceeds max_gap {gmax} (pair {i})")
+        last = -1
+        for first, stop in sorted(self.groups):
+            if first > stop or first <= last:
+                raise ValueError(f"invalid or overlapping handle group {(first, stop)}")
+            last = stop
+
+
+class _Problem:
+    """Per-handle bounds and per-pair gaps for `n` handles."""
+
+    def __init__(
+        self, c: HandleConstraints, n: int, lo: float, hi: float, default_gap: float
+    ):
+        self.n = n
+        self.gmin = _expand(c.min_gap, n - 1, default_gap)
+        self.gmax = _expand(c.max_gap, n - 1, _INF)
+        self.lo = [lo] * n
+        self.hi = [hi] * n
+        for i, (b0, b1) in enumerate((c.bounds or ())[:n]):
+            if b0 is not None:
+                self.lo[i] = max(lo, b0)
+            if b1 is not None:
+                self.hi[i] = min(hi, b1)
+        # group[i] -> (first, last) for grouped handles
+        self.group: List[Optional[Tuple[int, int]]] = [None] * n
+        for first, last in c.groups:
+            last = min(last, n - 1)
+            for i in range(first, last + 1):
+                self.group[i] = (first, last)
+
+    def gaps(self, pos: Optional[List[float]] = None):
+        """Minimum and maximum gap of each pair (fixed within groups at `pos`)."""
+        gmin, gmax = list(self.gmin), list(self.gmax)
+        if pos is not None:
+            for i in range(self.n - 1):
+                if self.group[i] is not None and self.group[i] == self.group[i + 1]:
+                    gmin[i] = gmax[i] = pos[i + 1] - pos[i]
+        return gmin, gmax
+
+    def envelopes(self, pos: Optional[List[float]] = None):
+        """Lowest (L) and highest (U) feasible position of each handle.
+
+        If `pos` is given, handles within a group are held at their current
+        spacing (instead of min_gap/max_gap).
+        """
+        n = self.n
+        gmin, gmax = self.gaps(pos)
+        L, U = list(self.lo), list(self.hi)
+        for i in range(1, n):  # forward
+            L[i] = max(L[i], L[i - 1] + gmin[i - 1])
+            U[i] = min(U[i], U[i - 1] + gmax[i - 1])
+        for i in range(n - 2, -1, -1):  # backward
+            U[i] = min(U[i], U[i + 1] - gmin[i])
+            L[i] = max(L[i], L[i + 1] - gmax[i])
+        return L, U
+
+
+def _length(val: Gap) -> int:
+    return 1 if val is None or isinstance(val, (int, float)) else len(val)
+
+
+def _expand(val: Gap, n: int, default: float) -> List[float]:
+    if val is None:
+        return [default] * n
+    if isinstance(val, (int, float)):
+        return [float(val)] * n
+    out = [default if v is None else float(v) for v in list(val)[:n]]
+    return out + [default] * (n - len(out))
+
+
+def _clip(val, low, high):
+    return high if val > high else low if val < low else val
+
+
+def project(
+    positions: Sequence[float],
+    c: HandleConstraints,
+    lo: float,
+    hi: float,
+    default_gap: float,
+    current: Optional[Sequence[float]] = None,
+) -> List[float]:
+    """Return `positions` adjusted to satisfy bounds and gaps in `c`.
+
+    Given the `current` positions of the handles, groups keep their current
+    spacing: each group is first shifted along with the member that moved
+    furthest.  Then comes a greedy clip, in a single forward pass: each
+    handle is clipped to its envelope of feasible positions and to the gaps
+    from the (already adjusted) handle before it.  Handles may move further
+    than strictly needed.
+    """
+    n = len(positions)
+    if not n:
+        return []
+    prob = _Problem(c, n, lo, hi, default_gap)
+    rigid = current is not None and len(current) == n and bool(c.groups)
+    if rigid:
+        positions = list(positions)
+        for first, last in set(filter(None, prob.group)):
+            members = range(first, last + 1)
+            delta = max((positions[j] - current[j] for j in members), key=abs)
+            for j in members:
+                positions[j] = current[j] + delta
+    spacing = list(current) if rigid else None
+    L, U = prob.envelopes(spacing)
+    gmin, gmax = prob.gaps(spacing)
+    out = [_clip(positions[0], L[0], U[0])]
+    for i in range(1, n):
+        prev = out[-1]
+        low = max(L[i], prev + gmin[i - 1])
+        high = min(U[i], prev + gmax[i - 1])
+        out.append(_clip(positions[i], low, high))
+    return out
+
+
+def drag(
+    positions: Sequence[float],
+    index: int,
+    value: float,
+    c: HandleConstraints,
+    lo: float,
+    hi: float,
+    default_gap: float,
+) -> List[float]:
+    """Return new positions after moving handle `index` toward `value`.
+
+    Any group containing `index` moves rigidly.  If `c.push` is False, the
+    neighbors of the moving handle (or group) stay put and limit its movement;
+    otherwise they are pushed/pulled along as far as constraints allow.
+    """
+    pos = list(positions)
+    n = len(pos)
+    prob = _Problem(c, n, lo, hi, default_gap)
+    first, last = prob.group[index] or (index, index)
+
+    # limits on how far the moving unit may shift
+    if c.push:
+        L, U = prob.envelopes(pos)
+        d_lo = max(L[j] - pos[j] for j in range(first, last + 1))
+        d_hi = min(U[j] - pos[j] for j in range(first, last + 1))
+    else:
+        d_lo = max(prob.lo[j] - pos[j] for j in range(first, last + 1))
+        d_hi = min(prob.hi[j] - pos[j] for j in range(first, last + 1))
+        if first > 0:
+            left = pos[first - 1] - pos[first]
+            d_lo = max(d_lo, left + prob.gmin[first - 1])
+            d_hi = min(d_hi, left + prob.gmax[first - 1])
+        if last < n - 1:
+            right = pos[last + 1] - pos[last]
+            d_hi = min(d_hi, right - prob.gmin[last])
+            d_lo = max(d_lo, right - prob.gmax[last])
+    delta = _clip(value - pos[index], d_lo, d_hi)
+    for j in range(first, last + 1):
+        pos[j] += delta
+    if not c.push:
+        return pos
+
+    # push/pull neighbors to the right, then to the left
+    i = last + 1
+    while i < n:
+        new = _clip(
+            pos[i], pos[i - 1] + prob.gmin[i - 1], pos[i - 1] + prob.gmax[i - 1]
+        )
+        shift = new - pos[i]
+        if not shift:
+            break
+        g_last = (prob.group[i] or (i, i))[1]
+        for j in range(i, g_last + 1):
+            pos[j] += shift
+        i = g_last + 1
+    i = first - 1
+    while i >= 0:
+        new = _clip(pos[i], pos[i + 1] - prob.gmax[i], pos[i + 1] - prob.gmin[i])
+        shift = new - pos[i]
+        if not shift:
+            break
+        g_first = (prob.group[i] or (i, i))[0]
+        for j in range(g_first, i + 1):
+            pos[j] += shift
+        i = g_first - 1
+    return pos
@@ -1,7 +1,26 @@
-from typing import Generic, List, Sequence, Tuple, TypeVar, Union
+from typing import (
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
-from ._generic_slider import CC_SLIDER, SC_GROOVE, SC_HANDLE, SC_NONE, _GenericSlider
+from ._colormap import Colormap, colors
+from ._constraints import HandleConstraints, drag, project
+from ._generic_slider import (
+    CC_SLIDER,
+    SC_GROOVE,
+    SC_HANDLE,
+    SC_NONE,
+    _event_positionF,
+    _GenericSlider,
+)
 from ._range_style import RangeSliderStyle, update_styles_from_stylesheet
+from ._selection import SortedData
 from .qtcompat import QtGui
 from .qtcompat.QtCore import (
     Property,
@@ -39,6 +58,18 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
     # The value is the positions of *all* handles.
     sliderMoved = Signal(tuple)
 
+    # Emitted (after valueChanged) for each handle whose value has changed,
+    # with the handle index and its new value
+    handleValueChanged = Signal(int, object)
+
+    # Emitted once (after valueChanged) with the indices of all handles
+    # whose value has changed
+    valuesChanged = Signal(tuple)
+
+    # Emitted when the handles move over bound data (see setSelectionData),
+    # with the number of items in each segment between handles, and in all
+    selectionCountsChanged = Signal(tuple, int)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -59,12 +90,31 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
         # whether clicking on the bar moves all handles, or just the nearest handle
         self._bar_moves_all = True
         self._should_draw_bar = True
+        # optional constraints on handle positions (see setHandleConstraints)
+        self._constraints: Optional[HandleConstraints] = None
 
         # color
 
+        # lookup table painted along the bar (see setBarColormap)
+        self._colormap: Optional[Colormap] = None
+        self._colormap_groove = False
+        # colors of the segments between handles (see setSegmentColors), and
+        # the segment rects grouped by color, for the geometry they are for
+        self._segment_colors: Optional[List[Optional[QtGui.QColor]]] = None
+        self._segment_cache: Optional[tuple] = None
+
+        # sorted datasets counted between the handles (see setSelectionData),
+        # the positions last counted and their counts, and whether to show them
+        self._selection_data: Optional[SortedData] = None
+        self._selection_counts: Optional[Tuple[tuple, tuple]] = None
+        self._selection_badge = False
+
         self._style = RangeSliderStyle()
-        self.setStyleSheet("")
-        update_styles_from_stylesheet(self)
+        # the sub-page stylesheet override is applied when polished, and the
+        # (parent) stylesheets are parsed when painting: both are costly and
+        # not needed for sliders that are never shown.
+        self._has_qss_override = False
+        self._style_dirty = True
 
     # ###############  New Public API  #######################
 
@@ -90,6 +140,42 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
         """Whether clicking on the bar moves all handles (default), or just the nearest."""
         self._bar_moves_all = bool(val)
 
+    def barColormap(self) -> Optional[Colormap]:
+        """The colormap painted along the bar, or None."""
+        return self._colormap
+
+    def setBarColormap(self, lut, fill_groove: bool = False) -> None:
+        """Paint the bar with a lookup table, stretched between the handles.
+
+        `lut` is an (N, 3) or (N, 4) array of RGB(A) entries (floats in [0, 1]
+        or integers in [0, 255]), or a sequence of colors; None restores the
+        bar color.  If `fill_groove` is True, the groove beyond the outer
+        handles is painted with the first and last entries, as for the
+        contrast limits of an image.
+        """
+        self._colormap = Colormap(lut) if lut is not None else None
+        self._colormap_groove = bool(fill_groove)
+        self.update()
+
+    def segmentColors(self) -> Optional[List[Optional[QtGui.QColor]]]:
+        """Colors of the segments between handles, or None."""
+        return list(self._segment_colors) if self._segment_colors else None
+
+    def setSegmentColors(self, segment_colors) -> None:
+        """Color each segment between neighboring handles separately.
+
+        `segment_colors` is a sequence of colors (or None, to leave a segment
+        unpainted), or an (N, 3) or (N, 4) array of RGB(A) entries.  It is
+        repeated as needed, so `["green", None]` paints every other segment.
+        Pass None to paint a single bar again.
+        """
+        if segment_colors is None:
+            self._segment_colors = None
+        else:
+            self._segment_colors = colors(segment_colors) or None
+        self._segment_cache = None
+        self.update()
+
     def barIsVisible(self) -> bool:
         """Whether to show the bar between the first and last handle."""
         return self._should_draw_bar
@@ -98,6 +184,57 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
         """Whether to show the bar between the first and last handle."""
         self._should_draw_bar = bool(val)
 
+    def handleConstraints(self) -> Optional[HandleConstraints]:
+        """Constraints applied to the handle positions, if any."""
+        return self._constraints
+
+    def setHandleConstraints(self, constraints: Optional[HandleConstraints]) -> None:
+        """Set per-handle bounds, gaps, groups and push behavior of the handles.
+
+        By default (None), handles only stop at their neighbors, at a distance
+        of `singleStep()`.  See `HandleConstraints` for the available options.
+        """
+        self._constraints = constraints
+        self.setValue(self._value)  # re-bound
+
+    def selectionData(self) -> Optional[SortedData]:
+        """The datasets counted between the handles, or None."""
+        return self._selection_data
+
+    def setSelectionData(self, data, assume_sorted: bool = True) -> None:
+        """Count the items of `data` that fall between the handles.
+
+        `data` is a sorted numpy array (or sequence of numbers), or a list of
+        them.  Whenever the handles move, `selectionCountsChanged` is emitted
+        with the number of items in each segment between neighboring handles
+        and the total between the outer handles.  Counting bisects the data,
+        so it stays cheap for millions of items.  Pass `assume_sorted=False`
+        to sort (a copy of) the data once, here.  None unbinds the data.
+        """
+        if data is None:
+            self._selection_data = None
+        else:
+            self._selection_data = SortedData(data, assume_sorted)
+        self._selection_counts = None
+        self._updateSelectionCounts()
+        self.update()
+
+    def selectionCounts(self) -> Tuple[Tuple[int, ...], int]:
+        """(items in each segment between handles, items in all segments)."""
+        if self._selection_data is None:
+            return (), 0
+        self._updateSelectionCounts()
+        return self._selection_counts[1]
+
+    def selectionBadgeVisible(self) -> bool:
+        """Whether the number of selected items is shown above the bar."""
+        return self._selection_badge
+
+    def setSelectionBadgeVisible(self, val: bool = True) -> None:
+        """Whether to show the number of selected items above the bar."""
+        self._selection_badge = bool(val)
+        self.update()
+
     def hideBar(self) -> None:
         self.setBarVisible(False)
 
@@ -110,6 +247,67 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
         """Get current value of the widget as a tuple of integers."""
         return tuple(self._value)
 
+    def setValue(self, value: Sequence[_T]) -> None:
+        """Set current value of the widget with a sequence of integers.
+
+        In addition to `valueChanged`, this emits `handleValueChanged` for
+        each handle that changed and `valuesChanged` with all of their indices.
+        """
+        old = tuple(self._value)
+        # positions are kept as a list: compare like with like
+        super().setValue(list(value))
+        new = self._value
+        if len(old) != len(new):
+            changed = tuple(range(len(new)))
+        else:
+            changed = tuple(i for i, (a, b) in enumerate(zip(old, new)) if a != b)
+        if changed:
+            for i in changed:
+                self.handleValueChanged.emit(i, new[i])
+            self.valuesChanged.emit(changed)
+        self._updateSelectionCounts()
+
+    def setHandleValues(
+        self,
+        values: Union[Mapping[int, _T], Sequence[_T]],
+        indices: Optional[Sequence[int]] = None,
+    ) -> None:
+        """Set the value of several handles at once.
+
+        `values` is either a mapping of `{handle_index: value}`, or a sequence
+        of values for the handles in `indices`.  Unlike calling `setValue` or
+        `setSliderPosition` once per handle, bounds and constraints are applied
+        once, signals are emitted once and the widget is repainted once.
+        """
+        self.setValue(self._merged(self._value, values, indices))
+
+    def setHandlePositions(
+        self,
+        positions: Union[Mapping[int, _T], Sequence[_T]],
+        indices: Optional[Sequence[int]] = None,
+    ) -> None:
+        """Set the position of several handles at once (see `setHandleValues`)."""
+        self.setSliderPosition(self._merged(self._position, positions, indices))
+
+    @staticmethod
+    def _merged(current, values, indices) -> list:
+        new = list(current)
+        if isinstance(values, Mapping):
+            items = values.items()
+        else:
+            values = list(values)
+            if indices is None:
+                indices = range(len(values))
+            indices = list(indices)
+            if len(indices) != len(values):
+                raise ValueError(
+                    f"got {len(values)} values for {len(indices)} handle indices"
+                )
+            items = zip(indices, values)
+        for i, v in items:
+            new[int(i)] = v
+        return new
+
     def sliderPosition(self):
         """Get current value of the widget as a tuple of integers.
 
@@ -132,8 +330,20 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
         else:
             pairs = [(self._pressedIndex if index is None else index, pos)]
 
-        for idx, position in pairs:
-            self._position[idx] = self._bound(position, idx)
+        if self._constraints is None:
+            if len(pairs) > 1:
+                # bound against the new neighbors, not the old ones, so that
+                # shifting all handles at once isn't blocked by stale positions
+                self._position = list(pos)
+            for idx, position in pairs:
+                self._position[idx] = self._bound(position, idx)
+        elif len(pairs) == 1:
+            idx, position = pairs[0]
+            position = self._quantize(position)
+            new = drag(self._position, idx, position, *self._constraintArgs())
+            self._position = [self._type_cast(v) for v in new]
+        else:
+            self._position = self._bound(list(pos))
 
         self._doSliderMove()
 
@@ -143,17 +353,28 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
             \n{type(self).__name__}::sub-page:horizontal {{background: none}}
             \n{type(self).__name__}::sub-page:vertical {{background: none}}
         """
+        self._has_qss_override = True
         return super().setStyleSheet(styleSheet + override)
 
     def event(self, ev: QEvent) -> bool:
-        if ev.type() == QEvent.StyleChange:
-            update_styles_from_stylesheet(self)
+        _type = ev.type()
+        if _type == QEvent.StyleChange:
+            self._style_dirty = True
+        elif _type == QEvent.Polish and not self._has_qss_override:
+            self.setStyleSheet("")
         return super().event(ev)
 
     def mouseMoveEvent(self, ev: QtGui.QMouseEvent) -> None:
         if self._pressedControl == SC_BAR:
             ev.accept()
-            delta = self._clickOffset - self._pixelPosToRangeValue(self._pick(ev.pos()))
+            new = self._pixelPosToRangeValue(self._pick(_event_positionF(ev)))
+            if self._scale.linear:
+                delta = self._clickOffset - new
+            else:
+                # as far as the mouse moved on screen, in linear units
+                lo, hi = self._viewRange()
+                frac = self._valueToFraction(self._clickOffset)
+                delta = (frac - self._valueToFraction(new)) * (hi - lo)
             self._offsetAllPositions(-delta, self._sldPosAtPress)
         else:
             super().mouseMoveEvent(ev)
@@ -165,16 +386,41 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
 
     def _bound(self, value, index=None):
         if isinstance(value, (list, tuple)):
-            return type(value)(self._bound(v) for v in value)
+            clamped = [self._clamp(v) for v in value]
+            bounded = [self._quantize(v) for v in clamped]
+            if self._constraints is not None:
+                # after quantizing, so that rounding can't undo the constraints
+                args = self._constraintArgs()
+                bounded = project(bounded, *args, current=self._position)
+            else:
+                # rounding mustn't bring handles closer than the minimum gap
+                step = self.singleStep()
+                for i in range(1, len(bounded)):
+                    gap = clamped[i] - clamped[i - 1]
+                    if bounded[i] - bounded[i - 1] < step <= gap:
+                        bounded[i - 1 : i + 1] = clamped[i - 1 : i + 1]
+            return type(value)(self._type_cast(v) for v in bounded)
+        # clamped, snapped and quantized before the neighbors bound it, so
+        # that rounding can't bring a handle closer than the minimum gap
         pos = super()._bound(value)
         if index is not None:
             pos = self._neighbor_bound(pos, index)
         return self._type_cast(pos)
 
+    def _constraintArgs(self):
+        return self._constraints, self._minimum, self._maximum, self.singleStep()
+
     def _neighbor_bound(self, val, index):
         # make sure we don't go lower than any preceding index:
         min_dist = self.singleStep()
         _lst = self._position
+        if self._allowed:
+            # neighbors are one allowed value apart, rather than a singleStep
+            if index > 0 and val <= _lst[index - 1]:
+                val = self._stepAllowed([_lst[index - 1]], 1)[0]
+            if index < (len(_lst) - 1) and val >= _lst[index + 1]:
+                val = self._stepAllowed([_lst[index + 1]], -1)[0]
+            return val
         if index > 0:
             val = max(_lst[index - 1] + min_dist, val)
         # make sure we don't go higher than any following index:
@@ -183,6 +429,7 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
         return val
 
     def _getBarColor(self):
+        self._updateStyle()
         return self._style.brush(self._styleOption)
 
     def _setBarColor(self, color):
@@ -193,34 +440,94 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
     def _offsetAllPositions(self, offset: float, ref=None) -> None:
         if ref is None:
             ref = self._position
+        if not self._scale.linear:
+            # move by the same distance on screen, as on a linear slider
+            lo, hi = self._viewRange()
+            span = hi - lo
+            fracs = [self._valueToFraction(v) for v in ref]
+            shift = offset / span if span else 0.0
+            if self._bar_is_rigid:
+                shift = max(-min(fracs), min(1 - max(fracs), shift))
+            self.setSliderPosition([self._fractionToValue(f + shift) for f in fracs])
+            return
         if self._bar_is_rigid:
-            # NOTE: This assumes monotonically increasing slider positions
-            if offset > 0 and ref[-1] + offset > self.maximum():
-                offset = self.maximum() - ref[-1]
-            elif ref[0] + offset < self.minimum():
-                offset = self.minimum() - ref[0]
+            # don't let any handle leave the range
+            low, high = min(ref), max(ref)
+            offset = max(self._minimum - low, min(self._maximum - high, offset))
         self.setSliderPosition([i + offset for i in ref])
 
     def _fixStyleOption(self, option):
         pass
 
+    def _doSliderMove(self):
+        super()._doSliderMove()
+        self._updateSelectionCounts()
+
+    def _updateSelectionCounts(self) -> None:
+        """Recount the selected items if the handles moved since last time."""
+        if self._selection_data is None:
+            return
+        key = tuple(self._position)
+        if self._selection_counts is not None and self._selection_counts[0] == key:
+            return
+        counts = self._selection_data.counts(sorted(key))
+        self._selection_counts = (key, counts)
+        self.selectionCountsChanged.emit(*counts)
+
+    def _updateStyle(self):
+        """Parse stylesheets if they changed since the last time we painted."""
+        if self._style_dirty:
+            self._style_dirty = False
+            update_styles_from_stylesheet(self)
+
     @property
     def _optSliderPositions(self):
-        return [self._to_qinteger_space(p - self._minimum) for p in self._position]
+        return [self._toDisplay(p) for p in self._position]
 
     # SubControl Positions
 
     def _handleRect(self, handle_index: int, opt: QStyleOptionSlider = None) -> QRect:
-        """Return the QRect for all handles."""
+        """Return the QRect for handle at `handle_index`."""
         opt = opt or self._styleOption
-        opt.sliderPosition = self._optSliderPositions[handle_index]
+        opt.sliderPosition = self._toDisplay(self._position[handle_index])
         return self.style().subControlRect(CC_SLIDER, opt, SC_HANDLE, self)
 
-    def _barRect(self, opt: QStyleOptionSlider) -> QRect:
-        """Return the QRect for the bar between the outer handles."""
+    def _handleRects(self, opt: QStyleOptionSlider = None) -> List[QRect]:
+        """Return the QRects for all handles, sharing a single style option."""
+        opt = opt or self._styleOption
+        style = self.style()
+        rects = []
+        for pos in self._optSliderPositions:
+            opt.sliderPosition = pos
+            rects.append(style.subControlRect(CC_SLIDER, opt, SC_HANDLE, self))
+        return rects
+
+    def _handleCentersF(self, opt: QStyleOptionSlider) -> List[float]:
+        """Exact (sub-pixel) centers of the handles along the groove."""
+        style = self.style()
+        gr = style.subControlRect(CC_SLIDER, opt, SC_GROOVE, self)
+        sr = style.subControlRect(CC_SLIDER, opt, SC_HANDLE, self)
+        if opt.orientation == Qt.Horizontal:
+            length, start, size = sr.width(), gr.x(), gr.width()
+        else:
+            length, start, size = sr.height(), gr.y(), gr.height()
+        span = size - length
+        start += length / 2
+        centers = []
+        for pos in self._position:
+            # handles outside of a zoomed view are shown at its ends
+            frac = min(max(self._valueToFraction(pos), 0), 1)
+            if opt.upsideDown:
+                frac = 1 - frac
+            centers.append(start + frac * span)
+        return centers
+
+    def _barRect(self, opt: QStyleOptionSlider) -> QRectF:
+        """Return the QRectF for the bar between the outer handles."""
         r_groove = self.style().subControlRect(CC_SLIDER, opt, SC_GROOVE, self)
         r_bar = QRectF(r_groove)
-        hdl_low, hdl_high = self._handleRect(0, opt), self._handleRect(-1, opt)
+        centers = self._handleCentersF(opt)
+        low, high = min(centers), max(centers)
 
         thickness = self._style.thickness(opt)
         offset = self._style.offset(opt)
@@ -228,21 +535,31 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
         if opt.orientation == Qt.Horizontal:
             r_bar.setTop(r_bar.center().y() - thickness / 2 + offset)
             r_bar.setHeight(thickness)
-            r_bar.setLeft(hdl_low.center().x())
-            r_bar.setRight(hdl_high.center().x())
+            r_bar.setLeft(low)
+            r_bar.setRight(high)
         else:
             r_bar.setLeft(r_bar.center().x() - thickness / 2 + offset)
             r_bar.setWidth(thickness)
-            r_bar.setBottom(hdl_low.center().y())
-            r_bar.setTop(hdl_high.center().y())
+            r_bar.setTop(low)
+            r_bar.setBottom(high)
 
         return r_bar
 
     # Painting
 
     def _drawBar(self, painter: QStylePainter, opt: QStyleOptionSlider):
-        brush = self._style.brush(opt)
+        palette = self._segmentPalette(opt)
+        if palette is not None:
+            painter.setPen(self._style.pen(opt))
+            for color, rects in self._segmentGroups(opt, palette):
+                painter.setBrush(color)
+                painter.drawRects(rects)
+            return
         r_bar = self._barRect(opt)
+        if self._colormap is not None:
+            self._drawColormap(painter, opt, r_bar)
+            return
+        brush = self._style.brush(opt)
         if isinstance(brush, QtGui.QGradient):
             brush.setStart(r_bar.topLeft())
             brush.setFinalStop(r_bar.bottomRight())
@@ -250,7 +567,75 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
         painter.setBrush(brush)
         painter.drawRect(r_bar)
 
+    def _segmentPalette(self, opt: QStyleOptionSlider):
+        """Colors of the segments (repeated as needed), or None for one bar."""
+        return self._segment_colors
+
+    def _segmentGroups(self, opt: QStyleOptionSlider, palette) -> List[tuple]:
+        """Segment rects between handles, grouped by color (cached)."""
+        r_groove = self.style().subControlRect(CC_SLIDER, opt, SC_GROOVE, self)
+        key = (
+            tuple(c.rgba() if c is not None else None for c in palette),
+            tuple(self._position),
+            r_groove,
+            QRect(opt.rect),
+            opt.orientation,
+            opt.upsideDown,
+            self._viewRange(),
+            self._scale,
+            self._style.thickness(opt),
+            self._style.offset(opt),
+        )
+        if self._segment_cache is not None and self._segment_cache[0] == key:
+            return self._segment_cache[1]
+
+        bar = self._barRect(opt)
+        centers = self._handleCentersF(opt)
+        groups: dict = {}
+        for i in range(len(centers) - 1):
+            color = palette[i % len(palette)]
+            if color is None:
+                continue
+            a, b = sorted(centers[i : i + 2])
+            if opt.orientation == Qt.Horizontal:
+                rect = QRectF(a, bar.top(), b - a, bar.height())
+            else:
+                rect = QRectF(bar.left(), a, bar.width(), b - a)
+            groups.setdefault(color.rgba(), (color, []))[1].append(rect)
+        result = list(groups.values())
+        self._segment_cache = (key, result)
+        return result
+
+    def _drawColormap(self, painter, opt, r_bar: QRectF):
+        cmap = self._colormap
+        vertical = opt.orientation == Qt.Vertical
+        if self._colormap_groove:
+            # extend the end colors to the ends of the handle travel
+            gr = self.style().subControlRect(CC_SLIDER, opt, SC_GROOVE, self)
+            sr = self.style().subControlRect(CC_SLIDER, opt, SC_HANDLE, self)
+            before, after = QRectF(r_bar), QRectF(r_bar)
+            if vertical:
+                before.setTop(gr.y() + sr.height() / 2)
+                before.setBottom(r_bar.top())
+                after.setTop(r_bar.bottom())
+                after.setBottom(gr.y() + gr.height() - sr.height() / 2)
+            else:
+                before.setLeft(gr.x() + sr.width() / 2)
+                before.setRight(r_bar.left())
+                after.setLeft(r_bar.right())
+                after.setRight(gr.x() + gr.width() - sr.width() / 2)
+            low, high = cmap.first(), cmap.last()
+            if opt.upsideDown:
+                low, high = high, low
+            painter.fillRect(before, low)
+            painter.fillRect(after, high)
+        image = cmap.image(vertical, opt.upsideDown)
+        painter.drawImage(r_bar, image, QRectF(image.rect()))
+
     def _draw_handle(self, painter: QStylePainter, opt: QStyleOptionSlider):
+        self._updateStyle()
+        if not self._position:
+            return  # no handles (e.g. an interval slider without intervals)
         if self._should_draw_bar:
             self._drawBar(painter, opt)
 
@@ -267,6 +652,22 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
             opt.activeSubControls = SC_HANDLE if idx == hidx else SC_NONE
             painter.drawComplexControl(CC_SLIDER, opt)
 
+        if self._selection_badge and self._selection_data is not None:
+            self._drawSelectionBadge(painter, opt)
+
+    def _drawSelectionBadge(self, painter: QStylePainter, opt: QStyleOptionSlider):
+        """Draw the number of selected items, centered over the bar."""
+        text = f"{self.selectionCounts()[1]:,}"
+        bar = self._barRect(opt)
+        if opt.orientation == Qt.Horizontal:
+            rect = QRectF(0, 0, self.width(), bar.top())
+            rect.moveCenter(QPointF(bar.center().x(), rect.center().y()))
+        else:
+            rect = QRectF(0, 0, bar.left(), self.height())
+            rect.moveCenter(QPointF(rect.center().x(), bar.center().y()))
+        painter.setPen(opt.palette.color(QtGui.QPalette.WindowText))
+        painter.drawText(rect, Qt.AlignCenter | Qt.TextDontClip, text)
+
     def _updateHoverControl(self, pos):
         old_hover = self._hoverControl, self._hoverIndex
         self._hoverControl, self._hoverIndex = self._getControlAtPos(pos)
@@ -316,6 +717,9 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
     def _execute_scroll(self, steps_to_scroll, modifiers):
         if modifiers & Qt.AltModifier:
             self._spreadAllPositions(shrink=steps_to_scroll < 0)
+        elif self._allowed:
+            steps = self._allowedSteps(steps_to_scroll, modifiers)
+            self.setSliderPosition(self._stepAllowed(self._position, steps))
         else:
             self._offsetAllPositions(steps_to_scroll)
         self.triggerAction(QSlider.SliderMove)
@@ -328,9 +732,14 @@ class _GenericRangeSlider(_GenericSlider[Tuple], Generic[_T]):
     def _spreadAllPositions(self, shrink=False, gain=1.1, ref=None) -> None:
         if ref is None:
             ref = self._position
-        # if self._bar_is_rigid:  # TODO
 
         if shrink:
             gain = 1 / gain
-        center = abs(ref[-1] + ref[0]) / 2
+        low, high = min(ref), max(ref)
+        center = (low + high) / 2
+        if self._bar_is_rigid and high > low and gain > 1:
+            # spread no further than the range, rather than squashing handles
+            half = (high - low) / 2
+            room = min(self._maximum - center, center - self._minimum)
+            gain = max(1, min(gain, room / half))
         self.setSliderPosition([((i - center) * gain) + center for i in ref])
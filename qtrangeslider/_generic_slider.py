@@ -20,10 +20,19 @@ scalar (with one handle per item), and it forms the basis of
 QRangeSlider.
 """
 
-from typing import Generic, TypeVar
-
+import warnings
+from bisect import bisect_left, bisect_right
+from typing import Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from ._autorange import estimate_range
+from ._callbacks import CallbackList
+from ._histogram import Histogram, bin_data, even_edges
+from ._markers import Markers
+from ._scales import LinearScale, Scale
+from ._ticks import Ticks
+from ._worker import BackgroundJobs
 from .qtcompat import QtGui
-from .qtcompat.QtCore import QEvent, QPoint, QPointF, QRect, Qt, Signal
+from .qtcompat.QtCore import QEvent, QPoint, QPointF, QRect, QRectF, Qt, Signal
 from .qtcompat.QtWidgets import (
     QApplication,
     QSlider,
@@ -47,7 +56,15 @@ class _GenericSlider(QSlider, Generic[_T]):
     valueChanged = Signal(float)
     sliderMoved = Signal(float)
     rangeChanged = Signal(float, float)
-
+    # Emitted with the (min, max) of the visible part of the range, when zoomed
+    viewRangeChanged = Signal(object, object)
+    # Emitted when binned histogram data arrives (see setHistogram)
+    histogramChanged = Signal()
+    # Emitted with the index of the marker under the mouse, or -1 (see setMarkers)
+    markerHovered = Signal(int)
+
+    # integer resolution of style options when the groove size isn't known
+    # (otherwise, there is one step per device pixel of handle travel)
     MAX_DISPLAY = 5000
 
     def __init__(self, *args, **kwargs) -> None:
@@ -65,6 +82,9 @@ class _GenericSlider(QSlider, Generic[_T]):
         self._hoverControl = SC_NONE
         self._hoverRect = QRect()
         self._clickOffset = 0.0
+        # integer space of style options, and the geometry it was computed for
+        self._display_max = self.MAX_DISPLAY
+        self._display_key = None
 
         # for keyboard nav
         self._repeatMultiplier = 1  # TODO
@@ -73,9 +93,390 @@ class _GenericSlider(QSlider, Generic[_T]):
         # fraction of total range to scroll when holding Ctrl while scrolling
         self._control_fraction = 0.04
 
+        # plain python listeners, called alongside valueChanged/sliderMoved
+        self._value_callbacks = CallbackList()
+        self._move_callbacks = CallbackList()
+
+        # sorted values that handles may land on (see setAllowedValues)
+        self._allowed: Optional[List[float]] = None
+
+        # mapping of values to display space (see setScale), with a cache of
+        # the scale at the range limits and of values for each groove pixel
+        self._scale: Scale = LinearScale()
+        self._scale_limits: Optional[tuple] = None
+        self._scale_lut: Optional[tuple] = None
+
+        # visible part of the range when zoomed in, else None (see setViewRange)
+        self._view: Optional[tuple] = None
+        self._zoom_modifier = None
+
+        # histogram drawn in the groove (see setHistogram), its color (None
+        # for the palette's), and the jobs binning data in the background
+        self._histogram: Optional[Histogram] = None
+        self._histogram_color: Optional[QtGui.QColor] = None
+        self._histogram_jobs: Optional[BackgroundJobs] = None
+        # markers drawn along the groove, and the one under the mouse
+        self._markers: Optional[Markers] = None
+        self._hovered_marker = -1
+        # estimation of the range from data (see autoRange)
+        self._autorange_jobs: Optional[BackgroundJobs] = None
+        # tick marks (see setTickValues), drawn no closer than _tick_spacing
+        self._ticks = Ticks()
+        self._minor_tick_interval = 0.0
+        self._tick_spacing = 4.0
+
         super().__init__(*args, **kwargs)
         self.setAttribute(Qt.WA_Hover)
 
+    # ###############  New Public API  #######################
+
+    def addValueCallback(
+        self, callback: Callable[[_T], None], weak: bool = False, dedupe: bool = False
+    ) -> None:
+        """Call `callback(value)` whenever the value changes.
+
+        This is a lighter weight alternative to connecting to `valueChanged`:
+        the callback is called directly, without going through Qt.  If `weak` is
+        True, only a weak reference to `callback` is held.  If `dedupe` is True,
+        `callback` is skipped when the value equals the last value it received.
+        """
+        self._value_callbacks.add(callback, weak=weak, dedupe=dedupe)
+
+    def removeValueCallback(self, callback: Callable[[_T], None]) -> None:
+        """Remove a callback added with `addValueCallback`."""
+        self._value_callbacks.remove(callback)
+
+    def addMoveCallback(
+        self, callback: Callable[[_T], None], weak: bool = False, dedupe: bool = False
+    ) -> None:
+        """Call `callback(position)` whenever `sliderMoved` is emitted.
+
+        See `addValueCallback` for the meaning of `weak` and `dedupe`.
+        """
+        self._move_callbacks.add(callback, weak=weak, dedupe=dedupe)
+
+    def removeMoveCallback(self, callback: Callable[[_T], None]) -> None:
+        """Remove a callback added with `addMoveCallback`."""
+        self._move_callbacks.remove(callback)
+
+    def allowedValues(self) -> Optional[Sequence[float]]:
+        """Values that the slider snaps to, or None if any value is allowed."""
+        return self._allowed
+
+    def setAllowedValues(self, values: Optional[Sequence[float]]) -> None:
+        """Only allow the slider to take one of `values`.
+
+        Dragging, typing a value, or calling `setValue` snaps to the nearest
+        allowed value (within the slider range), and the mouse wheel and
+        keyboard step through allowed values by index rather than by
+        `singleStep`.  `values` need not be sorted, but sorted input avoids a
+        copy being sorted.  Snapping is a binary search, so it stays cheap for
+        very large sets.  Pass None to allow any value again.
+        """
+        if values is None:
+            self._allowed = None
+        else:
+            vals = list(values)
+            if any(a > b for a, b in zip(vals, vals[1:])):
+                vals.sort()
+            self._allowed = vals or None
+        self.setValue(self._value)
+
+    def scale(self) -> Scale:
+        """The scale used to map values to positions on the slider."""
+        return self._scale
+
+    def setScale(self, scale: Optional[Scale]) -> None:
+        """Set the scale used to map values to positions (None for linear).
+
+        For example, `setScale(LogScale())` gives each decade of the range
+        the same length on screen.  Dragging, the mouse wheel and tick marks
+        all follow the scale.  Raises ValueError if the scale can't map the
+        current range (e.g. a LogScale with `minimum() <= 0`).
+        """
+        scale = scale or LinearScale()
+        scale.validate(self._minimum, self._maximum)
+        self._scale = scale
+        self._scale_limits = self._scale_lut = None
+        self.update()
+
+    def viewRange(self) -> Tuple[float, float]:
+        """(min, max) of the part of the range currently shown on the slider."""
+        return self._viewRange()
+
+    def setViewRange(self, min: float, max_: float) -> None:
+        """Zoom in to show only values from `min` to `max_` along the slider.
+
+        Values, range and mapping keep the model's full precision, so a
+        narrow window can be selected precisely in an arbitrarily large range.
+        Handles outside of the view are shown at its ends.
+        """
+        self._setView(self._range_cast(min), self._range_cast(max_))
+
+    def resetViewRange(self) -> None:
+        """Zoom out to show the full range."""
+        self._setView(self._minimum, self._maximum)
+
+    def isZoomed(self) -> bool:
+        """Whether only part of the range is shown (see `setViewRange`)."""
+        return self._view is not None
+
+    def zoomView(self, factor: float, center: Optional[float] = None) -> None:
+        """Zoom in by `factor` (< 1 zooms out) around `center`.
+
+        `center` defaults to the middle of the view, and stays at the same
+        place on the slider.
+        """
+        lo, hi = self._viewRange()
+        if center is None:
+            center = lo + self._range_cast((hi - lo) / 2)
+        center = min(max(self._range_cast(center), lo), hi)
+        new_lo = center - self._range_cast((center - lo) / factor)
+        new_hi = center + self._range_cast((hi - center) / factor)
+        if new_hi - new_lo < self._singleStep:
+            return  # no deeper than a single step
+        width = new_hi - new_lo
+        if new_lo < self._minimum:
+            new_lo, new_hi = self._minimum, self._minimum + width
+        if new_hi > self._maximum:
+            new_lo, new_hi = max(self._maximum - width, self._minimum), self._maximum
+        self._setView(new_lo, new_hi)
+
+    def panView(self, delta: float) -> None:
+        """Shift the view by `delta` (in values), staying within the range."""
+        lo, hi = self._viewRange()
+        delta = self._range_cast(delta)
+        delta = max(self._minimum - lo, min(self._maximum - hi, delta))
+        self._setView(lo + delta, hi + delta)
+
+    def zoomModifier(self):
+        """Modifier keys that zoom (wheel) or pan (horizontal wheel), or None."""
+        return self._zoom_modifier
+
+    def setZoomModifier(self, modifiers=Qt.ControlModifier | Qt.ShiftModifier):
+        """Enable zooming with the mouse wheel while holding `modifiers`.
+
+        While held, the wheel zooms around the mouse pointer, a horizontal
+        wheel (or trackpad) pans, and a double-click shows the full range
+        again.  While zoomed, an overview strip along the edge of the widget
+        shows which part of the range is visible.  Pass None to disable.
+        """
+        self._zoom_modifier = modifiers
+
+    def histogram(self) -> Optional[Tuple[List[float], List[float]]]:
+        """(counts, bin edges) of the histogram shown in the groove, or None."""
+        h = self._histogram
+        return (list(h.counts), list(h.edges)) if h is not None else None
+
+    def setHistogram(
+        self,
+        data=None,
+        bins: int = 256,
+        range: Optional[Tuple[float, float]] = None,
+        max_samples: Optional[int] = 1_000_000,
+    ) -> None:
+        """Show a histogram of `data` behind the handles (None to remove it).
+
+        `data` may be a numpy array (or memmap) of any shape, or a sequence of
+        numbers.  It is binned in a background thread, and shown when done
+        (`histogramChanged` is emitted); a newer call drops pending results.
+        `range` defaults to the slider's range.  Only `max_samples` evenly
+        strided elements are binned, with counts scaled back up: large arrays
+        aren't read in full.  Use `addHistogramData` to add data in chunks.
+        """
+        if self._histogram_jobs is not None:
+            self._histogram_jobs.cancel()
+        if data is None:
+            self._histogram = None
+            self.update()
+            return
+        lo, hi = range if range is not None else (self._minimum, self._maximum)
+        edges = even_edges(float(lo), float(hi), bins)
+        self._histogram = Histogram([0] * bins, edges)
+        self._histogram.max_samples = max_samples
+        self.addHistogramData(data)
+
+    def setHistogramCounts(
+        self, counts: Sequence[float], edges: Optional[Sequence[float]] = None
+    ) -> None:
+        """Show precomputed histogram `counts` (e.g. from `numpy.histogram`).
+
+        `edges` (one more than counts) default to even bins over the range.
+        """
+        if self._histogram_jobs is not None:
+            self._histogram_jobs.cancel()
+        counts = list(counts)
+        if edges is None:
+            edges = even_edges(self._minimum, self._maximum, len(counts))
+        self._histogram = Histogram(counts, list(edges))
+        self.update()
+        self.histogramChanged.emit()
+
+    def addHistogramData(self, data) -> None:
+        """Add a chunk of data to the histogram, binned in the background.
+
+        Uses the bins of the last `setHistogram` call (which must come first).
+        """
+        hist = self._histogram
+        if hist is None:
+            raise RuntimeError("call setHistogram before addHistogramData")
+        if self._histogram_jobs is None:
+            self._histogram_jobs = BackgroundJobs(self)
+        edges, max_samples = hist.edges, hist.max_samples
+
+        def _add(counts):
+            if hist is self._histogram:
+                hist.add(counts)
+                self.update()
+                self.histogramChanged.emit()
+
+        def _failed(error):
+            warnings.warn(f"could not bin histogram data: {error!r}", RuntimeWarning)
+
+        self._histogram_jobs.submit(
+            lambda check: bin_data(data, edges, max_samples, check),
+            _add,
+            new=False,
+            errback=_failed,
+        )
+
+    def histogramColor(self) -> QtGui.QColor:
+        """Color of the histogram bars."""
+        if self._histogram_color is not None:
+            return QtGui.QColor(self._histogram_color)
+        color = self.palette().color(QtGui.QPalette.Highlight)
+        color.setAlpha(90)
+        return color
+
+    def setHistogramColor(self, color) -> None:
+        """Set the color of the histogram bars (None for the palette's)."""
+        self._histogram_color = QtGui.QColor(color) if color is not None else None
+        self.update()
+
+    def markers(self) -> Optional[Markers]:
+        """The markers drawn along the groove, or None."""
+        return self._markers
+
+    def setMarkers(
+        self,
+        values: Optional[Sequence[float]],
+        categories: Optional[Sequence] = None,
+        colors: Optional[dict] = None,
+    ) -> None:
+        """Mark `values` along the groove (e.g. events or keyframes).
+
+        Markers are drawn behind the handles, as thin lines colored by
+        `colors[category]` (or the palette's text color), and aren't
+        interactive, but `markerHovered` is emitted with the index of the
+        marker under the mouse.  Any number of markers may be given: nearby
+        markers are drawn as a single line.  Pass None to remove them.
+        """
+        if values is None:
+            self._markers = None
+        else:
+            self._markers = Markers(values, categories, colors)
+        self._hovered_marker = -1
+        self.update()
+
+    def nearestMarker(self, value: float) -> int:
+        """Index of the marker nearest to `value`, or -1 if there are none."""
+        return self._markers.nearest(value) if self._markers is not None else -1
+
+    def hoveredMarker(self) -> int:
+        """Index of the marker under the mouse, or -1."""
+        return self._hovered_marker
+
+    def tickValues(self) -> Optional[Tuple[List[float], List[float]]]:
+        """The (major, minor) tick values, or None if ticks follow the interval."""
+        if self._ticks.major is None:
+            return None
+        return self._ticks.major, self._ticks.minor or []
+
+    def setTickValues(
+        self, major: Optional[Sequence[float]], minor: Sequence[float] = ()
+    ) -> None:
+        """Draw ticks at the `major` values, and shorter ones at `minor` values.
+
+        Values needn't be evenly spaced.  Ticks closer than
+        `minimumTickSpacing()` are skipped, so any number may be given.  Pass
+        None to go back to ticks every `tickInterval()`.  Ticks are shown
+        according to `tickPosition()`.
+        """
+        if major is None:
+            self._ticks.setValues(None, None)
+        else:
+            self._ticks.setValues(major, minor)
+        self.update()
+
+    def minorTickInterval(self) -> float:
+        """Interval between minor ticks (0 for none)."""
+        return self._minor_tick_interval
+
+    def setMinorTickInterval(self, interval: float) -> None:
+        """Draw shorter ticks every `interval`, between the major ticks."""
+        self._minor_tick_interval = max(0.0, interval)
+        self.update()
+
+    def minimumTickSpacing(self) -> float:
+        """Minimum distance between tick marks, in pixels."""
+        return self._tick_spacing
+
+    def setMinimumTickSpacing(self, pixels: float) -> None:
+        """Skip ticks closer than `pixels` to the previous one (of any level).
+
+        With a finer tick interval, ticks are drawn at a multiple of it
+        (by 2, 5, 10...) instead.
+        """
+        self._tick_spacing = max(1.0, pixels)
+        self.update()
+
+    def setRangeAndValue(self, min: float, max_: float, value: _T) -> None:
+        """Set the range and the value at once.
+
+        Unlike `setRange` followed by `setValue`, the value isn't bounded to
+        the new range first, so listeners get a single `valueChanged` (and
+        the widget is repainted once).
+        """
+        self._applyRange(min, max_)
+        self.setValue(value)
+
+    def autoRange(
+        self,
+        data,
+        percentiles: Optional[Sequence[float]] = None,
+        max_samples: Optional[int] = 1_000_000,
+        refine: bool = False,
+    ) -> None:
+        """Set the range (and value) from `data`, computed in the background.
+
+        `data` is a numpy array or memmap (or a sequence of numbers).  The
+        range is set to the min and max of its finite values, and the
+        handles to its `percentiles`: one per handle, by default 50 for a
+        single handle or evenly spaced from 1 to 99 for several.  Pass an
+        empty sequence to leave the value alone.  Only `max_samples` evenly
+        strided elements are read; with `refine`, the range is then made
+        exact with a pass over all the data.  A newer call (or
+        `cancelAutoRange`) abandons computations still in progress.  If
+        reading `data` fails, a RuntimeWarning is issued and the range is
+        left alone.
+        """
+        if percentiles is None:
+            n = len(self._value) if isinstance(self._value, (list, tuple)) else 1
+            percentiles = [1 + 98 * i / (n - 1) for i in range(n)] if n > 1 else [50]
+        percentiles = list(percentiles)
+        if self._autorange_jobs is None:
+            self._autorange_jobs = BackgroundJobs(self)
+        self._autorange_jobs.submit(
+            lambda check: estimate_range(data, percentiles, max_samples, refine, check),
+            self._applyAutoRange,
+            errback=self._autoRangeFailed,
+        )
+
+    def cancelAutoRange(self) -> None:
+        """Abandon range computations started by `autoRange`."""
+        if self._autorange_jobs is not None:
+            self._autorange_jobs.cancel()
+
     # ###############  QtOverrides  #######################
 
     def value(self) -> _T:  # type: ignore
@@ -89,9 +490,9 @@ class _GenericSlider(QSlider, Generic[_T]):
         if self._position != value:
             self._setPosition(value)
             if self.isSliderDown():
-                self.sliderMoved.emit(self.sliderPosition())
+                self._emitSliderMoved()
         self.sliderChange(self.SliderChange.SliderValueChange)
-        self.valueChanged.emit(self.value())
+        self._emitValueChanged()
 
     def sliderPosition(self) -> _T:  # type: ignore
         return self._position
@@ -130,12 +531,7 @@ class _GenericSlider(QSlider, Generic[_T]):
         self.setRange(min(self._minimum, max), max)
 
     def setRange(self, min: float, max_: float) -> None:
-        oldMin, self._minimum = self._minimum, float(min)
-        oldMax, self._maximum = self._maximum, float(max(min, max_))
-
-        if oldMin != self._minimum or oldMax != self._maximum:
-            self.sliderChange(self.SliderRangeChange)
-            self.rangeChanged.emit(self._minimum, self._maximum)
+        if self._applyRange(min, max_):
             self.setValue(self._value)  # re-bound
 
     def tickInterval(self) -> float:  # type: ignore
@@ -171,7 +567,7 @@ class _GenericSlider(QSlider, Generic[_T]):
 
         # scale style option to integer space
         option.minimum = 0
-        option.maximum = self.MAX_DISPLAY
+        option.maximum = self._displayMax(option)
         option.tickInterval = self._to_qinteger_space(self._tickInterval)
         option.pageStep = self._to_qinteger_space(self._pageStep)
         option.singleStep = self._to_qinteger_space(self._singleStep)
@@ -180,9 +576,15 @@ class _GenericSlider(QSlider, Generic[_T]):
     def event(self, ev: QEvent) -> bool:
         if ev.type() == QEvent.WindowActivate:
             self.update()
+        elif ev.type() == QEvent.StyleChange:
+            self._display_key = None  # handle size may have changed
         elif ev.type() in (QEvent.HoverEnter, QEvent.HoverMove):
             self._updateHoverControl(_event_position(ev))
+            if self._markers is not None:
+                self._updateHoveredMarker(_event_positionF(ev))
         elif ev.type() == QEvent.HoverLeave:
+            if self._markers is not None:
+                self._setHoveredMarker(-1)
             self._hoverControl = SC_NONE
             lastHoverRect, self._hoverRect = self._hoverRect, QRect()
             self.update(lastHoverRect)
@@ -226,7 +628,7 @@ class _GenericSlider(QSlider, Generic[_T]):
             ev.ignore()
             return
         ev.accept()
-        pos = self._pick(_event_position(ev))
+        pos = self._pick(_event_positionF(ev))
         newPosition = self._pixelPosToRangeValue(pos - self._clickOffset)
         self.setSliderPosition(newPosition)
 
@@ -243,7 +645,18 @@ class _GenericSlider(QSlider, Generic[_T]):
             self.setSliderDown(False)
         self.update()
 
+    def mouseDoubleClickEvent(self, ev: QtGui.QMouseEvent) -> None:
+        if self._isZoomEvent(ev) and self._view is not None:
+            ev.accept()
+            self.resetViewRange()
+        else:
+            super().mouseDoubleClickEvent(ev)
+
     def wheelEvent(self, e: QtGui.QWheelEvent) -> None:
+        if self._isZoomEvent(e):
+            e.accept()
+            self._zoomWheel(e)
+            return
 
         e.ignore()
         vertical = bool(e.angleDelta().y())
@@ -261,34 +674,236 @@ class _GenericSlider(QSlider, Generic[_T]):
 
         # draw groove and ticks
         opt.subControls = SC_GROOVE
+        layer_ticks = False
         if opt.tickPosition != QSlider.NoTicks:
-            opt.subControls |= SC_TICKMARKS
+            if self._needsTickLayer(opt):
+                layer_ticks = True
+            else:
+                opt.subControls |= SC_TICKMARKS
         painter.drawComplexControl(CC_SLIDER, opt)
+        if layer_ticks:
+            self._drawTicks(painter, opt)
+        if self._histogram is not None:
+            self._drawHistogram(painter, opt)
+        if self._markers is not None:
+            rect = self._travelRect(opt)
+            if rect.width() > 0 and rect.height() > 0:
+                color = opt.palette.color(QtGui.QPalette.WindowText).rgba()
+                self._markers.paint(painter, rect, self, opt, color)
+        if self._view is not None:
+            self._drawOverview(painter, opt)
 
         self._draw_handle(painter, opt)
 
     # ###############  Implementation Details  #######################
 
+    def _applyRange(self, min, max_) -> bool:
+        """Set the range without bounding the value; return whether it changed."""
+        min, max_ = self._range_cast(min), self._range_cast(max(min, max_))
+        self._scale.validate(min, max_)
+        oldMin, self._minimum = self._minimum, min
+        oldMax, self._maximum = self._maximum, max_
+
+        if oldMin == self._minimum and oldMax == self._maximum:
+            return False
+        self._ticks.invalidate()  # ticks are multiples of the interval from min
+        if self._view is not None:
+            self._setView(*self._view)  # clip to the new range
+        self.sliderChange(self.SliderRangeChange)
+        self.rangeChanged.emit(self._minimum, self._maximum)
+        return True
+
+    def _autoRangeFailed(self, error: Exception) -> None:
+        warnings.warn(f"autoRange could not read the data: {error!r}", RuntimeWarning)
+
+    def _applyAutoRange(self, result) -> None:
+        if result is None:
+            return  # no finite values
+        lo, hi, values = result
+        if not values:
+            self.setRange(lo, hi)
+        elif isinstance(self._value, (list, tuple)):
+            self.setRangeAndValue(lo, hi, values)
+        else:
+            self.setRangeAndValue(lo, hi, values[0])
+
     def _type_cast(self, val):
         return val
 
+    def _quantize(self, value: float) -> float:
+        """Round a (bounded) value to the value resolution, if any."""
+        return value
+
+    def _range_cast(self, val):
+        return float(val)
+
     def _setPosition(self, val):
         self._position = val
 
     def _bound(self, value: _T) -> _T:
-        return self._type_cast(max(self._minimum, min(self._maximum, value)))
+        return self._type_cast(self._quantize(self._clamp(value)))
+
+    def _clamp(self, value: float) -> float:
+        """`value` within the range (and snapped to the allowed values)."""
+        value = max(self._minimum, min(self._maximum, value))
+        if self._allowed:
+            value = self._snap(value)
+        return value
+
+    def _allowedRange(self):
+        """Slice of allowed values that lie within the slider range."""
+        allowed = self._allowed
+        return (
+            bisect_left(allowed, self._minimum),
+            bisect_right(allowed, self._maximum),
+        )
+
+    def _snap(self, value: float) -> float:
+        """Nearest allowed value in range (unchanged if there is none)."""
+        lo, hi = self._allowedRange()
+        if lo >= hi:
+            return value
+        allowed = self._allowed
+        i = bisect_left(allowed, value, lo, hi)
+        if i == hi or (i > lo and value - allowed[i - 1] <= allowed[i] - value):
+            i -= 1
+        return allowed[i]
+
+    def _stepAllowed(self, values: Sequence[float], steps: int) -> List[float]:
+        """Move each of `values` by `steps` allowed values, as one block.
+
+        The shift is reduced so that no value leaves the allowed range.
+        """
+        lo, hi = self._allowedRange()
+        if lo >= hi:
+            return list(values)
+        allowed = self._allowed
+        idx = [bisect_left(allowed, self._snap(v), lo, hi) for v in values]
+        steps = max(lo - min(idx), min(hi - 1 - max(idx), steps))
+        return [allowed[i + steps] for i in idx]
+
+    def _allowedSteps(self, steps_to_scroll: float, modifiers) -> int:
+        """Convert a scroll distance (in values) to a number of allowed values."""
+        if modifiers & Qt.ControlModifier and self._allowed:
+            lo, hi = self._allowedRange()
+            step = (self._maximum - self._minimum) / max(hi - lo, 1)
+        else:
+            step = self._singleStep
+        n = round(steps_to_scroll / step) if step else 0
+        if not n and steps_to_scroll:
+            n = 1 if steps_to_scroll > 0 else -1
+        return int(n)
 
     def _fixStyleOption(self, option):
-        option.sliderPosition = self._to_qinteger_space(self._position - self._minimum)
-        option.sliderValue = self._to_qinteger_space(self._value - self._minimum)
+        option.sliderPosition = self._toDisplay(self._position)
+        option.sliderValue = self._toDisplay(self._value)
+
+    def _toDisplay(self, value: float) -> int:
+        """Position of `value` in the style option's integer space."""
+        if self._view is not None:
+            # handles outside of the view are shown at its ends
+            frac = min(max(self._valueToFraction(value), 0), 1)
+            return int(round(frac * self._display_max))
+        if self._scale.linear:
+            return self._to_qinteger_space(value - self._minimum)
+        return int(round(self._valueToFraction(value) * self._display_max))
+
+    def _displayMax(self, option: QStyleOptionSlider) -> int:
+        """Integer resolution of style options: handle travel in device pixels.
+
+        Handles then map 1:1 onto pixels, at any widget size and DPI.
+        """
+        dpr = self.devicePixelRatioF()
+        rect = option.rect
+        key = (rect.size(), option.orientation, option.tickPosition, dpr)
+        if key != self._display_key:
+            # groove and handle sizes don't depend on the value range
+            option.maximum = 1
+            style = self.style()
+            gr = style.subControlRect(CC_SLIDER, option, SC_GROOVE, self)
+            sr = style.subControlRect(CC_SLIDER, option, SC_HANDLE, self)
+            if option.orientation == Qt.Horizontal:
+                span = gr.width() - sr.width()
+            else:
+                span = gr.height() - sr.height()
+            span = int(round(span * dpr))
+            self._display_max = span if span > 0 else self.MAX_DISPLAY
+            self._display_key = key
+        return self._display_max
+
+    def _scaleLimits(self):
+        """The scale's forward transform of minimum and maximum (cached)."""
+        lo, hi = self._viewRange()
+        key = (self._scale, lo, hi)
+        if self._scale_limits is None or self._scale_limits[0] != key:
+            f = self._scale.forward
+            self._scale_limits = (key, f(lo), f(hi))
+        return self._scale_limits[1:]
+
+    def _valueToFraction(self, value: float) -> float:
+        """Fraction (0-1) of the slider length at which `value` is shown."""
+        if self._scale.linear:
+            lo, hi = self._viewRange()
+        else:
+            lo, hi = self._scaleLimits()
+            value = self._scale.forward(value)
+        return (value - lo) / (hi - lo) if hi > lo else 0.0
+
+    def _fractionToValue(self, frac: float) -> float:
+        """Value shown at `frac` (0-1) of the slider length."""
+        frac = min(max(frac, 0.0), 1.0)
+        vmin, vmax = self._viewRange()
+        if self._scale.linear:
+            return vmin + frac * (vmax - vmin)
+        lo, hi = self._scaleLimits()
+        value = self._scale.inverse(lo + frac * (hi - lo))
+        # guard against round-trip error at the limits
+        return min(max(value, vmin), vmax)
+
+    def _scaledAdd(self, value: float, add: float) -> float:
+        """`value` moved as far on screen as `add` would on a linear slider."""
+        lo, hi = self._viewRange()
+        span = hi - lo
+        if not span:
+            return value
+        return self._fractionToValue(self._valueToFraction(value) + add / span)
+
+    def _scaledValueFromPosition(self, position: int, span: int, upsideDown: bool):
+        """Like `_sliderValueFromPosition`, through the (non-linear) scale.
+
+        The value at every pixel is computed once per geometry and range.
+        """
+        lo, hi = self._viewRange()
+        if span <= 0:
+            return hi if upsideDown else lo
+        key = (span, upsideDown, self._scale, lo, hi)
+        if self._scale_lut is None or self._scale_lut[0] != key:
+            lut = [self._fractionToValue(i / span) for i in range(span + 1)]
+            if upsideDown:
+                lut.reverse()
+            self._scale_lut = (key, lut)
+        return self._scale_lut[1][min(max(int(round(position)), 0), span)]
 
     def _to_qinteger_space(self, val, _max=None):
-        _max = _max or self.MAX_DISPLAY
-        return int(min(QOVERFLOW, val / (self._maximum - self._minimum) * _max))
+        _max = _max or self._display_max
+        lo, hi = self._viewRange()
+        return int(min(QOVERFLOW, val / (hi - lo) * _max))
 
     def _pick(self, pt: QPoint) -> int:
         return pt.x() if self.orientation() == Qt.Horizontal else pt.y()
 
+    def _emitValueChanged(self):
+        value = self.value()
+        self.valueChanged.emit(value)
+        if self._value_callbacks:
+            self._value_callbacks(value)
+
+    def _emitSliderMoved(self):
+        position = self.sliderPosition()
+        self.sliderMoved.emit(position)
+        if self._move_callbacks:
+            self._move_callbacks(position)
+
     def _setSteps(self, single: float, page: float):
         self._singleStep = single
         self._pageStep = page
@@ -298,7 +913,7 @@ class _GenericSlider(QSlider, Generic[_T]):
         if not self.hasTracking():
             self.update()
         if self.isSliderDown():
-            self.sliderMoved.emit(self.sliderPosition())
+            self._emitSliderMoved()
         if self.hasTracking() and not self._blocktracking:
             self.triggerAction(QSlider.SliderMove)
 
@@ -357,6 +972,163 @@ class _GenericSlider(QSlider, Generic[_T]):
 
         painter.drawComplexControl(CC_SLIDER, opt)
 
+    def _needsTickLayer(self, opt) -> bool:
+        """Whether ticks are drawn by the Ticks layer, not natively by the style.
+
+        The style only draws evenly spaced ticks of one level, all of them:
+        the layer is used for tick values, minor ticks, non-linear scales and
+        ticks closer than `minimumTickSpacing()`.
+        """
+        if self._ticks.major is not None or self._minor_tick_interval:
+            return True
+        if not self._scale.linear:
+            return True
+        rect = self._travelRect(opt)
+        horizontal = opt.orientation == Qt.Horizontal
+        length = rect.width() if horizontal else rect.height()
+        lo, hi = self._viewRange()
+        if hi <= lo or length <= 0:
+            return False
+        step_px = self._effectiveTickInterval(length) / (hi - lo) * length
+        return step_px < self._tick_spacing
+
+    def _effectiveTickInterval(self, length: float) -> float:
+        """The tick interval; like QSlider, if 0: the single (or page) step."""
+        interval = self._tickInterval
+        if interval <= 0:
+            lo, hi = self._viewRange()
+            interval = self._singleStep
+            if hi > lo and interval / (hi - lo) * length < 3:
+                interval = self._pageStep
+        return interval
+
+    def _drawTicks(self, painter, opt):
+        """Draw tick marks along the handle travel (cached, see Ticks)."""
+        rect = self._travelRect(opt)
+        if rect.width() <= 0 or rect.height() <= 0:
+            return
+        gr = self.style().subControlRect(CC_SLIDER, opt, SC_GROOVE, self)
+        if opt.orientation == Qt.Horizontal:
+            length, near, far = rect.width(), gr.top() - 1, gr.bottom() + 1
+            edge = self.height()
+        else:
+            length, near, far = rect.height(), gr.left() - 1, gr.right() + 1
+            edge = self.width()
+        extents = []  # (outer, inner) ends of the ticks, on each side of the groove
+        if opt.tickPosition & QSlider.TicksAbove:
+            extents.append((0, max(near, 0)))
+        if opt.tickPosition & QSlider.TicksBelow:
+            extents.append((edge, min(far, edge)))
+
+        interval = self._tickInterval
+        if self._scale.linear:
+            interval = self._effectiveTickInterval(length)
+        intervals = (interval, self._minor_tick_interval or None)
+        color = opt.palette.color(QtGui.QPalette.WindowText).rgba()
+        extra = (tuple(extents), intervals, self._tick_spacing, color)
+        self._ticks.paint(painter, rect, self, opt, *extra)
+
+    def _travelRect(self, opt) -> QRectF:
+        """Rect of the handle travel along the groove, and the widget across it."""
+        gr = self.style().subControlRect(CC_SLIDER, opt, SC_GROOVE, self)
+        sr = self.style().subControlRect(CC_SLIDER, opt, SC_HANDLE, self)
+        if opt.orientation == Qt.Horizontal:
+            length = sr.width()
+            return QRectF(gr.x() + length / 2, 0, gr.width() - length, self.height())
+        length = sr.height()
+        return QRectF(0, gr.y() + length / 2, self.width(), gr.height() - length)
+
+    def _drawHistogram(self, painter, opt):
+        """Draw the histogram along the handle travel, across the widget."""
+        rect = self._travelRect(opt)
+        if rect.width() > 0 and rect.height() > 0:
+            color = self.histogramColor().rgba()
+            self._histogram.paint(painter, rect, self, opt, color)
+
+    def _updateHoveredMarker(self, pos: QPointF, tolerance: float = 4) -> None:
+        """Find the marker within `tolerance` pixels of `pos`."""
+        rect = self._travelRect(self._styleOption)
+        horizontal = self.orientation() == Qt.Horizontal
+        start, length = (
+            (rect.x(), rect.width()) if horizontal else (rect.y(), rect.height())
+        )
+        if length <= 0:
+            return
+        upsideDown = self._styleOption.upsideDown
+
+        def _pixel(frac):
+            return start + (1 - frac if upsideDown else frac) * length
+
+        p = self._pick(pos)
+        frac = (p - start) / length
+        index = self._markers.nearest(
+            self._fractionToValue(1 - frac if upsideDown else frac)
+        )
+        if index >= 0:
+            marker_frac = self._valueToFraction(self._markers.value(index))
+            if not 0 <= marker_frac <= 1 or abs(_pixel(marker_frac) - p) > tolerance:
+                index = -1
+        self._setHoveredMarker(index)
+
+    def _setHoveredMarker(self, index: int) -> None:
+        if index != self._hovered_marker:
+            self._hovered_marker = index
+            self.markerHovered.emit(index)
+
+    def _drawOverview(self, painter, opt):
+        """Draw a strip showing which part of the full range is in view."""
+        gr = self.style().subControlRect(CC_SLIDER, opt, SC_GROOVE, self)
+        full = self._maximum - self._minimum
+        lo, hi = self._viewRange()
+        a, b = (lo - self._minimum) / full, (hi - self._minimum) / full
+        if opt.upsideDown:
+            a, b = 1 - b, 1 - a
+        size = 3
+        if opt.orientation == Qt.Horizontal:
+            strip = QRectF(gr.x(), self.height() - size, gr.width(), size)
+            length = strip.width()
+            view = QRectF(strip.x() + a * length, strip.y(), (b - a) * length, size)
+        else:
+            strip = QRectF(self.width() - size, gr.y(), size, gr.height())
+            length = strip.height()
+            view = QRectF(strip.x(), strip.y() + a * length, size, (b - a) * length)
+        painter.fillRect(strip, opt.palette.color(QtGui.QPalette.Mid))
+        painter.fillRect(view, opt.palette.color(QtGui.QPalette.Highlight))
+
+    def _viewRange(self) -> tuple:
+        return self._view or (self._minimum, self._maximum)
+
+    def _setView(self, lo, hi) -> None:
+        lo, hi = max(lo, self._minimum), min(hi, self._maximum)
+        if hi <= lo or (lo, hi) == (self._minimum, self._maximum):
+            view = None
+        else:
+            view = (lo, hi)
+        if view != self._view:
+            self._view = view
+            self.viewRangeChanged.emit(*self._viewRange())
+            self.update()
+
+    def _isZoomEvent(self, ev) -> bool:
+        mod = self._zoom_modifier
+        return mod is not None and (ev.modifiers() & mod) == mod
+
+    def _zoomWheel(self, ev: QtGui.QWheelEvent) -> None:
+        delta = ev.angleDelta()
+        if ev.inverted():
+            delta = -delta
+        lo, hi = self._viewRange()
+        if delta.x() and not delta.y():
+            # horizontal scrolling pans, a tenth of the view per notch
+            self.panView(-delta.x() / 120 * (hi - lo) / 10)
+            return
+        # zoom around the value under the mouse pointer
+        opt = self._styleOption
+        sr = self.style().subControlRect(CC_SLIDER, opt, SC_HANDLE, self)
+        offset = self._pick(QPoint(sr.width() // 2, sr.height() // 2))
+        center = self._pixelPosToRangeValue(self._pick(_event_positionF(ev)) - offset)
+        self.zoomView(1.25 ** (delta.y() / 120), center)
+
     # from QSliderPrivate.pixelPosToRangeValue
     def _pixelPosToRangeValue(self, pos: int) -> float:
         opt = self._styleOption
@@ -372,14 +1144,18 @@ class _GenericSlider(QSlider, Generic[_T]):
             sliderLength = sr.height()
             sliderMin = gr.y()
             sliderMax = gr.bottom() - sliderLength + 1
-        return _sliderValueFromPosition(
-            self._minimum,
-            self._maximum,
-            pos - sliderMin,
-            sliderMax - sliderMin,
-            opt.upsideDown,
+        if not self._scale.linear:
+            return self._scaledValueFromPosition(
+                pos - sliderMin, sliderMax - sliderMin, opt.upsideDown
+            )
+        return self._valueFromPosition(
+            pos - sliderMin, sliderMax - sliderMin, opt.upsideDown
         )
 
+    def _valueFromPosition(self, position: int, span: int, upsideDown: bool):
+        lo, hi = self._viewRange()
+        return _sliderValueFromPosition(lo, hi, position, span, upsideDown)
+
     def _scrollByDelta(self, orientation, modifiers, delta: int) -> bool:
         steps_to_scroll = 0.0
         pg_step = self._pageStep
@@ -393,7 +1169,8 @@ class _GenericSlider(QSlider, Generic[_T]):
             steps_to_scroll = max(-pg_step, min(pg_step, offset * pg_step))
             self._offset_accum = 0
         elif modifiers & Qt.ControlModifier:
-            _range = self._maximum - self._minimum
+            lo, hi = self._viewRange()
+            _range = hi - lo
             steps_to_scroll = offset * _range * self._control_fraction
             self._offset_accum = 0
         else:
@@ -439,7 +1216,14 @@ class _GenericSlider(QSlider, Generic[_T]):
         )
 
     def _execute_scroll(self, steps_to_scroll, modifiers):
-        self._setPosition(self._bound(self._overflowSafeAdd(steps_to_scroll)))
+        if self._allowed:
+            steps = self._allowedSteps(steps_to_scroll, modifiers)
+            pos = self._stepAllowed([self._value], steps)[0]
+        elif not self._scale.linear:
+            pos = self._scaledAdd(self._value, steps_to_scroll)
+        else:
+            pos = self._overflowSafeAdd(steps_to_scroll)
+        self._setPosition(self._bound(pos))
         self.triggerAction(QSlider.SliderMove)
 
     def _effectiveSingleStep(self) -> float:
@@ -453,8 +1237,33 @@ class _GenericSlider(QSlider, Generic[_T]):
             newValue = self._minimum
         return newValue
 
-    # def keyPressEvent(self, ev: QtGui.QKeyEvent) -> None:
-    #     return  # TODO
+    def keyPressEvent(self, ev: QtGui.QKeyEvent) -> None:
+        # same stepping as the mouse wheel (by index with allowed values)
+        key = ev.key()
+        if key in (Qt.Key_Home, Qt.Key_End):
+            # far enough to reach either end (minimum for Home, as in Qt,
+            # whether or not the controls are inverted)
+            steps = self._maximum - self._minimum
+            if self._allowed:
+                steps = len(self._allowed) * self._singleStep
+            if key == Qt.Key_Home:
+                steps = -steps
+        else:
+            if key in (Qt.Key_Right, Qt.Key_Up):
+                steps = self._singleStep
+            elif key in (Qt.Key_Left, Qt.Key_Down):
+                steps = -self._singleStep
+            elif key == Qt.Key_PageUp:
+                steps = self._pageStep
+            elif key == Qt.Key_PageDown:
+                steps = -self._pageStep
+            else:
+                ev.ignore()
+                return
+            if self.invertedControls():
+                steps = -steps
+        self._execute_scroll(steps, Qt.NoModifier)
+        ev.accept()
 
 
 def _event_position(ev: QEvent) -> QPoint:
@@ -466,6 +1275,12 @@ def _event_position(ev: QEvent) -> QPoint:
     return pos
 
 
+def _event_positionF(ev: QEvent) -> QPointF:
+    # like _event_position, keeping sub-pixel precision where available
+    evp = getattr(ev, "position", getattr(ev, "localPos", None))
+    return QPointF(evp()) if evp else QPointF(_event_position(ev))
+
+
 def _sliderValueFromPosition(
     min: float, max: float, position: int, span: int, upsideDown: bool = False
 ) -> float:
@@ -484,5 +1299,5 @@ def _sliderValueFromPosition(
     if position >= span:
         return min if upsideDown else max
     range = max - min
-    tmp = min + position * range / span
+    tmp = position * range / span
     return max - tmp if upsideDown else tmp + min
@@ -0,0 +1,152 @@
+"""Histogram of a dataset, drawn behind the bar and handles of a slider."""
+import math
+from bisect import bisect_right
+from typing import Callable, List, Optional, Sequence
+
+from ._layers import PixmapLayer
+from .qtcompat.QtCore import QRectF, Qt
+from .qtcompat.QtGui import QColor
+
+# elements binned between checks for cancellation (with numpy)
+_CHUNK = 1 << 20
+
+
+def even_edges(lo: float, hi: float, bins: int) -> List[float]:
+    """`bins + 1` evenly spaced bin edges from `lo` to `hi`."""
+    if bins < 1:
+        raise ValueError("bins must be at least 1")
+    step = (hi - lo) / bins
+    return [lo + i * step for i in range(bins)] + [hi]
+
+
+def bin_data(
+    data,
+    edges: Sequence[float],
+    max_samples: Optional[int] = None,
+    check: Callable[[], None] = lambda: None,
+) -> List[float]:
+    """Count `data` in the bins delimited by `edges` (last bin is closed).
+
+    At most `max_samples` evenly strided elements are binned, and the counts
+    scaled back up.  NumPy arrays (including memmaps) are binned with NumPy,
+    in chunks, calling `check()` between chunks; other sequences are binned
+    in pure python.  Non-finite values and values outside the edges are
+    ignored.
+    """
+    n = _size(data)
+    step = max(1, math.ceil(n / max_samples)) if max_samples else 1
+    if hasattr(data, "__array__") and hasattr(data, "dtype"):
+        return _bin_numpy(data, edges, step, check)
+
+    sample = data[::step] if hasattr(data, "__getitem__") else list(data)[::step]
+    counts = [0] * (len(edges) - 1)
+    lo, hi, last = edges[0], edges[-1], len(counts) - 1
+    for v in sample:
+        if lo <= v <= hi:  # False for nan
+            counts[min(bisect_right(edges, v) - 1, last)] += 1
+    return [c * step for c in counts]
+
+
+def _size(data) -> int:
+    size = getattr(data, "size", None)
+    return size if isinstance(size, int) else len(data)
+
+
+def _strided(arr, step: int):
+    """(view, weight): about one in `step` elements of `arr`, without copying.
+
+    Contiguous arrays are strided over flat; others (e.g. memmap slices)
+    along each axis, from the first, as flattening them would copy them.
+    `weight` is the number of elements each sampled one stands for.
+    """
+    if arr.ndim <= 1 or arr.flags.c_contiguous:
+        return arr.reshape(-1)[::step], step
+    slices = []
+    for dim in arr.shape:
+        s = min(dim, step) or 1
+        slices.append(slice(None, None, s))
+        step = math.ceil(step / s)
+    view = arr[tuple(slices)]
+    return view, arr.size / view.size if view.size else 1
+
+
+def _flat_chunks(arr, size: int):
+    """1-D chunks of about `size` elements of `arr`, in order.
+
+    Non-contiguous arrays are split along their first axis, so that only one
+    chunk at a time is copied to flatten it.
+    """
+    if arr.ndim <= 1 or arr.flags.c_contiguous:
+        flat = arr.reshape(-1)
+        for start in range(0, flat.size, size):
+            yield flat[start : start + size]
+        return
+    row = arr[0].size
+    if row > size:
+        for sub in arr:
+            yield from _flat_chunks(sub, size)
+        return
+    rows = max(1, size // max(row, 1))
+    for start in range(0, len(arr), rows):
+        yield arr[start : start + rows].reshape(-1)
+
+
+def _bin_numpy(data, edges, step, check) -> List[float]:
+    import numpy as np
+
+    sample, weight = _strided(np.asarray(data), step)
+    np_edges = np.asarray(edges, dtype=float)
+    counts = np.zeros(len(edges) - 1, dtype=np.int64)
+    for chunk in _flat_chunks(sample, _CHUNK):
+        check()
+        if chunk.dtype.kind in "fc":
+            chunk = chunk[np.isfinite(chunk)]
+        counts += np.histogram(chunk, bins=np_edges)[0]
+    return (counts * weight).tolist()
+
+
+class Histogram(PixmapLayer):
+    """Counts and bin edges, drawn as bars along the slider."""
+
+    #: subsampling limit for data added to the histogram (see `bin_data`)
+    max_samples: Optional[int] = None
+
+    def __init__(self, counts: Sequence[float], edges: Sequence[float]) -> None:
+        if len(edges) < 2 or len(edges) != len(counts) + 1:
+            raise ValueError("need one more bin edge than counts")
+        super().__init__()
+        self.counts = list(counts)
+        self.edges = list(edges)
+
+    def add(self, counts: Sequence[float]) -> None:
+        """Add counts (binned with the same edges), e.g. for a new chunk."""
+        self.counts = [a + b for a, b in zip(self.counts, counts)]
+        self.invalidate()
+
+    def _draw(self, painter, length, depth, dpr, slider, opt, rgba):
+        top = max(self.counts, default=0)
+        if top <= 0:
+            return
+
+        horizontal = opt.orientation == Qt.Horizontal
+        frac = slider._valueToFraction
+        rects = []
+        edges = self.edges
+        for i, count in enumerate(self.counts):
+            if count <= 0:
+                continue
+            a, b = frac(edges[i]), frac(edges[i + 1])
+            if b <= 0 or a >= 1:
+                continue  # outside of the (zoomed) view
+            a, b = max(a, 0) * length, min(b, 1) * length
+            if opt.upsideDown:
+                a, b = length - b, length - a
+            h = count / top * depth
+            if horizontal:
+                rects.append(QRectF(a, depth - h, max(b - a, 1 / dpr), h))
+            else:
+                rects.append(QRectF(0, a, h, max(b - a, 1 / dpr)))
+
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(QColor.fromRgba(rgba))
+        painter.drawRects(rects)
@@ -0,0 +1,182 @@
+"""Slider selecting many disjoint intervals (e.g. time windows) on one axis."""
+from bisect import bisect_left
+from typing import List, Sequence, Tuple
+
+from ._generic_range_slider import SC_BAR
+from ._generic_slider import SC_HANDLE, SC_NONE
+from ._intervals import Interval, IntervalSet
+from ._sliders import QDoubleRangeSlider
+from .qtcompat.QtCore import QPointF, Signal
+
+
+class QIntervalSlider(QDoubleRangeSlider):
+    """Range slider whose handles delimit disjoint intervals.
+
+    Handles come in (start, end) pairs: `value()` is the flat sequence of
+    interval ends, and only the inside of the intervals is painted.  Dragging
+    the inside of an interval moves it (alone), and dragging a handle resizes
+    it, up to its neighbors.  `addInterval` merges overlapping intervals and
+    `removeInterval` trims or splits them; both locate intervals by
+    bisection, as do hit tests, so thousands of intervals stay responsive.
+    `intervalsChanged` is emitted with the intervals removed and added by
+    each change.
+    """
+
+    # Emitted with the lists of (start, end) intervals removed and added
+    intervalsChanged = Signal(list, list)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._intervals = IntervalSet(zip(self._value[::2], self._value[1::2]))
+
+    # ###############  New Public API  #######################
+
+    def intervals(self) -> List[Interval]:
+        """The selected intervals, as sorted (start, end) tuples."""
+        return list(self._intervals)
+
+    def setIntervals(self, intervals: Sequence[Interval]) -> None:
+        """Replace all intervals (overlapping ones are merged)."""
+        self.setValue(IntervalSet(intervals).flat())
+
+    def addInterval(self, start: float, end: float) -> int:
+        """Add [start, end], merged with any interval it overlaps.
+
+        Returns the index of the resulting interval.
+        """
+        start, end = self._bound(start), self._bound(end)
+        i = self._intervals.overlapping(*sorted((start, end))).start
+        self._spliceHandles(i, *self._intervals.add(start, end))
+        return self._intervals.index(min(start, end))
+
+    def removeInterval(self, start: float, end: float) -> None:
+        """Deselect [start, end], trimming or splitting the intervals there."""
+        start, end = sorted((self._bound(start), self._bound(end)))
+        i = self._intervals.overlapping(start, end).start
+        if i < len(self._intervals) and self._intervals[i][1] == start:
+            i += 1  # only touching: not trimmed
+        self._spliceHandles(i, *self._intervals.remove(start, end))
+
+    def removeIntervalAt(self, index: int) -> None:
+        """Remove the interval at `index`."""
+        index = range(len(self._intervals))[index]
+        self._spliceHandles(index, [self._intervals.pop(index)], [])
+
+    def intervalAt(self, value: float) -> int:
+        """Index of the interval containing `value`, or -1."""
+        return self._intervals.index(value)
+
+    # ###############  QtOverrides  #######################
+
+    def setValue(self, value: Sequence[float]) -> None:
+        """Set the interval ends: [start0, end0, start1, end1, ...]."""
+        if len(value) % 2:
+            raise ValueError("an interval slider needs an even number of values")
+        if any(a >= b for a, b in zip(value, value[1:])):
+            # sort, and merge overlapping intervals
+            value = IntervalSet(zip(value[::2], value[1::2])).flat()
+        super().setValue(value)
+        self._syncIntervals()
+
+    # ###############  Implementation Details  #######################
+
+    def _spliceHandles(
+        self, index: int, removed: List[Interval], added: List[Interval]
+    ) -> None:
+        """Replace the handles of `removed` intervals, from interval `index`.
+
+        For changes already made to the interval set: only the handles of
+        the intervals that changed are touched, and the change is emitted as
+        is, rather than diffing all of the intervals (as `setValue` does).
+        """
+        if not (removed or added):
+            return
+        start, stop = 2 * index, 2 * (index + len(removed))
+        ends = [float(v) for iv in added for v in iv]
+        self._value[start:stop] = ends
+        self._position[start:stop] = ends
+        self.sliderChange(self.SliderChange.SliderValueChange)
+        self._emitValueChanged()
+        if len(removed) == len(added):
+            changed = tuple(range(start, stop))
+            for i in changed:
+                self.handleValueChanged.emit(i, self._value[i])
+        else:
+            # the handles after these are renumbered: reported all at once,
+            # without a signal each (thousands of them, for an early interval)
+            changed = tuple(range(start, len(self._value)))
+        self.valuesChanged.emit(changed)
+        self._updateSelectionCounts()
+        self.intervalsChanged.emit(removed, added)
+
+    def _syncIntervals(self) -> None:
+        """Update the interval set from the handles, and emit what changed."""
+        old = self._intervals
+        new = list(zip(self._value[::2], self._value[1::2]))
+        if len(new) == len(old):
+            changed = [i for i, iv in enumerate(new) if iv != old[i]]
+            removed = [old[i] for i in changed]
+            added = [new[i] for i in changed]
+            for i in changed:
+                old[i] = new[i]
+        else:
+            kept = set(old) & set(new)
+            removed = [iv for iv in old if iv not in kept]
+            added = [iv for iv in new if iv not in kept]
+            self._intervals = IntervalSet.from_flat(self._value)
+        if removed or added:
+            self.intervalsChanged.emit(removed, added)
+
+    def _segmentPalette(self, opt):
+        # paint the inside of the intervals only
+        palette = super()._segmentPalette(opt)
+        if palette is None:
+            palette = [self._style.brush(opt).color(), None]
+        return palette
+
+    def _getControlAtPos(self, pos, opt=None) -> Tuple[object, int]:
+        # bisect instead of testing every handle: O(log n) per mouse move
+        opt = opt or self._styleOption
+        if isinstance(pos, QPointF):
+            pos = pos.toPoint()
+        positions = self._position
+        n = len(positions)
+        if not n:
+            return (SC_NONE, 0)
+        click = self._pixelPosToRangeValue(self._pick(pos))
+        i = bisect_left(positions, click)
+        for j in (i, i - 1, i + 1, i - 2):
+            if 0 <= j < n and self._handleRect(j, opt).contains(pos):
+                return (SC_HANDLE, j)
+        if i % 2 and i < n:
+            return (SC_BAR, i)  # inside the interval ending at handle i
+        if i == 0 or i == n:
+            return (SC_HANDLE, min(i, n - 1))
+        # in a gap: the nearest handle
+        near = i - 1 if click - positions[i - 1] < positions[i] - click else i
+        return (SC_HANDLE, near)
+
+    def _offsetAllPositions(self, offset: float, ref=None) -> None:
+        if self._pressedControl != SC_BAR:
+            super()._offsetAllPositions(offset, ref)
+            return
+        # drag the pressed interval, between its neighbors
+        if ref is None:
+            ref = self._position
+        end = self._pressedIndex
+        start = end - 1
+        step = self.singleStep()
+        lower = ref[start - 1] + step if start > 0 else self._minimum
+        upper = ref[end + 1] - step if end + 1 < len(ref) else self._maximum
+        if self._scale.linear:
+            offset = max(lower - ref[start], min(upper - ref[end], offset))
+            new = (ref[start] + offset, ref[end] + offset)
+        else:
+            # the same distance on screen, in fractions of the view
+            frac = self._valueToFraction
+            lo, hi = self._viewRange()
+            shift = offset / (hi - lo) if hi > lo else 0.0
+            a, b = frac(ref[start]), frac(ref[end])
+            shift = max(frac(lower) - a, min(frac(upper) - b, shift))
+            new = (self._fractionToValue(a + shift), self._fractionToValue(b + shift))
+        self.setHandlePositions({start: new[0], end: new[1]})
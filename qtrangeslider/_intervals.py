@@ -0,0 +1,105 @@
+"""Sorted, disjoint closed intervals on one axis."""
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+Interval = Tuple[float, float]
+
+
+class IntervalSet:
+    """Disjoint closed intervals, kept sorted in two parallel lists.
+
+    Intervals are located by bisection of the starts and ends, in O(log n).
+    Adding an interval merges it with those it overlaps (or touches), and
+    removing a span trims or splits the intervals it covers.  Both return the
+    change as `(removed, added)` lists of intervals.  Updating the lists is a
+    single slice assignment (a memmove, even for thousands of intervals).
+    """
+
+    def __init__(self, intervals: Iterable[Interval] = ()) -> None:
+        self._starts: List[float] = []
+        self._ends: List[float] = []
+        for start, end in intervals:
+            self.add(start, end)
+
+    @classmethod
+    def from_flat(cls, flat: Sequence[float]) -> "IntervalSet":
+        """From [start0, end0, start1, end1, ...], strictly increasing."""
+        new = cls()
+        new._starts, new._ends = list(flat[::2]), list(flat[1::2])
+        return new
+
+    def copy(self) -> "IntervalSet":
+        new = type(self)()
+        new._starts, new._ends = self._starts[:], self._ends[:]
+        return new
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Interval]:
+        return zip(self._starts, self._ends)
+
+    def __getitem__(self, index: int) -> Interval:
+        return self._starts[index], self._ends[index]
+
+    def __setitem__(self, index: int, interval: Interval) -> None:
+        # the caller keeps the set sorted and disjoint
+        self._starts[index], self._ends[index] = interval
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)})"
+
+    def index(self, value: float) -> int:
+        """Index of the interval containing `value`, or -1."""
+        i = bisect_right(self._starts, value) - 1
+        return i if i >= 0 and value <= self._ends[i] else -1
+
+    def overlapping(self, start: float, end: float) -> range:
+        """Indices of the intervals that overlap (or touch) [start, end]."""
+        return range(bisect_left(self._ends, start), bisect_right(self._starts, end))
+
+    def add(self, start: float, end: float) -> Tuple[List[Interval], List[Interval]]:
+        """Add [start, end], merging it with the intervals it overlaps."""
+        if end < start:
+            start, end = end, start
+        hit = self.overlapping(start, end)
+        i, j = hit.start, hit.stop
+        if i < j:
+            start = min(start, self._starts[i])
+            end = max(end, self._ends[j - 1])
+        removed = list(zip(self._starts[i:j], self._ends[i:j]))
+        if removed == [(start, end)]:
+            return [], []  # already covered
+        self._starts[i:j] = [start]
+        self._ends[i:j] = [end]
+        return removed, [(start, end)]
+
+    def remove(self, start: float, end: float) -> Tuple[List[Interval], List[Interval]]:
+        """Remove [start, end] from the set, trimming or splitting intervals."""
+        if end < start:
+            start, end = end, start
+        # only intervals that strictly overlap lose something
+        i = bisect_right(self._ends, start)
+        j = bisect_left(self._starts, end)
+        if i >= j:
+            return [], []
+        removed = list(zip(self._starts[i:j], self._ends[i:j]))
+        added = []
+        if removed[0][0] < start:
+            added.append((removed[0][0], start))
+        if removed[-1][1] > end:
+            added.append((end, removed[-1][1]))
+        self._starts[i:j] = [a for a, _ in added]
+        self._ends[i:j] = [b for _, b in added]
+        return removed, added
+
+    def pop(self, index: int) -> Interval:
+        """Remove and return the interval at `index`."""
+        return self._starts.pop(index), self._ends.pop(index)
+
+    def flat(self) -> List[float]:
+        """[start0, end0, start1, end1, ...]"""
+        out: List[float] = [0.0] * (2 * len(self._starts))
+        out[::2] = self._starts
+        out[1::2] = self._ends
+        return out
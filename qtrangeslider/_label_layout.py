@@ -0,0 +1,101 @@
+"""1-D placement of (handle) labels along the slider axis.
+
+Labels want to be centered on their handle, but may not overlap each other
+and must stay within the widget.  Minimizing the (squared) displacement of
+all labels under those constraints is an isotonic regression problem once
+each label's position is expressed relative to the cumulative length of the
+labels before it, which is solved in linear time by "pool adjacent
+violators".  Sorting the labels makes the whole thing O(n log n).
+
+When the labels simply don't fit, every k-th label is hidden (keeping the
+first and last), with k as small as possible.  If even the first and last
+labels don't fit side by side, only the first is shown.
+"""
+from typing import List, Optional, Sequence
+
+
+def layout_labels(
+    centers: Sequence[float],
+    lengths: Sequence[float],
+    lo: float,
+    hi: float,
+    spacing: float = 0,
+) -> List[Optional[float]]:
+    """Return the start coordinate of each label, or None if it is hidden.
+
+    Parameters
+    ----------
+    centers : Sequence[float]
+        Preferred center of each label along the axis (e.g. handle centers).
+    lengths : Sequence[float]
+        Length of each label along the axis.
+    lo, hi : float
+        Bounds that all visible labels must fit within.
+    spacing : float
+        Minimum gap between two neighboring labels.
+    """
+    n = len(centers)
+    out: List[Optional[float]] = [None] * n
+    if not n:
+        return out
+
+    order = sorted(range(n), key=centers.__getitem__)
+    keep = _visible_subset(order, lengths, hi - lo, spacing)
+    starts = _place(
+        [centers[i] for i in keep], [lengths[i] for i in keep], lo, hi, spacing
+    )
+    for i, start in zip(keep, starts):
+        out[i] = start
+    return out
+
+
+def _visible_subset(order, lengths, available, spacing):
+    """Smallest-stride subset of `order` whose labels fit in `available`.
+
+    The first and last labels are kept, unless they don't fit together: then
+    only the first is.
+    """
+    for stride in range(1, len(order)):
+        keep = order[::stride]
+        if keep[-1] != order[-1]:
+            # always show the last label (in place of the one before it)
+            if len(keep) > 1:
+                keep[-1] = order[-1]
+            else:
+                keep.append(order[-1])
+        total = sum(lengths[i] for i in keep) + spacing * (len(keep) - 1)
+        if total <= available:
+            return keep
+    return order[:1]
+
+
+def _place(centers, lengths, lo, hi, spacing) -> List[float]:
+    """Place labels (sorted by center) without overlap, nearest to centers."""
+    # offset[i] is the minimum distance between the start of label 0 and i
+    offsets = []
+    acc = 0.0
+    for length in lengths:
+        offsets.append(acc)
+        acc += length + spacing
+
+    # with y = start - offset, non-overlap becomes "y is non-decreasing"
+    targets = [c - ln / 2 - off for c, ln, off in zip(centers, lengths, offsets)]
+
+    # pool adjacent violators: blocks of [sum, count]
+    blocks: List[List[float]] = []
+    for t in targets:
+        blocks.append([t, 1])
+        while len(blocks) > 1 and (
+            blocks[-2][0] / blocks[-2][1] > blocks[-1][0] / blocks[-1][1]
+        ):
+            s, c = blocks.pop()
+            blocks[-1][0] += s
+            blocks[-1][1] += c
+
+    # bounds on y are the same for every label, so clipping stays optimal
+    y_max = hi - offsets[-1] - lengths[-1]
+    ys = []
+    for s, c in blocks:
+        y = min(max(s / c, lo), max(y_max, lo))
+        ys.extend([y] * int(c))
+    return [y + off for y, off in zip(ys, offsets)]
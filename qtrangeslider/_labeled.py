@@ -1,22 +1,28 @@
+from collections import OrderedDict
 from enum import IntEnum
 from functools import partial
+from typing import Optional
 
+from ._label_layout import layout_labels
 from ._sliders import QDoubleRangeSlider, QDoubleSlider, QRangeSlider
-from .qtcompat.QtCore import QPoint, QSize, Qt, Signal
+from .qtcompat.QtCore import QEvent, QPoint, QSize, Qt, QTimer, Signal
 from .qtcompat.QtGui import QFontMetrics, QValidator
 from .qtcompat.QtWidgets import (
     QAbstractSlider,
     QApplication,
+    QBoxLayout,
     QDoubleSpinBox,
-    QHBoxLayout,
     QSlider,
     QSpinBox,
     QStyle,
     QStyleOptionSpinBox,
-    QVBoxLayout,
     QWidget,
 )
 
+_NO_ALIGNMENT = Qt.AlignmentFlag(0)
+# minimum gap between neighboring handle labels, in pixels
+_LABEL_SPACING = 4
+
 
 class LabelPosition(IntEnum):
     NoLabel = 0
@@ -122,39 +128,116 @@ class QLabeledSlider(SliderProxy, QAbstractSlider):
         super().__init__(parent)
 
         self._slider = self._slider_class()
-        self._label = SliderLabel(self._slider, connect=self._slider.setValue)
+        # the label and layout are created when first needed (see _build)
+        self._label: Optional[SliderLabel] = None
+        self._decimals = 0
 
         self._slider.rangeChanged.connect(self.rangeChanged.emit)
         self._slider.valueChanged.connect(self.valueChanged.emit)
-        self._slider.valueChanged.connect(self._label.setValue)
+        self._slider.valueChanged.connect(self._on_value_changed)
+        # True when the label missed value changes while the widget was hidden
+        self._label_dirty = False
 
         self.setOrientation(orientation)
 
+    def _build(self):
+        """Create the label and layout, on first show or size request."""
+        if self._label is not None:
+            return
+        self._label = SliderLabel(self._slider, connect=self._on_label_edited)
+        self._label.setDecimals(self._decimals)
+        self._label_dirty = True
+
+        # a single layout is kept, and re-arranged when orientation changes
+        layout = QBoxLayout(QBoxLayout.LeftToRight)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self._slider)
+        layout.addWidget(self._label)
+        self.setLayout(layout)
+        self.setOrientation(self._slider.orientation())
+
+    def event(self, ev: QEvent) -> bool:
+        if ev.type() == QEvent.Polish:
+            self._build()
+        return super().event(ev)
+
+    def sizeHint(self) -> QSize:
+        self._build()
+        return super().sizeHint()
+
+    def minimumSizeHint(self) -> QSize:
+        self._build()
+        return super().minimumSizeHint()
+
     def setOrientation(self, orientation):
         """Set orientation, value will be 'horizontal' or 'vertical'."""
         self._slider.setOrientation(orientation)
+        if self._label is None:
+            return
+        layout: QBoxLayout = self.layout()
         if orientation == Qt.Vertical:
-            layout = QVBoxLayout()
-            layout.addWidget(self._slider, alignment=Qt.AlignHCenter)
-            layout.addWidget(self._label, alignment=Qt.AlignHCenter)
+            layout.setDirection(QBoxLayout.TopToBottom)
+            layout.setAlignment(self._slider, Qt.AlignHCenter)
+            layout.setAlignment(self._label, Qt.AlignHCenter)
             self._label.setAlignment(Qt.AlignCenter)
             layout.setSpacing(1)
         else:
-            layout = QHBoxLayout()
-            layout.addWidget(self._slider)
-            layout.addWidget(self._label)
+            layout.setDirection(QBoxLayout.LeftToRight)
+            layout.setAlignment(self._slider, _NO_ALIGNMENT)
+            layout.setAlignment(self._label, _NO_ALIGNMENT)
             self._label.setAlignment(Qt.AlignRight)
             layout.setSpacing(6)
 
-        old_layout = self.layout()
-        if old_layout is not None:
-            QWidget().setLayout(old_layout)
+    def _on_label_edited(self, value):
+        self._slider.setValue(value)
+        # the slider may have bounded or snapped the typed value
+        self._label.setValue(self._slider.value())
 
-        layout.setContentsMargins(0, 0, 0, 0)
-        self.setLayout(layout)
+    def _on_value_changed(self, v):
+        if not self.isVisible() or self._label is None:
+            # no need to format text for a label nobody can see
+            self._label_dirty = True
+            return
+        self._label.setValue(v)
+
+    def showEvent(self, ev) -> None:
+        if self._label_dirty:
+            self._label_dirty = False
+            self._label.setValue(self._slider.value())
+        super().showEvent(ev)
+
+
+class _FloatResolutionMixin:
+    """Forward value rounding options to a float slider."""
+
+    _slider: QDoubleSlider
+    _quantize_to_decimals = False
+
+    def valueResolution(self) -> float:
+        return self._slider.valueResolution()
+
+    def setValueResolution(self, resolution: float) -> None:
+        """Round values to multiples of `resolution` (see QDoubleSlider)."""
+        self._quantize_to_decimals = False
+        self._slider.setValueResolution(resolution)
+
+    def quantizesToDecimals(self) -> bool:
+        return self._quantize_to_decimals
+
+    def setQuantizeToDecimals(self, val: bool = True) -> None:
+        """Whether to round values to the number of decimals shown in labels.
+
+        When True, moves that don't change the displayed value emit no signals.
+        """
+        self._quantize_to_decimals = bool(val)
+        self._slider.setValueResolution(10 ** -self._decimals if val else 0)
 
+    def _update_resolution(self):
+        if self._quantize_to_decimals:
+            self._slider.setValueResolution(10 ** -self._decimals)
 
-class QLabeledDoubleSlider(QLabeledSlider):
+
+class QLabeledDoubleSlider(_FloatResolutionMixin, QLabeledSlider):
     _slider_class = QDoubleSlider
     _slider: QDoubleSlider
     valueChanged = Signal(float)
@@ -165,14 +248,31 @@ class QLabeledDoubleSlider(QLabeledSlider):
         self.setDecimals(2)
 
     def decimals(self) -> int:
-        return self._label.decimals()
+        return self._decimals
 
     def setDecimals(self, prec: int):
-        self._label.setDecimals(prec)
+        self._decimals = prec
+        if self._label is not None:
+            self._label.setDecimals(prec)
+        self._update_resolution()
+
+    def allowedValues(self):
+        return self._slider.allowedValues()
+
+    def setAllowedValues(self, values) -> None:
+        self._slider.setAllowedValues(values)
+
+    def scale(self):
+        return self._slider.scale()
+
+    def setScale(self, scale) -> None:
+        self._slider.setScale(scale)
 
 
 class QLabeledRangeSlider(SliderProxy, QAbstractSlider):
     valueChanged = Signal(tuple)
+    handleValueChanged = Signal(int, object)
+    valuesChanged = Signal(tuple)
     LabelPosition = LabelPosition
     EdgeLabelMode = EdgeLabelMode
     _slider_class = QRangeSlider
@@ -184,6 +284,10 @@ class QLabeledRangeSlider(SliderProxy, QAbstractSlider):
         self.setAttribute(Qt.WA_ShowWithoutActivating)
         self._handle_labels = []
         self._handle_label_position: LabelPosition = LabelPosition.LabelsAbove
+        self._edge_label_mode = EdgeLabelMode.LabelIsRange
+        self._decimals = 0
+        # True when labels missed updates while the widget was hidden
+        self._labels_dirty = False
 
         # for fine tuning label position
         self.label_shift_x = 0
@@ -191,22 +295,67 @@ class QLabeledRangeSlider(SliderProxy, QAbstractSlider):
 
         self._slider = self._slider_class()
         self._slider.valueChanged.connect(self.valueChanged.emit)
-        self._slider.rangeChanged.connect(self.rangeChanged.emit)
+        self._slider.rangeChanged.connect(self._forward_range_changed)
+        self._slider.handleValueChanged.connect(self.handleValueChanged.emit)
+        self._slider.valuesChanged.connect(self.valuesChanged.emit)
+        self._slider.valueChanged.connect(self._on_value_changed)
+        self._slider.valuesChanged.connect(self._on_values_changed)
+        self._slider.rangeChanged.connect(self._on_range_changed)
+
+        # labels and layout are created when first needed (see _build)
+        self._min_label: Optional[SliderLabel] = None
+        self._max_label: Optional[SliderLabel] = None
+        self.setOrientation(orientation)
+
+    def _build(self):
+        """Create labels and layout, on first show or size request."""
+        if self._min_label is not None:
+            return
+
+        # handle labels are repositioned at most once per event-loop turn
+        self._reposition_timer = QTimer(self)
+        self._reposition_timer.setSingleShot(True)
+        self._reposition_timer.setInterval(0)
+        self._reposition_timer.timeout.connect(self._reposition_labels)
 
-        self._min_label = SliderLabel(
-            self._slider, alignment=Qt.AlignLeft, connect=self._min_label_edited
+        self._min_label = self._makeLabel(
+            alignment=Qt.AlignLeft, connect=self._min_label_edited
         )
-        self._max_label = SliderLabel(
-            self._slider, alignment=Qt.AlignRight, connect=self._max_label_edited
+        self._max_label = self._makeLabel(
+            alignment=Qt.AlignRight, connect=self._max_label_edited
         )
-        self.setEdgeLabelMode(EdgeLabelMode.LabelIsRange)
+        self._min_label.setDecimals(self._decimals)
+        self._max_label.setDecimals(self._decimals)
+
+        # a single layout is kept, and re-arranged when orientation changes.
+        # BottomToTop puts the max label on top for vertical sliders.
+        layout = QBoxLayout(QBoxLayout.LeftToRight)
+        layout.addWidget(self._min_label)
+        layout.addWidget(self._slider)
+        layout.addWidget(self._max_label)
+        self.setLayout(layout)
 
-        self._slider.valueChanged.connect(self._on_value_changed)
-        self._slider.rangeChanged.connect(self._on_range_changed)
+        self.setEdgeLabelMode(self._edge_label_mode)
+        self.setOrientation(self.orientation())
+        # handle labels are created and synced in showEvent
+        self._labels_dirty = True
 
-        self._on_value_changed(self._slider.value())
-        self._on_range_changed(self._slider.minimum(), self._slider.maximum())
-        self.setOrientation(orientation)
+    def _makeLabel(self, *args, **kwargs) -> "SliderLabel":
+        """Create an edge or handle label for the slider."""
+        return SliderLabel(self._slider, *args, **kwargs)
+
+    def event(self, ev: QEvent) -> bool:
+        if ev.type() == QEvent.Polish:
+            self._build()
+        return super().event(ev)
+
+    def sizeHint(self) -> QSize:
+        self._build()
+        return super().sizeHint()
+
+    def minimumSizeHint(self) -> QSize:
+        self._build()
+        return super().minimumSizeHint()
 
     def handleLabelPosition(self) -> LabelPosition:
         return self._handle_label_position
@@ -225,6 +374,8 @@ class QLabeledRangeSlider(SliderProxy, QAbstractSlider):
 
     def setEdgeLabelMode(self, opt: EdgeLabelMode):
         self._edge_label_mode = opt
+        if self._min_label is None:
+            return
         if not self._edge_label_mode:
             self._min_label.hide()
             self._max_label.hide()
@@ -241,19 +392,49 @@ class QLabeledRangeSlider(SliderProxy, QAbstractSlider):
         elif opt == EdgeLabelMode.LabelIsRange:
             self._min_label.setValue(self._slider.minimum())
             self._max_label.setValue(self._slider.maximum())
-        QApplication.processEvents()
-        self._reposition_labels()
+        self._schedule_reposition()
+
+    def _schedule_reposition(self):
+        """Reposition handle labels once the event loop is idle."""
+        self._reposition_timer.start()
 
     def _reposition_labels(self):
-        if not self._handle_labels:
+        self._reposition_timer.stop()
+        if not self._handle_labels or not self._handle_label_position:
             return
+        if not self.isVisible():
+            self._labels_dirty = True
+            return
+
+        # make sure the slider geometry reflects any pending layout changes
+        self.layout().activate()
 
         horizontal = self.orientation() == Qt.Horizontal
         labels_above = self._handle_label_position == LabelPosition.LabelsAbove
 
-        last_edge = None
-        for i, label in enumerate(self._handle_labels):
-            rect = self._slider._handleRect(i)
+        # hidden labels put off resizing: measure them now, before laying
+        # them out by their width (they are shown below)
+        for label in self._handle_labels:
+            if label._size_dirty:
+                label._update_size(force=True)
+
+        # all handle centers, in our coordinates
+        offset = self._slider.pos()
+        centers = [r.center() + offset for r in self._slider._handleRects()]
+        if horizontal:
+            along = [c.x() for c in centers]
+            lengths = [lbl.width() for lbl in self._handle_labels]
+            extent = self.width()
+        else:
+            along = [c.y() for c in centers]
+            lengths = [lbl.height() for lbl in self._handle_labels]
+            extent = self.height()
+        starts = layout_labels(along, lengths, 0, extent, _LABEL_SPACING)
+
+        for label, center, start in zip(self._handle_labels, centers, starts):
+            if start is None:
+                label.hide()
+                continue
             dx = -label.width() / 2
             dy = -label.height() / 2
             if labels_above:
@@ -266,16 +447,13 @@ class QLabeledRangeSlider(SliderProxy, QAbstractSlider):
                     dy *= -1
                 else:
                     dx *= 3
-            pos = self._slider.mapToParent(rect.center())
-            pos += QPoint(int(dx + self.label_shift_x), int(dy + self.label_shift_y))
-            if last_edge is not None:
-                # prevent label overlap
-                if horizontal:
-                    pos.setX(int(max(pos.x(), last_edge.x() + label.width() / 2 + 12)))
-                else:
-                    pos.setY(int(min(pos.y(), last_edge.y() - label.height() / 2 - 4)))
+            if horizontal:
+                pos = QPoint(int(start), int(center.y() + dy))
+            else:
+                pos = QPoint(int(center.x() + dx), int(start))
+            pos += QPoint(int(self.label_shift_x), int(self.label_shift_y))
             label.move(pos)
-            last_edge = pos
+            label.show()
             label.clearFocus()
         self.update()
 
@@ -286,7 +464,8 @@ class QLabeledRangeSlider(SliderProxy, QAbstractSlider):
             v = list(self._slider.value())
             v[0] = val
             self.setValue(v)
-        self._reposition_labels()
+            self._min_label.setValue(self._slider.value()[0])
+        self._schedule_reposition()
 
     def _max_label_edited(self, val):
         if self._edge_label_mode == EdgeLabelMode.LabelIsRange:
@@ -295,9 +474,16 @@ class QLabeledRangeSlider(SliderProxy, QAbstractSlider):
             v = list(self._slider.value())
             v[-1] = val
             self.setValue(v)
-        self._reposition_labels()
+            self._max_label.setValue(self._slider.value()[-1])
+        self._schedule_reposition()
 
     def _on_value_changed(self, v):
+        if not self.isVisible() or self._min_label is None:
+            # value signals are still emitted, but the labels are only
+            # brought up to date when the widget is shown (see showEvent)
+            self._labels_dirty = True
+            return
+
         if self._edge_label_mode == EdgeLabelMode.LabelIsValue:
             self._min_label.setValue(v[0])
             self._max_label.setValue(v[-1])
@@ -308,29 +494,72 @@ class QLabeledRangeSlider(SliderProxy, QAbstractSlider):
                 lbl.deleteLater()
             self._handle_labels.clear()
             for n, val in enumerate(self._slider.value()):
-                _cb = partial(self._slider.setSliderPosition, index=n)
-                s = SliderLabel(self._slider, parent=self, connect=_cb)
+                _cb = partial(self._on_handle_label_edited, n)
+                s = self._makeLabel(parent=self, connect=_cb)
+                s.setDecimals(self._decimals)
                 s.setValue(val)
                 self._handle_labels.append(s)
-        else:
-            for val, label in zip(v, self._handle_labels):
-                label.setValue(val)
-        self._reposition_labels()
+        self._schedule_reposition()
+
+    def _on_handle_label_edited(self, index, value):
+        self._slider.setSliderPosition(value, index=index)
+        # the slider may have bounded or snapped the typed value
+        self._handle_labels[index].setValue(self._slider.sliderPosition()[index])
+
+    def _on_values_changed(self, indices):
+        # only the labels of handles that moved need new text
+        if self._labels_dirty or not self.isVisible():
+            return
+        value = self._slider.value()
+        if len(value) == len(self._handle_labels):
+            for i in indices:
+                self._handle_labels[i].setValue(value[i])
+
+    def _forward_range_changed(self, min, max):
+        # QRangeSlider ranges are floats, but this is QAbstractSlider's int signal
+        self.rangeChanged.emit(int(min), int(max))
 
     def _on_range_changed(self, min, max):
         if (min, max) != (self._slider.minimum(), self._slider.maximum()):
             self._slider.setRange(min, max)
+        if not self.isVisible() or self._min_label is None:
+            self._labels_dirty = True
+            return
         for lbl in self._handle_labels:
             lbl.setRange(min, max)
         if self._edge_label_mode == EdgeLabelMode.LabelIsRange:
             self._min_label.setValue(min)
             self._max_label.setValue(max)
-        self._reposition_labels()
+        self._schedule_reposition()
 
     # def setValue(self, value) -> None:
     #     super().setValue(value)
     #     self.sliderChange(QSlider.SliderValueChange)
 
+    def setHandleValues(self, values, indices=None) -> None:
+        self._slider.setHandleValues(values, indices)
+
+    def setHandlePositions(self, positions, indices=None) -> None:
+        self._slider.setHandlePositions(positions, indices)
+
+    def handleConstraints(self):
+        return self._slider.handleConstraints()
+
+    def setHandleConstraints(self, constraints) -> None:
+        self._slider.setHandleConstraints(constraints)
+
+    def allowedValues(self):
+        return self._slider.allowedValues()
+
+    def setAllowedValues(self, values) -> None:
+        self._slider.setAllowedValues(values)
+
+    def scale(self):
+        return self._slider.scale()
+
+    def setScale(self, scale) -> None:
+        self._slider.setScale(scale)
+
     def setRange(self, min, max) -> None:
         self._on_range_changed(min, max)
 
@@ -338,12 +567,13 @@ class QLabeledRangeSlider(SliderProxy, QAbstractSlider):
         """Set orientation, value will be 'horizontal' or 'vertical'."""
 
         self._slider.setOrientation(orientation)
+        super().setOrientation(orientation)
+        if self._min_label is None:
+            return
+        layout: QBoxLayout = self.layout()
         if orientation == Qt.Vertical:
-            layout = QVBoxLayout()
+            layout.setDirection(QBoxLayout.BottomToTop)
             layout.setSpacing(1)
-            layout.addWidget(self._max_label)
-            layout.addWidget(self._slider)
-            layout.addWidget(self._min_label)
             # TODO: set margins based on label width
             if self._handle_label_position == LabelPosition.LabelsLeft:
                 marg = (30, 0, 0, 0)
@@ -353,7 +583,7 @@ class QLabeledRangeSlider(SliderProxy, QAbstractSlider):
                 marg = (0, 0, 20, 0)
             layout.setAlignment(Qt.AlignCenter)
         else:
-            layout = QHBoxLayout()
+            layout.setDirection(QBoxLayout.LeftToRight)
             layout.setSpacing(7)
             if self._handle_label_position == LabelPosition.LabelsBelow:
                 marg = (0, 0, 0, 25)
@@ -361,27 +591,28 @@ class QLabeledRangeSlider(SliderProxy, QAbstractSlider):
                 marg = (0, 0, 0, 0)
             else:
                 marg = (0, 25, 0, 0)
-            layout.addWidget(self._min_label)
-            layout.addWidget(self._slider)
-            layout.addWidget(self._max_label)
-
-        # remove old layout
-        old_layout = self.layout()
-        if old_layout is not None:
-            QWidget().setLayout(old_layout)
+            layout.setAlignment(_NO_ALIGNMENT)
 
-        self.setLayout(layout)
         layout.setContentsMargins(*marg)
-        super().setOrientation(orientation)
-        QApplication.processEvents()
-        self._reposition_labels()
+        self._schedule_reposition()
 
     def resizeEvent(self, a0) -> None:
         super().resizeEvent(a0)
-        self._reposition_labels()
+        if self._min_label is not None:
+            self._reposition_labels()
+
+    def showEvent(self, ev) -> None:
+        super().showEvent(ev)
+        if self._labels_dirty:
+            self._labels_dirty = False
+            self._on_range_changed(self._slider.minimum(), self._slider.maximum())
+            value = self._slider.value()
+            self._on_value_changed(value)
+            self._on_values_changed(range(len(value)))
+        self._schedule_reposition()
 
 
-class QLabeledDoubleRangeSlider(QLabeledRangeSlider):
+class QLabeledDoubleRangeSlider(_FloatResolutionMixin, QLabeledRangeSlider):
     _slider_class = QDoubleRangeSlider
     _slider: QDoubleRangeSlider
     rangeChanged = Signal(float, float)
@@ -390,14 +621,20 @@ class QLabeledDoubleRangeSlider(QLabeledRangeSlider):
         super().__init__(*args, **kwargs)
         self.setDecimals(2)
 
+    def _forward_range_changed(self, min, max):
+        self.rangeChanged.emit(min, max)
+
     def decimals(self) -> int:
-        return self._min_label.decimals()
+        return self._decimals
 
     def setDecimals(self, prec: int):
-        self._min_label.setDecimals(prec)
-        self._max_label.setDecimals(prec)
+        self._decimals = prec
+        if self._min_label is not None:
+            self._min_label.setDecimals(prec)
+            self._max_label.setDecimals(prec)
         for lbl in self._handle_labels:
             lbl.setDecimals(prec)
+        self._update_resolution()
 
 
 class SliderLabel(QDoubleSpinBox):
@@ -406,6 +643,11 @@ class SliderLabel(QDoubleSpinBox):
     ) -> None:
         super().__init__(parent=parent)
         self._slider = slider
+        self._size_key = None
+        # set when a resize was skipped because the label was hidden
+        self._size_dirty = False
+        self._size_stale = False
+        self.setStyleSheet("background:transparent; border: 0;")
         self.setFocusPolicy(Qt.ClickFocus)
         self.setMode(EdgeLabelMode.LabelIsValue)
         self.setDecimals(0)
@@ -414,7 +656,6 @@ class SliderLabel(QDoubleSpinBox):
         slider.rangeChanged.connect(self._update_size)
         self.setAlignment(alignment)
         self.setButtonSymbols(QSpinBox.NoButtons)
-        self.setStyleSheet("background:transparent; border: 0;")
         if connect is not None:
             self.editingFinished.connect(lambda: connect(self.value()))
         self.editingFinished.connect(self.clearFocus)
@@ -424,29 +665,82 @@ class SliderLabel(QDoubleSpinBox):
         super().setDecimals(prec)
         self._update_size()
 
-    def _update_size(self, *_):
+    def changeEvent(self, ev: QEvent) -> None:
+        super().changeEvent(ev)
+        if ev.type() in (QEvent.FontChange, QEvent.StyleChange):
+            # cached sizes for this font/style may be stale: re-measure
+            if self._size_key is not None or self._size_dirty:
+                self._update_size(refresh=True)
+
+    def showEvent(self, ev) -> None:
+        if self._size_dirty:
+            self._update_size()
+        super().showEvent(ev)
+
+    def sizeHint(self) -> QSize:
+        # a layout may ask for our size before we are shown
+        if self._size_dirty:
+            self._update_size(force=True)
+        return super().sizeHint()
+
+    def _update_size(self, *_, refresh: bool = False, force: bool = False):
+        if not (force or self.isVisible()):
+            self._size_dirty = True
+            self._size_stale |= refresh
+            return
+        refresh |= self._size_stale
+        self._size_dirty = self._size_stale = False
+
+        key = self._sizeKey()
+        if refresh:
+            _SIZE_CACHE.pop(key)
+        size = _SIZE_CACHE.get(key, self._measure_size)
+        if refresh or key != self._size_key:
+            self._size_key = key
+            self.setFixedSize(size)
+
+    def _sizeKey(self) -> tuple:
+        # the size only depends on these, so identical labels (or repeated
+        # updates with the same range) can share one measurement.
+        if self._mode == EdgeLabelMode.LabelIsValue:
+            values = (self.minimum(), self.maximum(), self.specialValueText())
+        else:
+            values = (self.value(),)
+        return (
+            self.font().key(),
+            _style_key(self),
+            self._mode,
+            values,
+            self.prefix(),
+            self.suffix(),
+            self.decimals(),
+        )
+
+    def _extremeTexts(self) -> tuple:
+        # the widest texts the label may show, in LabelIsValue mode
+        return self.textFromValue(self.minimum()), self.textFromValue(self.maximum())
+
+    def _measure_size(self) -> QSize:
         # fontmetrics to measure the width of text
-        fm = QFontMetrics(self.font())
-        h = self.sizeHint().height()
+        font = self.font()
+        fm = QFontMetrics(font)
+        h = super().sizeHint().height()
         fixed_content = self.prefix() + self.suffix() + " "
 
         if self._mode == EdgeLabelMode.LabelIsValue:
             # determine width based on min/max/specialValue
-            mintext = self.textFromValue(self.minimum())[:18] + fixed_content
-            maxtext = self.textFromValue(self.maximum())[:18] + fixed_content
-            w = max(0, _fm_width(fm, mintext))
-            w = max(w, _fm_width(fm, maxtext))
+            texts = [t[:18] + fixed_content for t in self._extremeTexts()]
+            w = max(0, *(_text_width(fm, font, t) for t in texts))
             if self.specialValueText():
-                w = max(w, _fm_width(fm, self.specialValueText()))
+                w = max(w, _text_width(fm, font, self.specialValueText()))
         else:
-            w = max(0, _fm_width(fm, self.textFromValue(self.value()))) + 3
+            w = max(0, _text_width(fm, font, self.textFromValue(self.value()))) + 3
 
         w += 3  # cursor blinking space
         # get the final size hint
         opt = QStyleOptionSpinBox()
         self.initStyleOption(opt)
-        size = self.style().sizeFromContents(QStyle.CT_SpinBox, opt, QSize(w, h), self)
-        self.setFixedSize(size)
+        return self.style().sizeFromContents(QStyle.CT_SpinBox, opt, QSize(w, h), self)
 
     def setValue(self, val):
         super().setValue(val)
@@ -491,3 +785,62 @@ def _fm_width(fm, text):
     if hasattr(fm, "horizontalAdvance"):
         return fm.horizontalAdvance(text)
     return fm.width(text)
+
+
+class _LRUCache:
+    """Tiny least-recently-used cache shared by all SliderLabels."""
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key, factory):
+        """Return cached value for `key`, calling `factory()` on a miss."""
+        try:
+            self._data.move_to_end(key)
+            return self._data[key]
+        except KeyError:
+            val = self._data[key] = factory()
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+            return val
+
+    def pop(self, key) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# (font, text) -> width in pixels
+_WIDTH_CACHE = _LRUCache(4096)
+# (font, style, mode, values, prefix, suffix, decimals) -> final QSize
+_SIZE_CACHE = _LRUCache(1024)
+
+
+def _style_name(style) -> tuple:
+    # not id(style): python wrappers of C++ objects come and go
+    return style.metaObject().className(), style.objectName()
+
+
+def _style_key(widget) -> tuple:
+    """Identifies the style that `widget` is drawn (and measured) with."""
+    style = widget.style()
+    if style.metaObject().className() != "QStyleSheetStyle":
+        return _style_name(style)
+    # widgets with style sheets get their own QStyleSheetStyle, built from
+    # the app's style and the style sheets of the widget, its parents and
+    # the app: those are what identify it.
+    sheets = []
+    while widget is not None:
+        sheets.append(widget.styleSheet())
+        widget = widget.parentWidget()
+    app = QApplication.instance()
+    return (*_style_name(QApplication.style()), app.styleSheet(), *sheets)
+
+
+def _text_width(fm, font, text: str) -> int:
+    return _WIDTH_CACHE.get((font.key(), text), lambda: _fm_width(fm, text))
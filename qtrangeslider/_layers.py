@@ -0,0 +1,60 @@
+"""Layers drawn along the handle travel of a slider, cached as pixmaps."""
+import math
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+from .qtcompat.QtCore import QRectF, Qt
+from .qtcompat.QtGui import QPainter, QPixmap
+
+
+class PixmapLayer(ABC):
+    """Base class for layers (histograms, markers...) drawn behind the handles.
+
+    Subclasses implement `_draw`.  Its result is cached in a pixmap, redrawn
+    only when the size, orientation, range, view or scale of the slider (or
+    the `extra` arguments given to `paint`) change, or after `invalidate`.
+    """
+
+    def __init__(self) -> None:
+        self._cache: Optional[Tuple[tuple, QPixmap]] = None
+
+    def invalidate(self) -> None:
+        """Drop the cached rendering (e.g. after the data changed)."""
+        self._cache = None
+
+    def paint(self, painter: QPainter, rect: QRectF, slider, opt, *extra) -> None:
+        """Draw the layer in `rect`: the full length of handle travel."""
+        dpr = slider.devicePixelRatioF()
+        key = (
+            rect.width(),
+            rect.height(),
+            dpr,
+            opt.orientation,
+            opt.upsideDown,
+            slider._viewRange(),
+            slider._scale,
+            extra,
+        )
+        if self._cache is None or self._cache[0] != key:
+            pixmap = QPixmap(
+                max(1, int(math.ceil(rect.width() * dpr))),
+                max(1, int(math.ceil(rect.height() * dpr))),
+            )
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(Qt.transparent)
+            horizontal = opt.orientation == Qt.Horizontal
+            length = rect.width() if horizontal else rect.height()
+            depth = rect.height() if horizontal else rect.width()
+            p = QPainter(pixmap)
+            self._draw(p, length, depth, dpr, slider, opt, *extra)
+            p.end()
+            self._cache = (key, pixmap)
+        painter.drawPixmap(rect.topLeft(), self._cache[1])
+
+    @abstractmethod
+    def _draw(self, painter: QPainter, length, depth, dpr, slider, opt, *extra):
+        """Draw the layer: `length` along the slider, `depth` across it.
+
+        Positions along the slider are from the start of handle travel (flip
+        them if `opt.upsideDown`), in logical pixels.
+        """
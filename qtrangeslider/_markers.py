@@ -0,0 +1,127 @@
+"""Markers (events, keyframes, bookmarks...) drawn along a slider."""
+import math
+from bisect import bisect_left, bisect_right
+from typing import Dict, Optional, Sequence
+
+from ._layers import PixmapLayer
+from .qtcompat.QtCore import QLineF, Qt
+from .qtcompat.QtGui import QColor, QPen
+
+
+def _numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    return np
+
+
+class Markers(PixmapLayer):
+    """Values to mark along the slider, with optional categories.
+
+    Markers are sorted once, so those in view and the one nearest to a value
+    are found by bisection.  When drawn, markers are binned per device pixel
+    (vectorized, with numpy) and each occupied pixel gets a single line, so
+    100k markers cost as much to draw as the slider has pixels.
+    """
+
+    def __init__(
+        self,
+        values: Sequence[float],
+        categories: Optional[Sequence] = None,
+        colors: Optional[Dict] = None,
+    ) -> None:
+        super().__init__()
+        if categories is not None and len(categories) != len(values):
+            raise ValueError("need one category per marker")
+        self.values = values
+        self.categories = categories
+        self.colors = {k: QColor(v) for k, v in (colors or {}).items()}
+
+        np = _numpy()
+        if np is not None:
+            vals = np.asarray(values)
+            if vals.dtype.kind in "Mm":  # integer nanoseconds, as for datetimes
+                vals = vals.astype(f"{vals.dtype.kind}8[ns]").view("int64")
+            self._order = np.argsort(vals, kind="stable")
+            self._sorted = vals[self._order]
+            self._cats = (
+                np.asarray(categories, dtype=object)[self._order]
+                if categories is not None
+                else None
+            )
+        else:
+            self._order = sorted(range(len(values)), key=values.__getitem__)
+            self._sorted = [values[i] for i in self._order]
+            self._cats = (
+                [categories[i] for i in self._order] if categories is not None else None
+            )
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def nearest(self, value: float) -> int:
+        """Index (in the given values) of the marker nearest to `value`, or -1."""
+        n = len(self._sorted)
+        if not n:
+            return -1
+        i = bisect_left(self._sorted, value)
+        if i == n or (i > 0 and value - self._sorted[i - 1] <= self._sorted[i] - value):
+            i -= 1
+        return int(self._order[i])
+
+    def value(self, index: int):
+        """The value of marker `index` (in the given values)."""
+        return self.values[index]
+
+    def _draw(self, painter, length, depth, dpr, slider, opt, rgba):
+        # the markers in view, as device pixel columns, by category
+        lo, hi = slider._viewRange()
+        a = bisect_left(self._sorted, lo)
+        b = bisect_right(self._sorted, hi)
+        if a >= b:
+            return
+        vals = self._sorted[a:b]
+        cats = self._cats[a:b] if self._cats is not None else None
+        n_px = max(int(math.ceil(length * dpr)), 1)
+        np = _numpy()
+        if np is not None:
+            columns = self._columnsNumpy(np, vals, cats, slider, n_px)
+        else:
+            columns = self._columnsPython(vals, cats, slider, n_px)
+
+        horizontal = opt.orientation == Qt.Horizontal
+        near, far = depth / 4, depth * 3 / 4
+        default = QColor.fromRgba(rgba)
+        for cat, pxs in columns.items():
+            lines = []
+            for px in pxs:
+                p = (n_px - px - 0.5 if opt.upsideDown else px + 0.5) / dpr
+                if horizontal:
+                    lines.append(QLineF(p, near, p, far))
+                else:
+                    lines.append(QLineF(near, p, far, p))
+            painter.setPen(QPen(self.colors.get(cat, default), 0))
+            painter.drawLines(lines)
+
+    def _columnsNumpy(self, np, vals, cats, slider, n_px) -> Dict:
+        if slider._scale.linear:
+            flo, fhi = slider._viewRange()
+            fvals = np.asarray(vals, dtype=float)
+        else:
+            flo, fhi = slider._scaleLimits()
+            fvals = np.asarray(slider._scale.forward_many(vals.tolist()), dtype=float)
+        span = fhi - flo
+        frac = (fvals - flo) / span if span else np.zeros_like(fvals)
+        px = np.clip((frac * n_px).astype(np.int64), 0, n_px - 1)
+        if cats is None:
+            return {None: np.unique(px).tolist()}
+        return {c: np.unique(px[cats == c]).tolist() for c in dict.fromkeys(cats)}
+
+    def _columnsPython(self, vals, cats, slider, n_px) -> Dict:
+        frac = slider._valueToFraction
+        columns: Dict = {}
+        for i, v in enumerate(vals):
+            px = min(max(int(frac(v) * n_px), 0), n_px - 1)
+            columns.setdefault(cats[i] if cats is not None else None, set()).add(px)
+        return columns
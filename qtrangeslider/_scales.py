@@ -0,0 +1,226 @@
+"""Value scales, mapping slider values to a linear "display" space and back.
+
+The slider draws and picks positions in display space, so with a `LogScale`
+each decade gets the same length on screen.  Transforms are plain python
+(numpy is not a dependency): sliders cache the inverse transform for every
+pixel of the groove, so dragging doesn't call it at all.
+"""
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from typing import Callable, Iterable, List, Sequence
+
+from ._sketch import KLLSketch
+
+_TINY = 1e-300
+_MAX_TICKS = 1000
+
+
+class Scale(ABC):
+    """Base class for value scales.
+
+    Subclasses implement `forward` (value -> display) and `inverse`
+    (display -> value), which must be strictly increasing.
+    """
+
+    #: whether forward is the identity (sliders then skip the transforms)
+    linear = False
+
+    @abstractmethod
+    def forward(self, value: float) -> float:
+        """Map a slider value to display space."""
+
+    @abstractmethod
+    def inverse(self, value: float) -> float:
+        """Map a display-space position back to a slider value."""
+
+    def forward_many(self, values: Iterable[float]) -> List[float]:
+        """`forward` applied to each of `values`."""
+        f = self.forward
+        return [f(v) for v in values]
+
+    def inverse_many(self, values: Iterable[float]) -> List[float]:
+        """`inverse` applied to each of `values`."""
+        f = self.inverse
+        return [f(v) for v in values]
+
+    def validate(self, vmin: float, vmax: float) -> None:
+        """Raise ValueError if the scale can't map the range [vmin, vmax]."""
+
+    def ticks(self, vmin: float, vmax: float, interval: float = 0) -> List[float]:
+        """Tick values in [vmin, vmax]: multiples of `interval` by default."""
+        if interval <= 0 or vmax < vmin:
+            return []
+        first = math.ceil(vmin / interval)
+        count = min(int(math.floor(vmax / interval)) - first + 1, _MAX_TICKS)
+        return [(first + i) * interval for i in range(max(count, 0))]
+
+
+class LinearScale(Scale):
+    """The default scale: values are spaced evenly."""
+
+    linear = True
+
+    def forward(self, value: float) -> float:
+        return value
+
+    def inverse(self, value: float) -> float:
+        return value
+
+
+class LogScale(Scale):
+    """Logarithmic scale, for strictly positive ranges."""
+
+    def __init__(self, base: float = 10) -> None:
+        self.base = base
+        self._log_base = math.log(base)
+
+    def forward(self, value: float) -> float:
+        return math.log(max(value, _TINY)) / self._log_base
+
+    def inverse(self, value: float) -> float:
+        return self.base ** value
+
+    def validate(self, vmin: float, vmax: float) -> None:
+        if vmin <= 0:
+            raise ValueError(f"LogScale requires a positive range, got min={vmin}")
+
+    def ticks(self, vmin: float, vmax: float, interval: float = 0) -> List[float]:
+        # one tick per power of the base
+        if vmin <= 0 or vmax < vmin:
+            return []
+        first = math.ceil(self.forward(vmin) - 1e-9)
+        last = math.floor(self.forward(vmax) + 1e-9)
+        return [self.base ** k for k in range(first, min(last, first + _MAX_TICKS) + 1)]
+
+
+class SymLogScale(Scale):
+    """Logarithmic away from zero, linear within `linthresh` of zero."""
+
+    def __init__(self, linthresh: float = 1, base: float = 10) -> None:
+        if linthresh <= 0:
+            raise ValueError("linthresh must be positive")
+        self.linthresh = linthresh
+        self.base = base
+        self._log_base = math.log(base)
+
+    def forward(self, value: float) -> float:
+        return math.copysign(
+            math.log1p(abs(value) / self.linthresh) / self._log_base, value
+        )
+
+    def inverse(self, value: float) -> float:
+        return math.copysign(
+            self.linthresh * math.expm1(abs(value) * self._log_base), value
+        )
+
+    def ticks(self, vmin: float, vmax: float, interval: float = 0) -> List[float]:
+        # zero, and +/- linthresh times each power of the base
+        out = []
+        k = 0
+        while len(out) < _MAX_TICKS:
+            t = self.linthresh * self.base ** k
+            if t > max(abs(vmin), abs(vmax)):
+                break
+            out.extend(x for x in (-t, t) if vmin <= x <= vmax)
+            k += 1
+        if vmin <= 0 <= vmax:
+            out.append(0)
+        return sorted(out)
+
+
+class PowerScale(Scale):
+    """Power-law scale: `sign(x) * |x| ** exponent`."""
+
+    def __init__(self, exponent: float = 0.5) -> None:
+        if exponent <= 0:
+            raise ValueError("exponent must be positive")
+        self.exponent = exponent
+
+    def forward(self, value: float) -> float:
+        return math.copysign(abs(value) ** self.exponent, value)
+
+    def inverse(self, value: float) -> float:
+        return math.copysign(abs(value) ** (1 / self.exponent), value)
+
+
+class PiecewiseLinearScale(Scale):
+    """Linear between breakpoints, each given its own share of the slider.
+
+    `values` and `positions` are increasing sequences of the same length:
+    `values[i]` is displayed at `positions[i]` (in arbitrary units).
+    Values beyond the first/last breakpoints follow the first/last segment.
+    """
+
+    def __init__(self, values: Sequence[float], positions: Sequence[float]) -> None:
+        if len(values) != len(positions) or len(values) < 2:
+            raise ValueError("need at least two breakpoints, as many as positions")
+        for seq in (values, positions):
+            if any(a >= b for a, b in zip(seq, seq[1:])):
+                raise ValueError("breakpoints must be strictly increasing")
+        self.values = list(values)
+        self.positions = list(positions)
+
+    @staticmethod
+    def _interp(x: float, xs: List[float], ys: List[float]) -> float:
+        i = min(max(bisect_right(xs, x), 1), len(xs) - 1)
+        x0, x1, y0, y1 = xs[i - 1], xs[i], ys[i - 1], ys[i]
+        return y0 + (x - x0) * (y1 - y0) / (x1 - x0)
+
+    def forward(self, value: float) -> float:
+        return self._interp(value, self.values, self.positions)
+
+    def inverse(self, value: float) -> float:
+        return self._interp(value, self.positions, self.values)
+
+
+class FunctionScale(Scale):
+    """Scale from a pair of user functions (e.g. `math.sqrt` and `x ** 2`)."""
+
+    def __init__(
+        self,
+        forward: Callable[[float], float],
+        inverse: Callable[[float], float],
+    ) -> None:
+        self._forward = forward
+        self._inverse = inverse
+
+    def forward(self, value: float) -> float:
+        return self._forward(value)
+
+    def inverse(self, value: float) -> float:
+        return self._inverse(value)
+
+
+class QuantileScale(PiecewiseLinearScale):
+    """Equal lengths on screen for equal fractions of the data.
+
+    Built from a `KLLSketch` of the data (so the data may be streamed in
+    chunks, or be larger than memory), or from the data itself (a numpy array
+    or sequence of numbers), which is sketched here.  `resolution` quantiles
+    are used as breakpoints, with linear interpolation between them.  Ticks
+    are drawn at the deciles.
+    """
+
+    def __init__(self, data, resolution: int = 256) -> None:
+        if isinstance(data, KLLSketch):
+            sketch = data
+        else:
+            sketch = KLLSketch()
+            sketch.update_many(data)
+        qs = [i / resolution for i in range(resolution + 1)]
+        values: List[float] = []
+        positions: List[float] = []
+        for q, v in zip(qs, sketch.quantiles(qs)):
+            # tied quantiles share the position of the first of them
+            if not values or v > values[-1]:
+                values.append(v)
+                positions.append(q)
+        if len(values) < 2:
+            raise ValueError("QuantileScale needs data with at least two values")
+        super().__init__(values, positions)
+        self.sketch = sketch
+
+    def ticks(self, vmin: float, vmax: float, interval: float = 0) -> List[float]:
+        deciles = self.sketch.quantiles([i / 10 for i in range(1, 10)])
+        return sorted({v for v in deciles if vmin <= v <= vmax})
@@ -0,0 +1,71 @@
+"""Counting the items of sorted datasets that fall between slider handles."""
+from bisect import bisect_left, bisect_right
+from typing import List, Sequence, Tuple
+
+
+class SortedData:
+    """One or more sorted datasets, counted between values by bisection.
+
+    Each dataset is a sorted numpy array (searched with `searchsorted`) or a
+    sorted sequence of numbers (searched with `bisect`), so counting the items
+    between a few handles takes O(log n), however large the datasets are.
+    """
+
+    def __init__(self, data, assume_sorted: bool = True) -> None:
+        if _is_collection(data):
+            datasets = list(data)
+        else:
+            datasets = [data]
+        self._datasets = [_prepare(d, assume_sorted) for d in datasets]
+
+    def __len__(self) -> int:
+        return sum(len(d) for d in self._datasets)
+
+    def counts(self, values: Sequence[float]) -> Tuple[Tuple[int, ...], int]:
+        """Number of items in each segment between sorted `values`, and in all.
+
+        Segments include their lower end, and the last one also its upper end,
+        so no item is counted twice.
+        """
+        if not values:
+            return (), 0
+        values = list(values)
+        segments = [0] * (len(values) - 1)
+        total = 0
+        for data in self._datasets:
+            idx = _indices(data, values)
+            for i in range(len(segments)):
+                segments[i] += idx[i + 1] - idx[i]
+            total += idx[-1] - idx[0]
+        return tuple(segments), total
+
+
+def _is_collection(data) -> bool:
+    # a list/tuple of datasets, rather than a dataset of numbers
+    return (
+        isinstance(data, (list, tuple))
+        and bool(data)
+        and all(hasattr(d, "__len__") for d in data)
+    )
+
+
+def _prepare(data, assume_sorted: bool):
+    if hasattr(data, "dtype") and hasattr(data, "shape"):
+        import numpy as np
+
+        data = np.ravel(data)
+        if data.dtype.kind == "M":  # compare as integer nanoseconds
+            data = data.astype("datetime64[ns]").view("int64")
+        elif data.dtype.kind == "m":
+            data = data.astype("timedelta64[ns]").view("int64")
+        return data if assume_sorted else np.sort(data)
+    return data if assume_sorted else sorted(data)
+
+
+def _indices(data, values: List[float]) -> List[int]:
+    # left insertion points for all values but the last (right, inclusive)
+    if hasattr(data, "searchsorted"):
+        left = data.searchsorted(values[:-1], side="left").tolist()
+        return left + [int(data.searchsorted(values[-1], side="right"))]
+    idx = [bisect_left(data, v) for v in values[:-1]]
+    return idx + [bisect_right(data, values[-1])]
@@ -0,0 +1,152 @@
+"""A mergeable streaming quantile sketch (KLL), in bounded memory.
+
+Karnin, Lang & Liberty, "Optimal Quantile Approximation in Streams" (2016).
+Items are kept in a stack of "compactors": level `h` holds items standing for
+`2 ** h` data points each.  When a level is full it is sorted, and every other
+item (from a random offset) is promoted to the next level.  Lower levels get
+geometrically smaller capacities, so the sketch keeps O(k log(n / k)) items
+whatever the size of the stream, with a rank error of about 1.7 / k.
+"""
+import random
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Iterable, List, Optional, Sequence
+
+_C = 2 / 3  # capacity ratio between neighboring levels
+
+
+class KLLSketch:
+    """Quantiles of a stream of numbers, in bounded memory.
+
+    Feed data with `update` (one value) or `update_many` (any iterable, or a
+    numpy array, which is sorted by numpy), possibly in many chunks, and
+    combine sketches of separate chunks with `merge`.  NaNs are ignored.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = None) -> None:
+        if k < 8:
+            raise ValueError("k must be at least 8")
+        self.k = k
+        self.count = 0
+        self.min = float("inf")
+        self.max = float("-inf")
+        self._levels: List[List[float]] = [[]]
+        self._size = 0
+        self._random = random.Random(seed)
+        self._sorted: Optional[tuple] = None  # cache of (values, cum. weights)
+
+    def update(self, value: float) -> None:
+        """Add one value."""
+        if value != value:
+            return
+        self._levels[0].append(value)
+        self._added(1, value, value)
+
+    def update_many(self, values: Iterable[float]) -> None:
+        """Add many values: a numpy array (of any shape) or an iterable."""
+        if hasattr(values, "dtype") and hasattr(values, "shape"):
+            import numpy as np
+
+            values = np.ravel(values)
+            if values.dtype.kind == "f":
+                values = values[~np.isnan(values)]
+            if not values.size:
+                return
+            # sorted runs make the compactions' sorts nearly free
+            new = np.sort(values).tolist()
+        else:
+            new = [v for v in values if v == v]
+            if not new:
+                return
+        self._levels[0].extend(new)
+        self._added(len(new), min(new), max(new))
+
+    def merge(self, other: "KLLSketch") -> None:
+        """Add all the data summarized by `other` to this sketch."""
+        while len(self._levels) < len(other._levels):
+            self._levels.append([])
+        for mine, theirs in zip(self._levels, other._levels):
+            mine.extend(theirs)
+        self._size += other._size
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._sorted = None
+        self._compress()
+
+    def __len__(self) -> int:
+        """Number of items retained (not the number of data points)."""
+        return self._size
+
+    def quantile(self, q: float) -> float:
+        """Approximate `q`-quantile (0 <= q <= 1) of the data."""
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: Sequence[float]) -> List[float]:
+        """Approximate quantiles of the data for each of `qs`."""
+        if not self.count:
+            raise ValueError("no data in the sketch")
+        values, cum = self._cumulative()
+        total = cum[-1]
+        out = []
+        for q in qs:
+            if q <= 0:
+                out.append(self.min)
+            elif q >= 1:
+                out.append(self.max)
+            else:
+                i = bisect_right(cum, q * total)
+                out.append(values[min(i, len(values) - 1)])
+        return out
+
+    def rank(self, value: float) -> float:
+        """Approximate fraction of the data that is <= `value`."""
+        if not self.count:
+            raise ValueError("no data in the sketch")
+        values, cum = self._cumulative()
+        i = bisect_right(values, value)
+        return cum[i - 1] / cum[-1] if i else 0.0
+
+    # ###############  Implementation Details  #######################
+
+    def _added(self, n: int, lo: float, hi: float) -> None:
+        self.count += n
+        self._size += n
+        self.min = min(self.min, lo)
+        self.max = max(self.max, hi)
+        self._sorted = None
+        if self._size >= self._capacity_total():
+            self._compress()
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - level - 1
+        return max(2, int(self.k * _C ** depth) + 1)
+
+    def _capacity_total(self) -> int:
+        return sum(self._capacity(h) for h in range(len(self._levels)))
+
+    def _compress(self) -> None:
+        # compact the lowest full level until everything fits
+        while self._size >= self._capacity_total():
+            for h, items in enumerate(self._levels):
+                if len(items) >= self._capacity(h):
+                    break
+            if h + 1 == len(self._levels):
+                self._levels.append([])
+            items.sort()
+            # an odd item out stays at this level
+            keep = [items.pop()] if len(items) % 2 else []
+            promoted = items[self._random.getrandbits(1) :: 2]
+            self._levels[h + 1].extend(promoted)
+            self._size -= len(items) - len(promoted)
+            self._levels[h] = keep
+
+    def _cumulative(self):
+        if self._sorted is None:
+            weighted = sorted(
+                (v, 1 << h) for h, items in enumerate(self._levels) for v in items
+            )
+            values = [v for v, _ in weighted]
+            cum = list(accumulate(w for _, w in weighted))
+            self._sorted = (values, cum)
+        return self._sorted
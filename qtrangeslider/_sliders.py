@@ -1,3 +1,5 @@
+import math
+
 from ._generic_range_slider import _GenericRangeSlider
 from ._generic_slider import _GenericSlider
 from .qtcompat.QtCore import Signal
@@ -12,15 +14,106 @@ class _IntMixin:
         return int(round(value))
 
 
+class _ExactIntMixin:
+    """Integer model that never goes through float.
+
+    Values, range and steps are python ints (numpy integers are converted),
+    so even nanosecond timestamps (~1.7e18, beyond the 2**53 integers a
+    float holds exactly) round-trip exactly.  Mouse positions are mapped to
+    values with exact rational arithmetic.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._minimum = 0
+        self._maximum = 99
+        self._singleStep = 1
+        self._pageStep = 10
+        self._value = self._type_cast(self._value)
+        self._position = self._type_cast(self._position)
+
+    def _type_cast(self, value):
+        if isinstance(value, (list, tuple)):
+            return type(value)(self._type_cast(v) for v in value)
+        if isinstance(value, int):
+            return value
+        if isinstance(value, float):
+            return int(round(value))
+        # numpy integers, Fraction, Decimal...
+        return int(round(value)) if hasattr(value, "__round__") else int(value)
+
+    def _range_cast(self, value) -> int:
+        return self._type_cast(value)
+
+    def setMinimum(self, min) -> None:
+        # cast first: the limit is compared with the (int) maximum
+        super().setMinimum(self._range_cast(min))
+
+    def setMaximum(self, max) -> None:
+        super().setMaximum(self._range_cast(max))
+
+    def setSingleStep(self, step) -> None:
+        super().setSingleStep(max(1, self._type_cast(step)))
+
+    def setPageStep(self, step) -> None:
+        super().setPageStep(max(1, self._type_cast(step)))
+
+    def _valueFromPosition(self, position, span, upsideDown):
+        # like _sliderValueFromPosition, rounded to the nearest integer
+        lo, hi = self._viewRange()
+        position, span = int(round(position)), int(span)
+        if span <= 0 or position <= 0:
+            return hi if upsideDown else lo
+        if position >= span:
+            return lo if upsideDown else hi
+        tmp = (2 * position * (hi - lo) + span) // (2 * span)
+        return hi - tmp if upsideDown else lo + tmp
+
+    def _overflowSafeAdd(self, add):
+        # python ints don't overflow, but must not be added to a float
+        return self._value + self._type_cast(add)
+
+
 class _FloatMixin:
     def __init__(self, *args, **kwargs):
+        self._resolution = 0.0
+        self._ndigits = 0
         super().__init__(*args, **kwargs)
         self._singleStep = 0.01
         self._pageStep = 0.1
 
+    def valueResolution(self) -> float:
+        """Resolution that values are rounded to (0 means no rounding)."""
+        return self._resolution
+
+    def setValueResolution(self, resolution: float) -> None:
+        """Round values to multiples of `resolution` before comparing/emitting.
+
+        Moves that don't change the rounded value emit no signals.  The
+        minimum and maximum are always reachable.  Use 0 to disable rounding.
+        """
+        self._resolution = max(0.0, float(resolution or 0))
+        if self._resolution:
+            # number of digits that removes floating point noise from k * res
+            self._ndigits = 6 - math.floor(math.log10(self._resolution))
+        self.setValue(self._value)
+
     def _type_cast(self, value) -> float:
         return float(value)
 
+    def _quantize(self, value: float) -> float:
+        if self._resolution:
+            # limits that aren't multiples of the resolution stay reachable
+            half = self._resolution / 2
+            if value - self._minimum <= half:
+                return self._minimum
+            if self._maximum - value <= half:
+                return self._maximum
+            value = round(value / self._resolution) * self._resolution
+            value = round(value, self._ndigits)
+            value = min(max(value, self._minimum), self._maximum)
+        return value
+
 
 class QDoubleSlider(_FloatMixin, _GenericSlider[float]):
     pass
@@ -35,6 +128,26 @@ class QRangeSlider(_IntMixin, _GenericRangeSlider):
     pass
 
 
+class QInt64Slider(_ExactIntMixin, _GenericSlider[int]):
+    """Integer slider that is exact for any range (e.g. ns timestamps)."""
+
+    valueChanged = Signal(object)
+    sliderMoved = Signal(object)
+    rangeChanged = Signal(object, object)
+
+
+class QInt64RangeSlider(_ExactIntMixin, _GenericRangeSlider):
+    """Integer range slider that is exact for any range (e.g. ns timestamps)."""
+
+    rangeChanged = Signal(object, object)
+
+    def sliderPosition(self):
+        return tuple(self._position)
+
+    def _offsetAllPositions(self, offset, ref=None) -> None:
+        super()._offsetAllPositions(self._type_cast(offset), ref)
+
+
 class QDoubleRangeSlider(_FloatMixin, QRangeSlider):
     pass
 
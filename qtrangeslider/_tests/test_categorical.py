@@ -0,0 +1,113 @@
+from collections.abc import Sequence
+
+import pytest
+
+from qtrangeslider import QCategoricalRangeSlider, QLabeledCategoricalRangeSlider
+from qtrangeslider._categorical_slider import decimate
+from qtrangeslider.qtcompat.QtCore import Qt
+
+
+class _Names(Sequence):
+    """Category names, made (and counted) on access."""
+
+    def __init__(self, n):
+        self.n = n
+        self.accessed = set()
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.n))]
+        if not -self.n <= i < self.n:
+            raise IndexError(i)
+        self.accessed.add(i % self.n)
+        return f"cat_{i % self.n}"
+
+
+def test_decimate():
+    measured = []
+
+    def extent(i):
+        measured.append(i)
+        return 40
+
+    picked = decimate(0, 49_999, 500, extent)
+    assert picked == list(range(0, 50_000, 5000))
+    assert len(measured) < 100
+    # aligned on the stride when panned, and spaced apart
+    assert decimate(12, 99, 1000, lambda i: 40) == list(range(15, 100, 5))
+    assert decimate(3, 3, 100, extent) == [3]
+    assert decimate(5, 3, 100, extent) == []
+    # a long label missed by the sample widens the stride
+    wide = decimate(0, 999, 1000, lambda i: 200 if i == 500 else 10)
+    assert wide == [0, 200, 400, 600, 800]
+
+
+def test_categorical_slider(qtbot):
+    sld = QCategoricalRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    names = _Names(50_000)
+    sld.setCategories(names)
+    assert (sld.minimum(), sld.maximum()) == (0, 49_999)
+    assert not names.accessed
+
+    sld.resize(600, sld.sizeHint().height())
+    sld.show()
+    qtbot.waitExposed(sld)
+    sld.repaint()
+    labels = [text for _, text in sld._tickLabels(sld._styleOption)]
+    assert labels[0] == "cat_0"
+    assert 2 < len(labels) < 30
+    assert len(names.accessed) < 100
+
+    sld.setValue((10, 40_000))
+    assert sld.categoryValue() == ("cat_10", "cat_40000")
+    sld.setCategoryValue(("cat_5", "cat_7"))
+    assert sld.value() == (5, 7)
+    with pytest.raises(ValueError):
+        sld.setCategoryValue(("cat_5", "nope"))
+
+    # zooming shows the categories in view
+    sld.setViewRange(100, 200)
+    labels = [text for _, text in sld._tickLabels(sld._styleOption)]
+    assert labels[0] == "cat_100" and labels[-1] == "cat_200"
+
+
+def test_few_categories(qtbot):
+    sld = QCategoricalRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    assert sld.categoryValue() == ()
+    assert sld.indexOf("a") == -1
+
+    # fewer categories than the default value: all of them are selected
+    sld.setCategories([1, 2, 3, 4, 5])
+    assert sld.value() == (0, 4)
+    assert sld.categoryValue() == (1, 5)
+    assert sld.indexOf("3") == sld.indexOf(3) == 2
+    sld.setCategories(["x", "y"])
+    assert sld.categoryValue() == ("x", "y")
+    assert sld.indexOf("3") == -1
+
+
+def test_labeled_categorical_slider(qtbot):
+    sld = QLabeledCategoricalRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.setCategories(["apple", "banana", "cherry", "durian"])
+    sld.setValue((1, 2))
+    sld.show()
+    qtbot.waitExposed(sld)
+    assert sld._min_label.text() == "apple"
+    assert sld._max_label.text() == "durian"
+    assert [lbl.text() for lbl in sld._handle_labels] == ["banana", "cherry"]
+
+    # handle labels accept category names
+    lbl = sld._handle_labels[0]
+    assert lbl.valueFromText("apple") == 0
+    sld._on_handle_label_edited(0, lbl.valueFromText("apple"))
+    assert sld.categoryValue() == ("apple", "cherry")
+
+    sld.setCategories(["w", "x", "y", "z"])
+    assert sld._min_label.text() == "w"
+    assert [lbl.text() for lbl in sld._handle_labels] == ["w", "z"]
@@ -0,0 +1,115 @@
+import pytest
+
+from qtrangeslider import HandleConstraints, QDoubleRangeSlider
+from qtrangeslider._constraints import drag, project
+
+
+def test_project_gaps_and_bounds():
+    c = HandleConstraints(min_gap=10, max_gap=30, bounds=[(None, None), (20, 50)])
+    assert project([0, 0, 0], c, 0, 100, 1) == [0, 20, 30]
+    assert project([0, 90, 95], c, 0, 100, 1) == [0, 30, 60]
+
+
+def test_project_keeps_groups_rigid():
+    c = HandleConstraints(groups=[(1, 2)])
+    current = [0, 10, 20, 30]
+    # the group follows the member moved furthest, keeping its width
+    assert project([0, 12, 20, 30], c, 0, 100, 1, current) == [0, 12, 22, 30]
+    assert project([0, 5, 26, 40], c, 0, 100, 1, current) == [0, 16, 26, 40]
+    # ... within the range, pushing the handles after it
+    assert project([0, 10, 99, 99], c, 0, 100, 1, current) == [0, 89, 99, 100]
+    # without the current positions, handles are clipped one at a time
+    assert project([0, 12, 20, 30], c, 0, 100, 1) == [0, 12, 20, 30]
+
+
+def test_drag_stops_at_neighbors():
+    c = HandleConstraints(min_gap=5)
+    assert drag([10, 20, 30], 1, 40, c, 0, 100, 1) == [10, 25, 30]
+    assert drag([10, 20, 30], 1, 0, c, 0, 100, 1) == [10, 15, 30]
+
+
+def test_drag_push():
+    c = HandleConstraints(min_gap=5, push=True)
+    assert drag([10, 20, 30], 0, 40, c, 0, 100, 1) == [40, 45, 50]
+    # pushed neighbors limit the drag at the edge of the range
+    assert drag([10, 20, 30], 0, 99, c, 0, 100, 1) == [90, 95, 100]
+    # with max_gap, neighbors are pulled along
+    c = HandleConstraints(min_gap=5, max_gap=10, push=True)
+    assert drag([10, 20, 30], 2, 50, c, 0, 100, 1) == [30, 40, 50]
+
+
+def test_drag_groups():
+    c = HandleConstraints(groups=[(1, 2)], push=True)
+    assert drag([0, 10, 20, 30], 1, 15, c, 0, 100, 1) == [0, 15, 25, 30]
+    assert drag([0, 10, 20, 30], 2, 40, c, 0, 100, 1) == [0, 30, 40, 41]
+    c = HandleConstraints(groups=[(1, 2)])
+    assert drag([0, 10, 20, 30], 1, 15, c, 0, 100, 1) == [0, 15, 25, 30]
+    assert drag([0, 10, 20, 30], 1, 40, c, 0, 100, 1) == [0, 19, 29, 30]
+
+
+def test_overlapping_groups():
+    with pytest.raises(ValueError):
+        HandleConstraints(groups=[(0, 2), (2, 3)])
+
+
+def test_min_gap_exceeds_max_gap():
+    with pytest.raises(ValueError):
+        HandleConstraints(min_gap=10, max_gap=5)
+    with pytest.raises(ValueError):
+        HandleConstraints(min_gap=[1, 10], max_gap=[None, 5])
+    HandleConstraints(min_gap=[1, 5], max_gap=5)
+
+
+def test_slider_constraints(qtbot):
+    sld = QDoubleRangeSlider()
+    qtbot.addWidget(sld)
+    sld.setRange(0, 100)
+    sld.setValue([10, 20, 30])
+    sld.setHandleConstraints(HandleConstraints(min_gap=15, push=True))
+    assert sld.value() == (10, 25, 40)
+
+    sld.setSliderPosition(50, 0)
+    assert sld.value() == (50, 65, 80)
+    sld.setValue([0, 0, 0])
+    assert sld.value() == (0, 15, 30)
+
+    sld.setHandleConstraints(None)
+    sld.setValue([0, 0, 0])
+    assert sld.value() == (0, 0, 0)
+
+
+def test_slider_groups_stay_rigid(qtbot):
+    sld = QDoubleRangeSlider()
+    qtbot.addWidget(sld)
+    sld.setRange(0, 100)
+    sld.setValue([10, 20, 30, 40])
+    sld.setHandleConstraints(HandleConstraints(groups=[(1, 2)]))
+    sld.setHandleValues({1: 50})
+    assert sld.value() == (10, 50, 60, 60.01)
+    sld.setValue([10, 20, 25, 90])
+    assert sld.value() == (10, 15, 25, 90)
+
+
+def test_rigid_offset(qtbot):
+    sld = QDoubleRangeSlider()
+    qtbot.addWidget(sld)
+    sld.setRange(0, 100)
+    sld.setValue([20, 50, 60])
+    sld._offsetAllPositions(60)
+    assert sld.sliderPosition() == (60, 90, 100)
+    sld._offsetAllPositions(-200)
+    assert sld.sliderPosition() == (0, 30, 40)
+
+
+def test_rigid_spread(qtbot):
+    sld = QDoubleRangeSlider()
+    qtbot.addWidget(sld)
+    sld.setRange(0, 100)
+    sld.setValue([40, 90])
+    sld._spreadAllPositions(gain=2)
+    # capped so that both handles stay in range, keeping the center
+    assert sld.sliderPosition() == (30, 100)
+    sld.setBarIsRigid(False)
+    sld.setValue([40, 60])
+    sld._spreadAllPositions(gain=2)
+    assert sld.sliderPosition() == (30, 70)
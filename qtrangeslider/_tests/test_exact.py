@@ -0,0 +1,96 @@
+import datetime
+
+import pytest
+
+from qtrangeslider import QDatetimeRangeSlider, QInt64RangeSlider, QInt64Slider
+from qtrangeslider.qtcompat.QtCore import Qt
+
+NS = 1_700_000_000_123_456_789  # beyond float precision
+
+
+def test_int64_slider(qtbot):
+    sld = QInt64Slider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.setRange(NS, NS + 10 ** 12)
+    assert sld.minimum() == NS
+    assert isinstance(sld.minimum(), int)
+    with qtbot.waitSignal(sld.valueChanged) as blocker:
+        sld.setValue(NS + 1)
+    assert sld.value() == NS + 1
+    assert blocker.args == [NS + 1]
+
+    # exact at the ends and in between
+    assert sld._valueFromPosition(0, 1000, False) == NS
+    assert sld._valueFromPosition(1000, 1000, False) == NS + 10 ** 12
+    assert sld._valueFromPosition(1, 3, False) == NS + 333_333_333_333
+    assert sld._valueFromPosition(1, 3, True) == NS + 10 ** 12 - 333_333_333_333
+
+    sld.setSingleStep(7)
+    sld._execute_scroll(7, Qt.NoModifier)
+    assert sld.value() == NS + 8
+
+
+def test_int64_range_slider(qtbot):
+    sld = QInt64RangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.setRange(NS, NS + 100)
+    sld.setValue((NS + 3, NS + 50))
+    assert sld.value() == (NS + 3, NS + 50)
+    sld._offsetAllPositions(2.4)
+    assert sld.sliderPosition() == (NS + 5, NS + 52)
+    sld._offsetAllPositions(1000)
+    assert sld.value() == (NS + 53, NS + 100)
+
+
+def test_datetime_range_slider(qtbot):
+    sld = QDatetimeRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    start = datetime.datetime(2020, 1, 1)
+    sld.setRange(start, datetime.datetime(2024, 1, 1))
+    sld.setValue((NS, start + datetime.timedelta(days=1)))
+    assert sld.value() == (NS, 1577923200 * 10 ** 9)
+    sld.setSingleStep(datetime.timedelta(microseconds=1))
+    assert sld.singleStep() == 1000
+
+    np = pytest.importorskip("numpy")
+    lo = np.datetime64("2021-06-01T00:00:00.000000001")
+    sld.setValue((lo, lo + np.timedelta64(1, "D")))
+    assert sld.datetimeValue() == (lo, lo + np.timedelta64(1, "D"))
+    assert sld.datetimeRange()[0] == np.datetime64("2020-01-01", "ns")
+    with pytest.raises(ValueError):
+        sld.setValue((np.datetime64("NaT"), lo))
+
+    # limits may be set one at a time, too
+    sld.setMaximum(datetime.datetime(2025, 1, 1))
+    sld.setMinimum(start - datetime.timedelta(days=1))
+    assert (sld.minimum(), sld.maximum()) == (
+        (1577836800 - 86400) * 10 ** 9,
+        1735689600 * 10 ** 9,
+    )
+
+
+def test_zoomed_view_is_exact(qtbot):
+    sld = QInt64RangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.setRange(NS, NS + 10 ** 12)
+    assert not sld.isZoomed()
+    with qtbot.waitSignal(sld.viewRangeChanged) as blocker:
+        sld.setViewRange(NS + 5 * 10 ** 11, NS + 5 * 10 ** 11 + 1000)
+    assert blocker.args == [NS + 5 * 10 ** 11, NS + 5 * 10 ** 11 + 1000]
+    assert sld.isZoomed()
+    # one pixel now covers a few values, not a few billion
+    assert sld._valueFromPosition(500, 1000, False) == NS + 5 * 10 ** 11 + 500
+
+    sld.zoomView(2)
+    assert sld.viewRange() == (NS + 5 * 10 ** 11 + 250, NS + 5 * 10 ** 11 + 750)
+    sld.panView(-10 ** 15)
+    assert sld.viewRange() == (NS, NS + 500)
+    sld.zoomView(1e-12)
+    assert not sld.isZoomed()
+
+    sld.setViewRange(NS + 100, NS + 200)
+    sld.setZoomModifier()
+    sld.show()
+    sld.grab()  # draws the overview strip
+    sld.resetViewRange()
+    assert sld.viewRange() == (NS, NS + 10 ** 12)
@@ -122,3 +122,66 @@ def test_signals(ds, qtbot):
 
     with qtbot.waitSignal(ds.rangeChanged):
         ds.setRange(1.2, 3.3)
+
+
+def test_value_resolution(ds, qtbot):
+    ds.setRange(0, 1)
+    ds.setValue((0.2, 0.5))
+    ds.setValueResolution(0.1)
+    assert ds.valueResolution() == 0.1
+
+    with qtbot.waitSignal(ds.valueChanged):
+        ds.setValue((0.33, 0.73))
+    ds.assert_val_eq((0.3, 0.7))
+
+    # moves below the resolution emit nothing
+    with qtbot.assertNotEmitted(ds.valueChanged):
+        ds.setValue((0.28, 0.68))
+        ds.setValue((0.31, 0.7))
+    ds.assert_val_eq((0.3, 0.7))
+
+    ds.setValueResolution(0)
+    ds.setValue((0.33, 0.73))
+    ds.assert_val_eq((0.33, 0.73))
+
+
+def test_value_resolution_keeps_handles_apart(qtbot):
+    sld = QDoubleRangeSlider()
+    qtbot.addWidget(sld)
+    sld.setRange(0, 1)
+    sld.setValueResolution(0.1)
+    sld.setValue((0.2, 0.5))
+    # rounding 0.49 up to 0.5 mustn't put the handle on its neighbor
+    sld.setSliderPosition(0.49, index=0)
+    assert sld.sliderPosition()[0] < sld.sliderPosition()[1] == 0.5
+
+
+def test_value_resolution_reaches_limits(qtbot):
+    sld = QDoubleSlider()
+    qtbot.addWidget(sld)
+    sld.setRange(0, 1.004)
+    sld.setValueResolution(0.01)
+    sld.setValue(1.004)
+    assert sld.value() == 1.004
+    sld.setValue(0.5049)
+    assert sld.value() == 0.5
+
+    rsld = QDoubleRangeSlider()
+    qtbot.addWidget(rsld)
+    rsld.setRange(0.003, 1.004)
+    rsld.setValueResolution(0.01)
+    rsld.setValue((0.004, 1.001))
+    assert rsld.value() == (0.003, 1.004)
+
+
+@pytest.mark.parametrize("cls", [QLabeledDoubleSlider, QLabeledDoubleRangeSlider])
+def test_quantize_to_decimals(cls, qtbot):
+    wdg = cls()
+    qtbot.addWidget(wdg)
+    wdg.setQuantizeToDecimals()
+    assert wdg.quantizesToDecimals()
+    assert wdg.valueResolution() == 0.01
+    wdg.setDecimals(1)
+    assert wdg.valueResolution() == 0.1
+    wdg.setValueResolution(0.5)
+    assert not wdg.quantizesToDecimals()
@@ -70,6 +70,61 @@ def test_ticks(gslider: _GenericSlider, qtbot):
     gslider.show()
 
 
+def test_native_ticks(gslider: _GenericSlider, qtbot):
+    gslider.setTickPosition(gslider.TicksBelow)
+    gslider.setTickInterval(10)
+    gslider.resize(500, 500)
+    gslider.show()
+    opt = gslider._styleOption
+    # the style draws plain ticks, as for a QSlider ...
+    assert not gslider._needsTickLayer(opt)
+    gslider.grab()
+    assert gslider._ticks._cache is None
+    # ... but not crowded ones, nor ticks it can't draw
+    gslider.setTickInterval(0.1)
+    assert gslider._needsTickLayer(opt)
+    gslider.setTickInterval(10)
+    gslider.setMinorTickInterval(5)
+    assert gslider._needsTickLayer(opt)
+    gslider.setMinorTickInterval(0)
+    gslider.setTickValues([1, 2, 3])
+    assert gslider._needsTickLayer(opt)
+
+
+def test_tick_decimation(gslider: _GenericSlider, qtbot):
+    gslider.setRange(0, 1_000_000)
+    gslider.setTickInterval(1)
+    gslider.setMinorTickInterval(0.5)
+    gslider.setTickPosition(gslider.TicksBothSides)
+    gslider.resize(500, 500)
+    gslider.show()
+    ticks = gslider._ticks
+
+    # a multiple of the interval (by 1, 2, 5, 10...) is used: never 1M ticks
+    major = ticks._positions(gslider, None, 1, 400, 4)
+    assert len(major) == 101
+    assert major[1] - major[0] == pytest.approx(4)
+    assert ticks._positions(gslider, None, None, 400, 4) == []
+    gslider.grab()
+    pixmap = ticks._cache[1]
+    gslider.grab()
+    assert ticks._cache[1] is pixmap  # cached per geometry
+    gslider.setMinimumTickSpacing(10)
+    gslider.grab()
+    assert ticks._cache[1] is not pixmap
+
+    # explicit, uneven ticks are thinned out by bisection
+    gslider.setTickValues([1, 10, 100, 1000, 10_000] + list(range(0, 10**6, 7)))
+    assert gslider.tickValues()[1] == []
+    assert len(gslider.tickValues()[0]) == 142_863
+    major = ticks._positions(gslider, ticks.major, 0, 400, 10)
+    assert 35 < len(major) <= 41
+    assert all(b - a >= 10 - 1e-6 for a, b in zip(major, major[1:]))
+    gslider.grab()
+    gslider.setTickValues(None)
+    assert gslider.tickValues() is None
+
+
 def test_show(gslider, qtbot):
     gslider.show()
 
@@ -155,3 +210,103 @@ def test_slider_extremes(gslider: _GenericSlider, mag, qtbot):
         gslider.setValue(i)
         assert math.isclose(gslider.value(), i, rel_tol=1e-8)
         gslider.initStyleOption(QStyleOptionSlider())
+
+
+def test_value_callbacks(gslider: _GenericSlider):
+    values = []
+    gslider.addValueCallback(values.append)
+    gslider.setValue(10)
+    gslider.setValue(20)
+    assert values == [10, 20]
+
+    gslider.removeValueCallback(values.append)
+    gslider.setValue(30)
+    assert values == [10, 20]
+    with pytest.raises(ValueError):
+        gslider.removeValueCallback(values.append)
+
+
+def test_value_callbacks_weak_and_dedupe(gslider: _GenericSlider):
+    class Listener:
+        def __init__(self):
+            self.values = []
+
+        def __call__(self, value):
+            self.values.append(value)
+
+        def method(self, value):
+            self.values.append(value)
+
+    listener, deduped = Listener(), Listener()
+    gslider.addValueCallback(listener.method, weak=True)
+    gslider.addValueCallback(deduped, dedupe=True)
+    gslider.setValue(10)
+    assert listener.values == [10]
+
+    del listener
+    gslider.setValue(20)
+    assert len(gslider._value_callbacks) == 1
+
+    # with tracking off, resetting the value re-emits it (moving the position)
+    gslider.setTracking(False)
+    gslider.setSliderPosition(30)
+    values = []
+    gslider.addValueCallback(values.append)
+    gslider.setValue(20)
+    assert values == [20]
+    # ... but it's skipped for deduped callbacks
+    assert deduped.values == [10, 20]
+
+
+def test_move_callbacks(gslider: _GenericSlider):
+    positions = []
+    gslider.addMoveCallback(positions.append)
+    gslider.setSliderDown(True)
+    gslider.setSliderPosition(10)
+    assert positions == [10]
+
+
+def test_allowed_values(gslider: _GenericSlider, qtbot):
+    allowed = [0, 1, 2, 10, 50, 51, 200]
+    gslider.setAllowedValues(allowed)
+    gslider.setValue(7)
+    assert gslider.value() == 10
+    gslider.setValue(30)
+    assert gslider.value() == 10  # ties snap down
+    gslider.setValue(99)
+    assert gslider.value() == 51  # 200 is out of range
+    gslider.setSliderPosition(1.4)
+    assert gslider.value() == 1
+
+    # the wheel and keyboard step through allowed values by index
+    gslider.setValue(10)
+    gslider.wheelEvent(_wheel_event(120))
+    assert gslider.value() == 51  # 3 lines per notch, stopping at the maximum
+    gslider.setValue(10)
+    qtbot.keyClick(gslider, Qt.Key_Right)
+    assert gslider.value() == 50
+    qtbot.keyClick(gslider, Qt.Key_End)
+    assert gslider.value() == 51
+    qtbot.keyClick(gslider, Qt.Key_Home)
+    assert gslider.value() == 0
+
+    # inverted controls flip the arrows, but Home/End still go to min/max
+    gslider.setInvertedControls(True)
+    gslider.setValue(10)
+    qtbot.keyClick(gslider, Qt.Key_Right)
+    assert gslider.value() == 2
+    qtbot.keyClick(gslider, Qt.Key_End)
+    assert gslider.value() == 51
+    qtbot.keyClick(gslider, Qt.Key_Home)
+    assert gslider.value() == 0
+
+    gslider.setAllowedValues(None)
+    gslider.setValue(7)
+    assert gslider.value() == 7
+
+
+def test_allowed_values_large(gslider: _GenericSlider):
+    gslider.setRange(0, 10 ** 6)
+    gslider.setAllowedValues(range(0, 10 ** 6, 3))
+    gslider.setValue(500_000)
+    assert gslider.value() == 500_001
@@ -0,0 +1,113 @@
+import pytest
+
+from qtrangeslider import QDoubleRangeSlider
+from qtrangeslider._histogram import bin_data, even_edges
+from qtrangeslider.qtcompat.QtCore import QPointF, Qt
+from qtrangeslider.qtcompat.QtWidgets import QStyleOptionSlider
+
+
+def test_bin_data():
+    edges = even_edges(0, 4, 4)
+    assert edges == [0, 1, 2, 3, 4]
+    data = [0, 0.5, 1, 3.5, 4, 5, -1, float("nan")]
+    assert bin_data(data, edges) == [2, 1, 0, 2]
+    # every other element, counts doubled
+    assert bin_data(data, edges, max_samples=4) == [2, 2, 0, 2]
+
+    np = pytest.importorskip("numpy")
+    arr = np.array(data)
+    assert bin_data(arr, edges) == [2, 1, 0, 2]
+    assert bin_data(arr.reshape(2, 4), edges, max_samples=4) == [2, 2, 0, 2]
+    # non-contiguous arrays are sampled along each axis (not flattened)
+    assert bin_data(arr.reshape(2, 4).T, edges) == [2, 1, 0, 2]
+    assert bin_data(arr.reshape(4, 2).T, edges, max_samples=4) == [2, 2, 0, 2]
+
+
+def test_histogram(qtbot):
+    sld = QDoubleRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.setRange(0, 10)
+    sld.resize(300, 40)
+    sld.show()
+    assert sld.histogram() is None
+    with pytest.raises(RuntimeError):
+        sld.addHistogramData([1, 2])
+
+    with qtbot.waitSignal(sld.histogramChanged):
+        sld.setHistogram([1, 1, 2, 9.5], bins=10)
+    assert sld.histogram() == ([0, 2, 1, 0, 0, 0, 0, 0, 0, 1], even_edges(0, 10, 10))
+    with qtbot.waitSignal(sld.histogramChanged):
+        sld.addHistogramData([9])
+    assert sld.histogram()[0][-1] == 2
+
+    # a new histogram drops results of the previous one
+    sld.setHistogram([1] * 1000, bins=2)
+    sld.setHistogram([9], bins=2)
+    qtbot.waitUntil(lambda: sld._histogram_jobs.pending() == 0)
+    assert sld.histogram()[0] == [0, 1]
+
+    # bad data is warned about (on the GUI thread) instead of aborting
+    with pytest.warns(RuntimeWarning, match="histogram"):
+        sld.setHistogram([1, 2, "x"], bins=2)
+        qtbot.waitUntil(lambda: sld._histogram_jobs.pending() == 0)
+    assert sld.histogram()[0] == [0, 0]
+
+    sld.setHistogramCounts([1, 2, 3])
+    assert sld.histogram() == ([1, 2, 3], [0, 10 / 3, 20 / 3, 10])
+    sld.repaint()
+    cached = sld._histogram._cache
+    sld.repaint()
+    assert sld._histogram._cache is cached
+    sld.setViewRange(2, 8)
+    sld.repaint()
+    assert sld._histogram._cache is not cached
+
+    sld.setHistogram(None)
+    assert sld.histogram() is None
+    sld.repaint()
+
+
+def test_markers(qtbot):
+    sld = QDoubleRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.setRange(0, 100)
+    sld.resize(300, 40)
+    sld.show()
+    assert sld.markers() is None
+    assert sld.nearestMarker(5) == -1
+
+    with pytest.raises(ValueError):
+        sld.setMarkers([1, 2], categories=["a"])
+    sld.setMarkers([50, 10, 90, 10.5], ["a", "b", "a", "b"], {"a": "red"})
+    assert len(sld.markers()) == 4
+    # indices refer to the given (unsorted) values
+    assert sld.nearestMarker(0) == 1
+    assert sld.nearestMarker(11) == 3
+    assert sld.nearestMarker(60) == 0
+    assert sld.nearestMarker(1000) == 2
+
+    sld.repaint()
+    cached = sld.markers()._cache
+    sld.repaint()
+    assert sld.markers()._cache is cached
+
+    # hovering reports the marker under the mouse
+    opt = QStyleOptionSlider()
+    sld.initStyleOption(opt)
+    rect = sld._travelRect(opt)
+    x = rect.x() + rect.width() * 0.9
+    with qtbot.waitSignal(sld.markerHovered) as blocker:
+        sld._updateHoveredMarker(QPointF(x, 20))
+    assert blocker.args == [2]
+    with qtbot.waitSignal(sld.markerHovered) as blocker:
+        sld._updateHoveredMarker(QPointF(x - 30, 20))
+    assert blocker.args == [-1]
+
+    np = pytest.importorskip("numpy")
+    values = np.random.default_rng(0).uniform(0, 100, 200_000)
+    sld.setMarkers(values, categories=values > 50)
+    assert values[sld.nearestMarker(33.3)] == pytest.approx(33.3, abs=0.01)
+    sld.setViewRange(20, 30)
+    sld.repaint()
+    sld.setMarkers(None)
+    assert sld.markers() is None
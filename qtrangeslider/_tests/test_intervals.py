@@ -0,0 +1,98 @@
+import pytest
+
+from qtrangeslider import IntervalSet, QIntervalSlider
+from qtrangeslider._generic_range_slider import SC_BAR
+from qtrangeslider.qtcompat.QtCore import QPoint, Qt
+from qtrangeslider.qtcompat.QtWidgets import QStyleOptionSlider
+
+
+def test_interval_set():
+    ivs = IntervalSet([(10, 20), (30, 40), (50, 60)])
+    assert ivs.index(15) == 0
+    assert ivs.index(25) == -1
+    assert ivs.index(60) == 2
+    assert list(ivs.overlapping(20, 35)) == [0, 1]
+
+    # merge on overlap (and touch)
+    assert ivs.add(18, 30) == ([(10, 20), (30, 40)], [(10, 40)])
+    assert list(ivs) == [(10, 40), (50, 60)]
+    assert ivs.add(12, 14) == ([], [])  # already covered
+    assert ivs.add(70, 65) == ([], [(65, 70)])
+
+    # removal trims and splits
+    assert ivs.remove(20, 30) == ([(10, 40)], [(10, 20), (30, 40)])
+    assert ivs.remove(35, 67) == (
+        [(30, 40), (50, 60), (65, 70)],
+        [(30, 35), (67, 70)],
+    )
+    assert ivs.remove(0, 5) == ([], [])
+    assert ivs.flat() == [10, 20, 30, 35, 67, 70]
+    assert ivs.pop(1) == (30, 35)
+    assert len(ivs) == 2
+
+
+def test_interval_slider(qtbot):
+    sld = QIntervalSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.setRange(0, 100)
+    assert sld.intervals() == [(20, 80)]
+    with pytest.raises(ValueError):
+        sld.setValue([1, 2, 3])
+
+    with qtbot.waitSignal(sld.intervalsChanged) as blocker:
+        sld.setIntervals([(50, 60), (10, 20), (55, 70)])
+    assert blocker.args == [[(20, 80)], [(10, 20), (50, 70)]]
+    assert sld.value() == (10, 20, 50, 70)
+
+    with qtbot.waitSignal(sld.intervalsChanged) as blocker:
+        assert sld.addInterval(65, 90) == 1
+    assert blocker.args == [[(50, 70)], [(50, 90)]]
+    with qtbot.waitSignal(sld.intervalsChanged) as blocker:
+        sld.removeInterval(60, 70)
+    assert blocker.args == [[(50, 90)], [(50, 60), (70, 90)]]
+    assert sld.intervalAt(75) == 2
+    assert sld.intervalAt(65) == -1
+
+    # dragging a handle reports the one interval that changed
+    with qtbot.waitSignal(sld.intervalsChanged) as blocker:
+        sld.setSliderPosition(25, index=1)
+    assert blocker.args == [[(10, 20)], [(10, 25)]]
+    with qtbot.waitSignal(sld.valuesChanged) as blocker:
+        sld.removeIntervalAt(0)
+    assert blocker.args == [(0, 1, 2, 3)]  # the handles after it shift
+    assert sld.intervals() == [(50, 60), (70, 90)]
+    assert sld.value() == sld.sliderPosition() == (50, 60, 70, 90)
+    # touching the end of an interval doesn't trim it
+    with qtbot.assertNotEmitted(sld.intervalsChanged):
+        sld.removeInterval(60, 70)
+        sld.addInterval(52, 58)
+
+    # the inside of an interval is dragged alone, up to its neighbors
+    sld.resize(400, 30)
+    sld.show()
+    opt = QStyleOptionSlider()
+    sld.initStyleOption(opt)
+    x = sld._handleCentersF(opt)[2] + 20  # inside (70, 90)
+    control, index = sld._getControlAtPos(QPoint(int(x), 15), opt)
+    assert (control, index) == (SC_BAR, 3)
+    sld._pressedControl, sld._pressedIndex = control, index
+    sld._offsetAllPositions(-30, sld._position)
+    assert sld.intervals()[0] == (50, 60)
+    assert sld.intervals()[1] == pytest.approx((60.01, 80.01))
+    sld._offsetAllPositions(30, sld._position)
+    assert sld.intervals()[1] == pytest.approx((80, 100))
+
+    # without any interval, nothing is drawn over the groove
+    sld.setIntervals([])
+    assert sld.value() == ()
+    sld.grab()
+    sld.addInterval(10, 20)
+    sld.removeIntervalAt(0)
+    sld.grab()
+
+    # thousands of intervals
+    sld.setRange(0, 5000)
+    sld.setIntervals([(i, i + 0.5) for i in range(5000)])
+    assert len(sld.intervals()) == 5000
+    assert sld.intervalAt(1234.25) == 1234
+    sld.repaint()
@@ -0,0 +1,42 @@
+import random
+
+from qtrangeslider._label_layout import layout_labels
+
+
+def _assert_no_overlap(starts, lengths, lo, hi, spacing):
+    shown = sorted((s, ln) for s, ln in zip(starts, lengths) if s is not None)
+    for (s0, l0), (s1, _) in zip(shown, shown[1:]):
+        assert s1 >= s0 + l0 + spacing - 1e-9
+    assert shown[0][0] >= lo
+    assert shown[-1][0] + shown[-1][1] <= hi + 1e-9
+
+
+def test_layout_labels_no_collision():
+    # labels that fit stay centered on their handle
+    assert layout_labels([20, 50, 80], [10, 10, 10], 0, 100) == [15, 45, 75]
+    # colliding labels are spread symmetrically around their mean
+    assert layout_labels([50, 50], [10, 10], 0, 100, 2) == [39, 51]
+    # and are kept within bounds
+    assert layout_labels([99, 100], [10, 10], 0, 100, 2) == [78, 90]
+    assert layout_labels([], [], 0, 100) == []
+
+
+def test_layout_labels_unsorted_centers():
+    # e.g. vertical sliders, where higher values are closer to the top
+    starts = layout_labels([60, 50, 40], [20, 20, 20], 0, 100)
+    assert starts[0] > starts[1] > starts[2]
+    _assert_no_overlap(starts, [20] * 3, 0, 100, 0)
+
+
+def test_layout_labels_hides_when_full():
+    n = 1000
+    centers = sorted(random.uniform(0, 300) for _ in range(n))
+    lengths = [random.randint(10, 30) for _ in range(n)]
+    starts = layout_labels(centers, lengths, 0, 300, 4)
+    assert starts[0] is not None and starts[-1] is not None
+    assert None in starts
+    _assert_no_overlap(starts, lengths, 0, 300, 4)
+
+
+def test_layout_labels_first_only_when_two_dont_fit():
+    assert layout_labels([10, 20, 90], [60, 60, 60], 0, 100) == [0, None, None]
@@ -0,0 +1,193 @@
+from qtrangeslider import (
+    QLabeledDoubleRangeSlider,
+    QLabeledDoubleSlider,
+    QLabeledSlider,
+)
+from qtrangeslider._labeled import _SIZE_CACHE, _WIDTH_CACHE, EdgeLabelMode
+from qtrangeslider.qtcompat.QtCore import Qt
+from qtrangeslider.qtcompat.QtGui import QFont
+from qtrangeslider.qtcompat.QtWidgets import QWidget
+
+
+def test_label_size_cache(qtbot):
+    _SIZE_CACHE.clear()
+    _WIDTH_CACHE.clear()
+    sld = QLabeledDoubleRangeSlider()
+    qtbot.addWidget(sld)
+    sld2 = QLabeledDoubleRangeSlider()
+    qtbot.addWidget(sld2)
+    sld.show()
+    sld2.show()
+    assert sld._min_label.size() == sld2._min_label.size()
+
+    # identical range updates don't re-measure
+    n_sizes, n_widths = len(_SIZE_CACHE), len(_WIDTH_CACHE)
+    for _ in range(5):
+        sld.setRange(0, 99)
+        sld.setValue((10, 20))
+    assert (len(_SIZE_CACHE), len(_WIDTH_CACHE)) == (n_sizes, n_widths)
+
+    sld.setEdgeLabelMode(EdgeLabelMode.LabelIsValue)
+    sld.setRange(0, 123456)
+    assert len(_SIZE_CACHE) > n_sizes
+
+
+def test_label_size_cache_font_change(qtbot):
+    sld = QLabeledDoubleRangeSlider()
+    qtbot.addWidget(sld)
+    sld.setRange(0, 100000)
+    sld.show()
+    lbl = sld._max_label
+    before = lbl.width()
+    font = QFont(lbl.font())
+    font.setPointSize(font.pointSize() * 3)
+    lbl.setFont(font)
+    assert lbl.width() > before
+
+
+def test_relayout_reuses_layout(qtbot):
+    sld = QLabeledDoubleRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.sizeHint()  # builds labels and layout
+    layout = sld.layout()
+    sld.setOrientation(Qt.Vertical)
+    sld.setEdgeLabelMode(EdgeLabelMode.LabelIsValue)
+    assert sld.layout() is layout
+    assert sld._reposition_timer.isActive()
+
+    sld.show()
+    qtbot.waitUntil(lambda: not sld._reposition_timer.isActive())
+    # the max label sits on top when vertical
+    assert sld._max_label.y() < sld._slider.y() < sld._min_label.y()
+    # the upper handle's label is above the lower handle's label
+    lo, hi = sld._handle_labels
+    assert hi.y() < lo.y()
+
+
+def test_many_handle_labels_stay_inside(qtbot):
+    sld = QLabeledDoubleRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.resize(300, 80)
+    sld.setValue([i * 2 for i in range(40)])
+    sld.show()
+    qtbot.waitUntil(lambda: not sld._reposition_timer.isActive())
+    shown = [lbl for lbl in sld._handle_labels if lbl.isVisible()]
+    assert 1 < len(shown) < 40
+    for lbl in shown:
+        assert lbl.x() >= 0 and lbl.geometry().right() < sld.width()
+
+
+def test_handle_labels_centered_when_first_shown(qtbot):
+    sld = QLabeledDoubleRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.resize(600, 80)
+    sld.setValue((10, 50, 90))
+    sld.show()
+    qtbot.waitUntil(lambda: not sld._reposition_timer.isActive())
+    offset = sld._slider.pos().x()
+    handles = [r.center().x() + offset for r in sld._slider._handleRects()]
+    labels = [lbl.geometry().center().x() for lbl in sld._handle_labels]
+    assert all(abs(a - b) <= 2 for a, b in zip(labels, handles))
+
+
+def test_hidden_sliders_skip_label_work(qtbot):
+    sld = QLabeledDoubleRangeSlider()
+    qtbot.addWidget(sld)
+    sld.show()
+    qtbot.waitUntil(lambda: len(sld._handle_labels) == 2)
+    sld.hide()
+
+    with qtbot.waitSignal(sld.valueChanged):
+        sld.setValue((30, 40))
+    sld.setRange(10, 50)
+    # labels are stale while hidden ...
+    assert [lbl.value() for lbl in sld._handle_labels] != [30, 40]
+    assert sld._labels_dirty
+
+    # ... and caught up when shown
+    sld.show()
+    assert [lbl.value() for lbl in sld._handle_labels] == [30, 40]
+    assert (sld._min_label.value(), sld._max_label.value()) == (10, 50)
+    assert not sld._labels_dirty
+
+
+def test_hidden_labeled_slider(qtbot):
+    sld = QLabeledSlider()
+    qtbot.addWidget(sld)
+    sld.setValue(42)
+    assert sld.value() == 42
+    assert sld._label_dirty
+    sld.show()
+    assert sld._label.value() == 42
+
+
+def test_lazy_construction(qtbot):
+    sld = QLabeledDoubleRangeSlider()
+    qtbot.addWidget(sld)
+    sld.setDecimals(3)
+    sld.setEdgeLabelMode(EdgeLabelMode.LabelIsValue)
+    sld.setValue((1.5, 2.5))
+    # nothing is built before it's needed
+    assert sld._min_label is None and sld.layout() is None
+    assert sld._slider._style_dirty
+    assert sld.decimals() == 3
+
+    sld.show()
+    assert sld.layout() is not None
+    assert sld._min_label.decimals() == 3
+    assert sld._min_label.value() == 1.5
+    assert [lbl.value() for lbl in sld._handle_labels] == [1.5, 2.5]
+    assert all(lbl.decimals() == 3 for lbl in sld._handle_labels)
+
+    sld2 = QLabeledSlider()
+    qtbot.addWidget(sld2)
+    assert sld2._label is None
+    assert sld2.sizeHint().isValid()
+    assert sld2._label is not None
+
+
+def test_labeled_handle_signals(qtbot):
+    sld = QLabeledDoubleRangeSlider()
+    qtbot.addWidget(sld)
+    sld.show()
+    sld.setValue((10, 20, 30))
+    with qtbot.waitSignals([sld.valuesChanged, sld.handleValueChanged]):
+        sld.setValue((10, 25, 30))
+    assert [lbl.value() for lbl in sld._handle_labels] == [10, 25, 30]
+
+
+def test_typed_values_snap(qtbot):
+    sld = QLabeledDoubleSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.show()
+    sld.setAllowedValues([0, 10, 20])
+    sld.setValue(10)
+    sld._label.setValue(12)
+    sld._label.editingFinished.emit()
+    assert sld.value() == 10
+    assert sld._label.value() == 10
+
+    rsld = QLabeledDoubleRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(rsld)
+    rsld.show()
+    rsld.setAllowedValues([0, 10, 20, 30, 40, 50])
+    assert rsld.value() == (20, 50)
+    rsld._handle_labels[0].setValue(33)
+    rsld._handle_labels[0].editingFinished.emit()
+    assert rsld.value() == (30, 50)
+    assert rsld._handle_labels[0].value() == 30
+
+
+def test_label_size_cache_parent_style_sheet(qtbot):
+    parents, sliders = [], []
+    for sheet in ("QDoubleSpinBox { padding: 0 30px; }", ""):
+        parents.append(QWidget())
+        parents[-1].setStyleSheet(sheet)
+        qtbot.addWidget(parents[-1])
+        sliders.append(QLabeledDoubleRangeSlider(parents[-1]))
+        parents[-1].show()
+    for sld in sliders:
+        sld.setRange(0, 123457)
+    # labels under different parent style sheets don't share a cached size
+    big, small = (sld._max_label.width() for sld in sliders)
+    assert big > small
@@ -154,3 +154,233 @@ def test_wheel(gslider: QRangeSlider, qtbot):
         gslider.wheelEvent(_wheel_event(120))
 
     gslider.wheelEvent(_wheel_event(0))
+
+
+def test_handle_signals(gslider: QRangeSlider, qtbot):
+    gslider.setValue((10, 20, 30, 40))
+    handles = []
+    gslider.handleValueChanged.connect(lambda i, v: handles.append((i, v)))
+    with qtbot.waitSignal(gslider.valuesChanged) as blocker:
+        gslider.setValue((10, 25, 30, 45))
+    assert blocker.args == [(1, 3)]
+    assert handles == [(1, 25), (3, 45)]
+
+    handles.clear()
+    with qtbot.waitSignal(gslider.valuesChanged) as blocker:
+        gslider.setSliderPosition(35, index=2)
+    assert blocker.args == [(2,)]
+    assert handles == [(2, 35)]
+
+    # changing the number of handles reports all of them
+    with qtbot.waitSignal(gslider.valuesChanged) as blocker:
+        gslider.setValue((1, 2))
+    assert blocker.args == [(0, 1)]
+
+    with qtbot.assertNotEmitted(gslider.valuesChanged):
+        gslider.setValue((1, 2))
+
+
+def test_bulk_handle_values(gslider: QRangeSlider, qtbot):
+    gslider.setValue([10, 20, 30, 40, 50])
+    values = []
+    moves = []
+    gslider.valueChanged.connect(values.append)
+    gslider.sliderMoved.connect(moves.append)
+
+    gslider.setHandleValues({1: 22, 3: 44})
+    assert gslider.value() == (10, 22, 30, 44, 50)
+    gslider.setHandleValues([5, 55], indices=[0, 4])
+    assert gslider.value() == (5, 22, 30, 44, 55)
+    assert len(values) == 2
+
+    gslider.setSliderDown(True)
+    gslider.setHandlePositions({2: 33, 3: 45})
+    assert gslider.sliderPosition() == (5, 22, 33, 45, 55)
+    assert len(moves) == 1
+    assert len(values) == 3
+
+    with pytest.raises(ValueError):
+        gslider.setHandleValues([1, 2], indices=[0])
+
+
+def test_allowed_values(gslider: QRangeSlider, qtbot):
+    gslider.setAllowedValues([0, 5, 10, 20, 40, 80])
+    assert gslider.value() == (20, 80)
+    gslider.setValue((12, 33))
+    assert gslider.value() == (10, 40)
+
+    # dragging onto a neighbor stops one allowed value short of it
+    gslider.setSliderPosition(60, index=0)
+    assert gslider.value() == (20, 40)
+
+    # the wheel moves all handles by index, stopping at the ends
+    gslider._execute_scroll(gslider.singleStep(), Qt.NoModifier)
+    assert gslider.value() == (40, 80)
+    gslider._execute_scroll(gslider.singleStep(), Qt.NoModifier)
+    assert gslider.value() == (40, 80)
+    gslider._execute_scroll(-10 * gslider.singleStep(), Qt.NoModifier)
+    assert gslider.value() == (0, 5)
+
+
+def test_display_resolution_tracks_size(qtbot):
+    sld = QRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.setRange(0, 100_000)
+    sld.resize(8000, 30)
+    opt = sld._styleOption
+    # one integer step per device pixel of travel, even beyond 5000 pixels
+    assert sld.MAX_DISPLAY < opt.maximum < sld.width() * sld.devicePixelRatioF()
+
+    # handles move by a pixel when the value moves by a pixel's worth
+    sld.setValue((0, 50_000))
+    x = sld._handleRect(1).x()
+    sld.setValue((0, 50_000 + 100_000 / opt.maximum))
+    assert sld._handleRect(1).x() == x + 1
+
+    # the bar ends exactly at the (sub-pixel) handle centers
+    low, high = sld._handleCentersF(opt)
+    bar = sld._barRect(opt)
+    assert (bar.left(), bar.right()) == (low, high)
+
+
+def test_bar_colormap(gslider: QRangeSlider, qtbot):
+    with pytest.raises(ValueError):
+        gslider.setBarColormap([])
+    gslider.setBarColormap(["red", (0, 255, 0), "#0000ff"])
+    cmap = gslider.barColormap()
+    assert cmap.size == 3
+    assert cmap.first().name() == "#ff0000"
+    assert cmap.last().name() == "#0000ff"
+
+    vertical = gslider.orientation() == Qt.Vertical
+    image = cmap.image(vertical, False)
+    assert (image.width(), image.height())[vertical] == 3
+    assert image.pixelColor(0, 0).name() == "#ff0000"
+    image = cmap.image(vertical, True)
+    assert image.pixelColor(0, 0).name() == "#0000ff"
+
+    # the image is built once, and reused while the handles move
+    gslider.show()
+    gslider.repaint()
+    before = cmap._image
+    gslider.setValue((30, 40))
+    gslider.repaint()
+    assert cmap._image is before
+
+    np = pytest.importorskip("numpy")
+    gslider.setBarColormap(np.array([[1.0, 0, 0], [0, 0, 0.5]]), fill_groove=True)
+    assert gslider.barColormap().last().getRgb() == (0, 0, 128, 255)
+    gslider.setBarColormap(np.zeros((256, 4), dtype=np.uint8))
+    assert gslider.barColormap().size == 256
+    gslider.repaint()
+    gslider.setBarColormap(None)
+    assert gslider.barColormap() is None
+
+
+def test_selection_counts(qtbot):
+    sld = QDoubleRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.setRange(0, 10)
+    sld.setValue((2, 5, 8))
+    assert sld.selectionCounts() == ((), 0)
+
+    data = [0, 2, 2, 3, 5, 7, 8, 9, 10]
+    with qtbot.waitSignal(sld.selectionCountsChanged) as blocker:
+        sld.setSelectionData(data)
+    # [2, 5) and [5, 8]: values at a handle are counted once
+    assert blocker.args == [(3, 3), 6]
+    assert sld.selectionCounts() == ((3, 3), 6)
+
+    with qtbot.waitSignal(sld.selectionCountsChanged) as blocker:
+        sld.setSliderPosition(0, index=0)
+    assert blocker.args == [(4, 3), 7]
+    with qtbot.assertNotEmitted(sld.selectionCountsChanged):
+        sld.setValue((0, 5, 8))  # same positions: not recounted
+
+    # several datasets, sorted once
+    sld.setSelectionData([[9, 1, 5], [6]], assume_sorted=False)
+    assert sld.selectionCounts() == ((1, 2), 3)
+    sld.setValue((1, 5, 8))
+
+    np = pytest.importorskip("numpy")
+    sld.setSelectionData(np.arange(11.0))
+    assert sld.selectionCounts() == ((4, 4), 8)
+    sld.setSelectionBadgeVisible()
+    sld.show()
+    sld.repaint()
+    sld.setSelectionData(None)
+    assert sld.selectionCounts() == ((), 0)
+
+
+def test_auto_range(qtbot):
+    sld = QDoubleRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    data = [float(i) for i in range(1, 102)] + [float("nan")]
+    events = []
+    sld.rangeChanged.connect(lambda *a: events.append("range"))
+    sld.valueChanged.connect(lambda v: events.append(v))
+    with qtbot.waitSignal(sld.valueChanged):
+        sld.autoRange(data)
+    assert sld.minimum() == 1 and sld.maximum() == 101
+    assert sld.value() == (2, 100)
+    assert events == ["range", (2, 100)]  # value set once, in the new range
+
+    # stale requests are dropped
+    sld.autoRange([0, 1000], percentiles=[])
+    sld.autoRange([5, 6, 7], percentiles=[])
+    qtbot.waitUntil(lambda: sld._autorange_jobs.pending() == 0)
+    assert (sld.minimum(), sld.maximum()) == (5, 7)
+    assert sld.value() == (5, 7)
+
+    # bad data is warned about (on the GUI thread) instead of aborting
+    with pytest.warns(RuntimeWarning, match="autoRange"):
+        sld.autoRange([1, 2, "x"])
+        qtbot.waitUntil(lambda: sld._autorange_jobs.pending() == 0)
+    assert (sld.minimum(), sld.maximum()) == (5, 7)
+
+    np = pytest.importorskip("numpy")
+    arr = np.arange(1_000_000, dtype=float).reshape(1000, 1000)
+    with qtbot.waitSignal(sld.rangeChanged):
+        sld.autoRange(arr, [10, 90], max_samples=1000, refine=True)
+    assert (sld.minimum(), sld.maximum()) == (0, 999_999)
+    assert sld.value() == pytest.approx((100_000, 900_000), rel=0.01)
+    # non-contiguous arrays (e.g. memmap slices) are sampled along each axis
+    sld.setRange(0, 1)
+    with qtbot.waitSignal(sld.rangeChanged):
+        sld.autoRange(arr.T[:, ::-1], [10, 90], max_samples=1000, refine=True)
+    assert (sld.minimum(), sld.maximum()) == (0, 999_999)
+    assert sld.value() == pytest.approx((100_000, 900_000), rel=0.02)
+
+
+def test_segment_colors(gslider: QRangeSlider, qtbot):
+    gslider.setValue([10, 20, 30, 40, 50, 60])
+    assert gslider.segmentColors() is None
+    with pytest.raises(ValueError):
+        gslider.setSegmentColors(["not a color"])
+    gslider.setSegmentColors(["red", None])
+    assert [c and c.name() for c in gslider.segmentColors()] == ["#ff0000", None]
+
+    gslider.show()
+    opt = QStyleOptionSlider()
+    gslider.initStyleOption(opt)
+
+    def segment_groups():
+        return gslider._segmentGroups(opt, gslider._segment_colors)
+
+    groups = segment_groups()
+    # every other segment of 5, in a single group for one drawRects call
+    assert len(groups) == 1
+    color, rects = groups[0]
+    assert color.name() == "#ff0000" and len(rects) == 3
+    assert segment_groups() is groups  # cached
+    gslider.repaint()
+
+    gslider.setSliderPosition(15, index=0)
+    assert segment_groups() is not groups
+
+    np = pytest.importorskip("numpy")
+    gslider.setSegmentColors(np.array([[0, 0, 1.0], [1.0, 0, 0]]))
+    assert [len(r) for _, r in segment_groups()] == [3, 2]
+    gslider.repaint()
+    gslider.setSegmentColors(None)
+    gslider.repaint()
@@ -0,0 +1,132 @@
+import math
+
+import pytest
+
+from qtrangeslider import (
+    FunctionScale,
+    KLLSketch,
+    LogScale,
+    PiecewiseLinearScale,
+    PowerScale,
+    QDoubleRangeSlider,
+    QDoubleSlider,
+    QuantileScale,
+    SymLogScale,
+)
+from qtrangeslider._generic_slider import CC_SLIDER, SC_GROOVE
+from qtrangeslider.qtcompat.QtCore import Qt
+from qtrangeslider.qtcompat.QtWidgets import QSlider, QStyleOptionSlider
+
+SCALES = [
+    LogScale(),
+    SymLogScale(linthresh=0.1),
+    PowerScale(0.5),
+    PiecewiseLinearScale([1, 10, 1000], [0, 1, 2]),
+    FunctionScale(math.sqrt, lambda x: x ** 2),
+    QuantileScale([x ** 2 for x in range(1, 33)]),
+]
+
+
+@pytest.mark.parametrize("scale", SCALES, ids=lambda s: type(s).__name__)
+def test_round_trip(scale):
+    values = [1, 2.5, 10, 300, 1000]
+    back = scale.inverse_many(scale.forward_many(values))
+    assert back == pytest.approx(values)
+    fwd = scale.forward_many(values)
+    assert fwd == sorted(fwd)
+
+
+def test_ticks():
+    assert LogScale().ticks(0.5, 2000) == [1, 10, 100, 1000]
+    assert SymLogScale().ticks(-10, 100) == [-10, -1, 0, 1, 10, 100]
+    assert PowerScale().ticks(0, 10, 5) == [0, 5, 10]
+
+
+def test_log_slider(qtbot):
+    sld = QDoubleSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    with pytest.raises(ValueError):
+        sld.setScale(LogScale())
+    sld.setRange(1, 1e6)
+    sld.setScale(LogScale())
+    with pytest.raises(ValueError):
+        sld.setMinimum(0)
+
+    # each decade gets the same length
+    sld.setValue(1000)
+    assert sld._valueToFraction(1000) == pytest.approx(0.5)
+    opt = sld._styleOption
+    assert opt.sliderPosition == pytest.approx(opt.maximum / 2, abs=1)
+    span = 600
+    assert sld._scaledValueFromPosition(span // 2, span, False) == pytest.approx(1000)
+    lut = sld._scale_lut
+    sld._scaledValueFromPosition(10, span, False)
+    assert sld._scale_lut is lut  # cached per geometry
+
+    # the wheel moves by the same distance on screen
+    sld.setValue(10)
+    sld._execute_scroll((1e6 - 1) / 6, Qt.NoModifier)  # one decade
+    assert sld.value() == pytest.approx(100, rel=1e-3)
+
+    sld.setTickPosition(QSlider.TicksBelow)
+    sld.show()
+    sld.grab()
+
+
+def test_log_range_slider(qtbot):
+    sld = QDoubleRangeSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.setRange(1, 1e4)
+    sld.setScale(LogScale())
+    sld.setValue((10, 100))
+    # shifting the bar keeps the ratio of the handles
+    sld._offsetAllPositions((1e4 - 1) * 0.25)
+    lo, hi = sld.value()
+    assert hi / lo == pytest.approx(10, rel=1e-3)
+    assert lo == pytest.approx(100, rel=1e-3)
+    sld._offsetAllPositions(1e6)
+    assert sld.value()[1] == pytest.approx(1e4)
+
+    sld.setScale(None)
+    assert sld.scale().linear
+
+
+def test_kll_sketch():
+    data = [(i * 7919) % 10007 for i in range(20000)]  # shuffled 0..10006
+    a, b = KLLSketch(k=100, seed=0), KLLSketch(k=100, seed=1)
+    for v in data[:5000]:
+        a.update(v)
+    b.update_many(data[5000:] + [float("nan")])
+    assert len(b) < 2000  # bounded memory
+    a.merge(b)
+    assert a.count == 20000
+    assert (a.min, a.max) == (0, 10006)
+    assert a.quantiles([0, 1]) == [0, 10006]
+    for q in (0.1, 0.5, 0.9):
+        assert a.rank(a.quantile(q)) == pytest.approx(q, abs=0.05)
+    with pytest.raises(ValueError):
+        KLLSketch().quantile(0.5)
+
+
+def test_quantile_slider(qtbot):
+    # heavily skewed: most of the data is near zero
+    data = [x ** 4 for x in range(1000)]
+    scale = QuantileScale(data)
+    assert scale.forward(data[500]) == pytest.approx(0.5, abs=0.05)
+    assert len(scale.ticks(0, data[-1])) == 9
+    with pytest.raises(ValueError):
+        QuantileScale([1, 1, 1])
+
+    sld = QDoubleSlider(Qt.Horizontal)
+    qtbot.addWidget(sld)
+    sld.setRange(0, data[-1])
+    sld.setScale(scale)
+    # the middle of the slider is the median, not the middle of the range
+    sld.setValue(data[500])
+    assert sld._valueToFraction(sld.value()) == pytest.approx(0.5, abs=0.05)
+    opt = QStyleOptionSlider()
+    sld.initStyleOption(opt)
+    mid = sld._pixelPosToRangeValue(
+        sld._pick(sld.style().subControlRect(CC_SLIDER, opt, SC_GROOVE, sld).center())
+    )
+    assert mid < data[-1] / 10
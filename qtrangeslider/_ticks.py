@@ -0,0 +1,131 @@
+"""Tick marks drawn along a slider, decimated to fit, at two levels."""
+import math
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Sequence
+
+from ._layers import PixmapLayer
+from .qtcompat.QtCore import QLineF, Qt
+from .qtcompat.QtGui import QColor, QPen
+
+
+def nice(n: float) -> int:
+    """Smallest of 1, 2, 5, 10, 20, 50... that is >= n."""
+    k = 1
+    while True:
+        for m in (1, 2, 5):
+            if k * m >= n:
+                return k * m
+        k *= 10
+
+
+def thin(positions: Sequence[float], spacing: float, avoid=()) -> List[float]:
+    """Sorted `positions` at least `spacing` apart (and from any of `avoid`)."""
+    spacing -= 1e-6  # rounding errors mustn't drop evenly spaced ticks
+    out: List[float] = []
+    last = -math.inf
+    for p in positions:
+        if p - last < spacing:
+            continue
+        if avoid:
+            i = bisect_left(avoid, p)
+            if (i < len(avoid) and avoid[i] - p < spacing) or (
+                i > 0 and p - avoid[i - 1] < spacing
+            ):
+                continue
+        out.append(p)
+        last = p
+    return out
+
+
+class Ticks(PixmapLayer):
+    """Major and minor tick marks, spaced at least a few pixels apart.
+
+    Ticks are multiples of an interval (from the minimum) or, for non-linear
+    scales, those of the scale.  With a fine interval, a multiple of it (by
+    1, 2, 5, 10...) is used instead, so that no more ticks than fit are ever
+    generated.  Ticks may also be given explicitly, at any positions: those
+    in view are then thinned out to the minimum spacing.  Minor ticks are
+    shorter, and dropped where they'd crowd a major tick.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # explicit tick values (sorted), or None to use the interval
+        self.major: Optional[List[float]] = None
+        self.minor: Optional[List[float]] = None
+
+    def setValues(
+        self, major: Optional[Sequence[float]], minor: Optional[Sequence[float]]
+    ) -> None:
+        self.major = sorted(major) if major is not None else None
+        self.minor = sorted(minor) if minor is not None else None
+        self.invalidate()
+
+    def _draw(self, painter, length, depth, dpr, slider, opt, *extra):
+        # extents: (outer, inner) ends of the ticks on each side of the groove
+        extents, intervals, spacing, rgba = extra
+        major = self._positions(slider, self.major, intervals[0], length, spacing)
+        minor = self._positions(slider, self.minor, intervals[1], length, spacing)
+        minor = thin(minor, spacing, avoid=major)
+
+        horizontal = opt.orientation == Qt.Horizontal
+        n_px = max(int(math.ceil(length * dpr)), 1)
+        painter.setPen(QPen(QColor.fromRgba(rgba), 0))
+        for positions, short in ((major, False), (minor, True)):
+            lines = []
+            for px in positions:
+                if opt.upsideDown:
+                    px = length - px
+                # at the center of a device pixel, for crisp lines
+                p = (min(math.floor(px * dpr), n_px - 1) + 0.5) / dpr
+                for outer, inner in extents:
+                    # minor ticks are the half nearest to the groove
+                    a, b = ((outer + inner) / 2 if short else outer), inner
+                    if horizontal:
+                        lines.append(QLineF(p, a, p, b))
+                    else:
+                        lines.append(QLineF(a, p, b, p))
+            if lines:
+                painter.drawLines(lines)
+
+    def _positions(self, slider, values, interval, length, spacing) -> List[float]:
+        """Positions (from the start of travel) of the ticks of one level.
+
+        Without explicit `values`, ticks are derived from `interval` (None for
+        no ticks; non-linear scales have ticks of their own even without one).
+        """
+        lo, hi = slider._viewRange()
+        if hi <= lo or length <= 0:
+            return []
+        if values is not None:
+            return self._skipping(slider, values, lo, hi, length, spacing)
+        if interval is None:
+            return []
+        elif slider._scale.linear:
+            if interval <= 0:
+                return []
+            # never more ticks than fit: a multiple of the interval if needed
+            step_px = interval / (hi - lo) * length
+            step = interval * nice(spacing / step_px)
+            origin = slider.minimum()
+            first = math.ceil((lo - origin) / step - 1e-9)
+            last = math.floor((hi - origin) / step + 1e-9)
+            values = [origin + k * step for k in range(first, last + 1)]
+        else:
+            values = slider._scale.ticks(lo, hi, interval)
+        frac = slider._valueToFraction
+        return thin([frac(v) * length for v in values], spacing)
+
+    def _skipping(self, slider, values, lo, hi, length, spacing) -> List[float]:
+        # jump (by bisection) to the first value far enough from the last
+        # tick: only the ticks drawn are visited, however many values there are
+        frac, inverse = slider._valueToFraction, slider._fractionToValue
+        out: List[float] = []
+        i, end = bisect_left(values, lo), bisect_right(values, hi)
+        while i < end:
+            p = frac(values[i]) * length
+            out.append(p)
+            if p + spacing > length:
+                break
+            i = max(i + 1, bisect_left(values, inverse((p + spacing) / length), i, end))
+        return out
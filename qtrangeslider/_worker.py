@@ -0,0 +1,125 @@
+"""Run functions on the global QThreadPool, delivering results to the GUI thread."""
+import warnings
+from typing import Any, Callable, Optional
+
+from .qtcompat.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class _Cancelled(Exception):
+    """Raised by a job's `check()` once the job has been superseded."""
+
+
+class _Emitter(QObject):
+    # (job token, result).  Emitted from a worker thread, so connected slots
+    # on the GUI thread are called through a queued connection.
+    finished = Signal(object, object)
+    # (job token, exception), for jobs that raised
+    failed = Signal(object, object)
+
+
+class _Job(QRunnable):
+    def __init__(self, fn: Callable, check: Callable, emitter: _Emitter, token):
+        super().__init__()
+        self._fn = fn
+        self._check = check
+        self._emitter = emitter
+        self._token = token
+
+    def run(self) -> None:
+        try:
+            result = self._fn(self._check)
+        except _Cancelled:
+            pass
+        except Exception as e:
+            # an exception escaping run() aborts the process (qFatal in PyQt)
+            self._emit(self._emitter.failed, e)
+        else:
+            self._emit(self._emitter.finished, result)
+        finally:
+            # python keeps jobs alive until they have run (see submit)
+            _RUNNING.discard(self)
+
+    def _emit(self, signal, arg) -> None:
+        try:
+            signal.emit(self._token, arg)
+        except RuntimeError:
+            pass  # the widget was deleted while we were working
+
+
+# Some bindings don't keep a python QRunnable alive while the pool runs it.
+_RUNNING: set = set()
+
+
+class BackgroundJobs:
+    """Jobs of one kind for one widget, where only the latest job matters.
+
+    `submit` starts `fn(check)` in the thread pool and calls
+    `callback(result)` on the GUI thread when it finishes, unless a newer job
+    was submitted (or `cancel` was called) in the meantime.  Long running
+    functions should call `check()` periodically: it raises (ending the job
+    quietly) once the job has been superseded.  Exceptions raised by `fn` are
+    passed to `errback` on the GUI thread, or turned into warnings.
+    """
+
+    def __init__(self, parent: QObject) -> None:
+        self._emitter = _Emitter(parent)
+        self._emitter.finished.connect(self._on_finished)
+        self._emitter.failed.connect(self._on_failed)
+        self._callbacks: dict = {}
+        self._errbacks: dict = {}
+        self._generation = 0
+
+    def submit(
+        self,
+        fn: Callable[[Callable], Any],
+        callback: Callable,
+        new=True,
+        errback: Optional[Callable[[Exception], Any]] = None,
+    ):
+        """Run `fn` in the background and pass its result to `callback`.
+
+        If `new` is True (the default), pending jobs are superseded.  Otherwise
+        the job joins the current generation, and all of their results are
+        delivered.  Returns the generation of the job.
+        """
+        if new:
+            self.cancel()
+        generation = self._generation
+        token = (generation, object())
+        self._callbacks[token] = callback
+        if errback is not None:
+            self._errbacks[token] = errback
+
+        def check():
+            if generation != self._generation:
+                raise _Cancelled
+
+        job = _Job(fn, check, self._emitter, token)
+        _RUNNING.add(job)
+        QThreadPool.globalInstance().start(job)
+        return generation
+
+    def cancel(self) -> None:
+        """Supersede all pending jobs: their results will be dropped."""
+        self._generation += 1
+        self._callbacks.clear()
+        self._errbacks.clear()
+
+    def pending(self) -> int:
+        """Number of jobs whose results are still expected."""
+        return len(self._callbacks)
+
+    def _on_finished(self, token, result) -> None:
+        self._errbacks.pop(token, None)
+        callback = self._callbacks.pop(token, None)
+        if callback is not None:
+            callback(result)
+
+    def _on_failed(self, token, error: Exception) -> None:
+        errback = self._errbacks.pop(token, None)
+        if self._callbacks.pop(token, None) is None:
+            return  # superseded: nobody is waiting for it
+        if errback is not None:
+            errback(error)
+        else:
+            warnings.warn(f"background job failed: {error!r}", RuntimeWarning)